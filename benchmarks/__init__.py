@@ -0,0 +1 @@
+"""Benchmarks for hahomematic, based on synthetic installations without network access."""
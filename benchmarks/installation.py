@@ -0,0 +1,195 @@
+"""Synthetic installations, that are built from the recorded device descriptions of pydevccu."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import importlib.resources
+import os
+from typing import Any, Final
+from unittest.mock import patch
+
+import orjson
+
+from hahomematic.central import CENTRAL_INSTANCES, CentralConfig, CentralUnit
+from hahomematic.client import InterfaceConfig, _ClientConfig
+from hahomematic.const import ADDRESS_SEPARATOR, LOCAL_HOST, DeviceDescription, Interface, ParameterData, ParamsetKey
+from hahomematic_support.client_local import ClientLocal, LocalRessources
+
+# Mix of common device types. The devices of an installation are assigned round robin.
+DEVICE_MIX: Final[tuple[str, ...]] = (
+    "HmIP-BSM.json",
+    "HmIP-eTRV-2.json",
+    "HMIP-SWDO.json",
+    "HmIP-STHD.json",
+    "HmIP-BROLL.json",
+    "HMIP-PSM.json",
+    "HmIP-SMI.json",
+    "HmIP-WRC6.json",
+    "HmIP-BDT.json",
+    "HmIP-SWSD.json",
+    "HM-LC-Sw1-Pl-2.json",
+    "HM-LC-Dim1T-Pl-3.json",
+    "HM-LC-Bl1-FM.json",
+    "HM-CC-RT-DN.json",
+    "HM-Sec-SC-2.json",
+    "HM-ES-PMSw1-Pl.json",
+    "HM-PB-6-WM55.json",
+    "HM-Sen-MDIR-WM55.json",
+    "HM-WDS10-TH-O.json",
+    "HM-LC-Sw4-DR.json",
+)
+_ANCHOR: Final = "pydevccu"
+_DEVICE_DESCRIPTION_DIR: Final = "device_descriptions"
+_PARAMSET_DESCRIPTION_DIR: Final = "paramset_descriptions"
+CENTRAL_NAME: Final = "benchmark"
+
+
+class SyntheticInstallation:
+    """Installation with a given number of devices, that are cloned from recorded device descriptions."""
+
+    def __init__(self, size: int, device_mix: tuple[str, ...] = DEVICE_MIX) -> None:
+        """Init the synthetic installation."""
+        self.size: Final = size
+        # {device_address, serialized device descriptions}
+        self._device_descriptions: Final[dict[str, bytes]] = {}
+        # {device_address, serialized paramset descriptions}
+        self._paramset_descriptions: Final[dict[str, bytes]] = {}
+        package_path = str(importlib.resources.files(_ANCHOR))
+        sources = {
+            filename: (
+                _load_json(os.path.join(package_path, _DEVICE_DESCRIPTION_DIR, filename)),
+                _load_json(os.path.join(package_path, _PARAMSET_DESCRIPTION_DIR, filename)),
+            )
+            for filename in device_mix
+        }
+        for index in range(size):
+            device_descriptions, paramset_descriptions = sources[device_mix[index % len(device_mix)]]
+            source_address = device_descriptions[0]["ADDRESS"]
+            address = f"BMK{index:07d}"
+            self._device_descriptions[address] = orjson.dumps(
+                [_clone_device_description(dd, source_address, address) for dd in device_descriptions]
+            )
+            self._paramset_descriptions[address] = orjson.dumps(
+                {
+                    _replace_address(channel_address, source_address, address): paramsets
+                    for channel_address, paramsets in paramset_descriptions.items()
+                }
+            )
+
+    @property
+    def device_addresses(self) -> tuple[str, ...]:
+        """Return the addresses of the devices."""
+        return tuple(self._device_descriptions)
+
+    def get_device_descriptions(self) -> list[DeviceDescription]:
+        """Return freshly parsed device descriptions, like they are received from a backend."""
+        device_descriptions: list[DeviceDescription] = []
+        for data in self._device_descriptions.values():
+            device_descriptions.extend(orjson.loads(data))
+        return device_descriptions
+
+    def get_paramset_descriptions(self, device_address: str) -> dict[str, dict[ParamsetKey, dict[str, ParameterData]]]:
+        """Return freshly parsed paramset descriptions of a device."""
+        if (data := self._paramset_descriptions.get(device_address)) is None:
+            return {}
+        return orjson.loads(data)  # type: ignore[no-any-return]
+
+
+class SyntheticClient(ClientLocal):
+    """Local client, that serves the descriptions of a synthetic installation."""
+
+    def __init__(self, client_config: _ClientConfig, installation: SyntheticInstallation) -> None:
+        """Init the synthetic client."""
+        super().__init__(
+            client_config=client_config,
+            local_resources=LocalRessources(address_device_translation={}, ignore_devices_on_create=[]),
+        )
+        self._installation: Final = installation
+
+    async def list_devices(self) -> tuple[DeviceDescription, ...] | None:
+        """Return the device descriptions of the installation."""
+        return tuple(self._installation.get_device_descriptions())
+
+    async def _get_paramset_description(
+        self, address: str, paramset_key: ParamsetKey
+    ) -> dict[str, ParameterData] | None:
+        """Return a paramset description of the installation."""
+        device_address = address.split(ADDRESS_SEPARATOR)[0]
+        if address not in self._paramset_descriptions_cache:
+            self._paramset_descriptions_cache.update(
+                self._installation.get_paramset_descriptions(device_address=device_address)
+            )
+        return self._paramset_descriptions_cache[address].get(paramset_key)
+
+
+@asynccontextmanager
+async def started_central(
+    installation: SyntheticInstallation, storage_folder: str, name: str = CENTRAL_NAME
+) -> AsyncIterator[CentralUnit]:
+    """
+    Start a central with a synthetic client, like a central is started with a backend.
+
+    Caches in the storage folder are loaded, devices are created from them,
+    and the device descriptions of the installation are added afterwards.
+    """
+    interface_config = InterfaceConfig(central_name=name, interface=Interface.BIDCOS_RF, port=2002)
+    central = CentralConfig(
+        name=name,
+        host=LOCAL_HOST,
+        username="benchmark",
+        password="benchmark",
+        central_id=name,
+        storage_folder=storage_folder,
+        interface_configs={interface_config},
+        default_callback_port=54321,
+    ).create_central()
+    client = SyntheticClient(
+        client_config=_ClientConfig(central=central, interface_config=interface_config), installation=installation
+    )
+    await client.init_client()
+    try:
+        with (
+            patch("hahomematic.central.CentralUnit._get_primary_client", return_value=client),
+            patch("hahomematic.client._ClientConfig.create_client", return_value=client),
+        ):
+            await start_central(central=central, client=client)
+            yield central
+    finally:
+        await central.stop()
+        CENTRAL_INSTANCES.pop(name, None)
+
+
+async def start_central(central: CentralUnit, client: ClientLocal) -> None:
+    """Start the central with persistent caches, but without callback server and scheduler."""
+    # pylint: disable=protected-access
+    await central._create_clients()
+    await central._load_caches()
+    if new_device_addresses := central._check_for_new_device_addresses():
+        await central._create_devices(new_device_addresses=new_device_addresses)
+    await central._refresh_device_descriptions(client=client)
+    await central.looper.block_till_done()
+    # The central is stopped like a started central, including its clients.
+    central._started = True
+
+
+def _load_json(file_path: str) -> Any:
+    """Load a json file."""
+    with open(file_path, mode="rb") as file_pointer:
+        return orjson.loads(file_pointer.read())
+
+
+def _clone_device_description(device_description: dict[str, Any], source_address: str, address: str) -> dict[str, Any]:
+    """Return a device description with replaced addresses."""
+    clone = dict(device_description)
+    clone["ADDRESS"] = _replace_address(clone["ADDRESS"], source_address, address)
+    if parent := clone.get("PARENT"):
+        clone["PARENT"] = _replace_address(parent, source_address, address)
+    if children := clone.get("CHILDREN"):
+        clone["CHILDREN"] = [_replace_address(child, source_address, address) for child in children]
+    return clone
+
+
+def _replace_address(value: str, source_address: str, address: str) -> str:
+    """Replace the device address at the start of an address."""
+    return f"{address}{value[len(source_address) :]}" if value.startswith(source_address) else value
@@ -0,0 +1,298 @@
+"""
+Generate load on the XML-RPC callback server, like a backend with many devices does.
+
+Events of a synthetic installation are sent over localhost as system.multicall batches,
+and the time until the central has processed each event is measured.
+
+Usage:
+    python -m benchmarks.load --devices 500 --rate 2000 --batch-size 20 --duration 30 --jitter 0.3
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+import logging
+import platform
+import random
+import sys
+import tempfile
+import threading
+from time import perf_counter, sleep
+from typing import Any, Final
+import xmlrpc.client
+
+import orjson
+
+from benchmarks.installation import DEVICE_MIX, SyntheticInstallation, started_central
+from benchmarks.run import get_events, get_percentiles
+from hahomematic.central import CentralUnit
+from hahomematic.central.xml_rpc_server import create_xml_rpc_server
+from hahomematic.const import LOCAL_HOST, PORT_ANY, VERSION
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+DEFAULT_DEVICES: Final = 500
+# Sent events per second over all senders.
+DEFAULT_RATE: Final = 1000.0
+DEFAULT_BATCH_SIZE: Final = 10
+DEFAULT_DURATION: Final = 10.0
+# Time to wait for the processing of outstanding events after the last batch was sent.
+DEFAULT_DRAIN_TIMEOUT: Final = 10.0
+
+
+@dataclass(frozen=True)
+class LoadProfile:
+    """Profile of the generated load."""
+
+    rate: float = DEFAULT_RATE
+    duration: float = DEFAULT_DURATION
+    batch_size: int = DEFAULT_BATCH_SIZE
+    # Relative random variation of the interval between two batches (0 = constant rate).
+    jitter: float = 0.0
+    # Number of concurrent connections, that send batches.
+    senders: int = 1
+    drain_timeout: float = DEFAULT_DRAIN_TIMEOUT
+    seed: int | None = None
+
+
+@dataclass
+class LoadResult:
+    """Result of a load run."""
+
+    devices: int
+    sent: int
+    processed: int
+    # Events, that were not processed within the drain timeout, including events of failed requests.
+    dropped: int
+    failed_requests: int
+    duration: float
+    sent_per_second: float
+    processed_per_second: float
+    # Seconds from sending the batch of an event until the event is processed by the central.
+    latency: dict[str, float] = field(default_factory=dict)
+
+
+class _EventTracker:
+    """Track the send times of events and their processing by the central."""
+
+    def __init__(self, events: Sequence[tuple[str, str, str, Any]]) -> None:
+        """Init the event tracker."""
+        # {(channel_address, parameter), send times of the outstanding events}
+        # All keys are created upfront, so the dict is not changed by the sender threads.
+        self._pending: Final[dict[tuple[str, str], deque[float]]] = {
+            (channel_address, parameter): deque() for _, channel_address, parameter, _ in events
+        }
+        self._lock: Final = threading.Lock()
+        self.latencies: Final[list[float]] = []
+        self.sent = 0
+        self.failed_requests = 0
+
+    @property
+    def processed(self) -> int:
+        """Return the number of processed events."""
+        return len(self.latencies)
+
+    def add_sent(self, events: Sequence[tuple[str, str, str, Any]], sent_at: float) -> None:
+        """Add the send time of a batch of events."""
+        for _, channel_address, parameter, _ in events:
+            self._pending[(channel_address, parameter)].append(sent_at)
+        with self._lock:
+            self.sent += len(events)
+
+    def add_failed_request(self) -> None:
+        """Count a failed request."""
+        with self._lock:
+            self.failed_requests += 1
+
+    def backend_parameter_callback(self, interface_id: str, channel_address: str, parameter: str, value: Any) -> None:
+        """Record the latency of a processed event."""
+        if (pending := self._pending.get((channel_address, parameter))) and pending:
+            self.latencies.append(perf_counter() - pending.popleft())
+
+
+async def run_load(installation: SyntheticInstallation, storage_folder: str, profile: LoadProfile) -> LoadResult:
+    """Send the events of the profile to the callback server of a central and measure the processing."""
+    async with started_central(installation=installation, storage_folder=storage_folder) as central:
+        if not (events := get_events(central=central)):
+            return LoadResult(
+                devices=len(central.devices),
+                sent=0,
+                processed=0,
+                dropped=0,
+                failed_requests=0,
+                duration=0.0,
+                sent_per_second=0.0,
+                processed_per_second=0.0,
+            )
+        tracker = _EventTracker(events=events)
+        unregister = central.register_backend_parameter_callback(cb=tracker.backend_parameter_callback)
+        xml_rpc_server = create_xml_rpc_server(ip_addr=LOCAL_HOST, port=PORT_ANY)
+        xml_rpc_server.add_central(central)
+        try:
+            partitions = _partition_events(events=events, senders=profile.senders)
+            start = perf_counter()
+            await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        _send_events,
+                        url=f"http://{LOCAL_HOST}:{xml_rpc_server.listen_port}",
+                        events=partition,
+                        senders=len(partitions),
+                        profile=profile,
+                        tracker=tracker,
+                        rnd=random.Random(None if profile.seed is None else profile.seed + index),
+                    )
+                    for index, partition in enumerate(partitions)
+                )
+            )
+            await _drain(central=central, tracker=tracker, drain_timeout=profile.drain_timeout)
+            duration = perf_counter() - start
+        finally:
+            xml_rpc_server.remove_central(central)
+            if xml_rpc_server.no_central_assigned:
+                xml_rpc_server.stop()
+            if unregister:
+                unregister()
+
+        return LoadResult(
+            devices=len(central.devices),
+            sent=tracker.sent,
+            processed=tracker.processed,
+            dropped=tracker.sent - tracker.processed,
+            failed_requests=tracker.failed_requests,
+            duration=duration,
+            sent_per_second=tracker.sent / duration,
+            processed_per_second=tracker.processed / duration,
+            latency=get_percentiles(values=tracker.latencies),
+        )
+
+
+def _partition_events(
+    events: Sequence[tuple[str, str, str, Any]], senders: int
+) -> list[list[tuple[str, str, str, Any]]]:
+    """
+    Partition the events by channel address and parameter.
+
+    All events of a parameter are sent by a single sender, so they are processed in order.
+    Senders without events are omitted.
+    """
+    partitions: list[list[tuple[str, str, str, Any]]] = [[] for _ in range(senders)]
+    # {(channel_address, parameter), partition index}
+    assignments: dict[tuple[str, str], int] = {}
+    for event in events:
+        key = (event[1], event[2])
+        if (index := assignments.get(key)) is None:
+            index = assignments[key] = len(assignments) % senders
+        partitions[index].append(event)
+    return [partition for partition in partitions if partition]
+
+
+def _send_events(
+    url: str,
+    events: Sequence[tuple[str, str, str, Any]],
+    senders: int,
+    profile: LoadProfile,
+    tracker: _EventTracker,
+    rnd: random.Random,
+) -> None:
+    """Send the events as multicall batches with the rate of the profile. Runs in a thread."""
+    proxy = xmlrpc.client.ServerProxy(url, allow_none=True)
+    interval = profile.batch_size * senders / profile.rate
+    start = next_send = perf_counter()
+    position = 0
+    while (now := perf_counter()) - start < profile.duration:
+        if (delay := next_send - now) > 0:
+            sleep(delay)
+        batch = [events[(position + offset) % len(events)] for offset in range(profile.batch_size)]
+        position += profile.batch_size
+        multicall = xmlrpc.client.MultiCall(proxy)
+        for interface_id, channel_address, parameter, value in batch:
+            multicall.event(interface_id, channel_address, parameter, value)
+        tracker.add_sent(events=batch, sent_at=perf_counter())
+        try:
+            multicall()
+        except (OSError, xmlrpc.client.Error) as err:
+            tracker.add_failed_request()
+            _LOGGER.debug("SEND_EVENTS: Sending of a batch failed: %s", err)
+        next_send += interval * rnd.uniform(1 - profile.jitter, 1 + profile.jitter)
+    proxy("close")()
+
+
+async def _drain(central: CentralUnit, tracker: _EventTracker, drain_timeout: float) -> None:
+    """Wait until all sent events are processed, or the drain timeout is reached."""
+    deadline = perf_counter() + drain_timeout
+    # The events are processed by the central, there is nothing to wait for but the count.
+    while tracker.processed < tracker.sent and perf_counter() < deadline:  # noqa: ASYNC110
+        await asyncio.sleep(0.05)
+    await central.looper.block_till_done()
+
+
+async def _run(devices: int, device_mix: tuple[str, ...], profile: LoadProfile) -> dict[str, Any]:
+    """Run the load on a synthetic installation."""
+    installation = SyntheticInstallation(size=devices, device_mix=device_mix)
+    with tempfile.TemporaryDirectory(prefix="hahomematic-load-") as storage_folder:
+        result = await run_load(installation=installation, storage_folder=storage_folder, profile=profile)
+    return {
+        "meta": {
+            "hahomematic": VERSION,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created_at": datetime.now().isoformat(),
+        },
+        "profile": {**asdict(profile), "device_mix": list(device_mix)},
+        "result": asdict(result),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the load generator from the command line."""
+    parser = argparse.ArgumentParser(description="Generate load on the XML-RPC callback server of hahomematic.")
+    parser.add_argument("--devices", type=int, default=DEFAULT_DEVICES, help="number of devices")
+    parser.add_argument(
+        "--device-mix",
+        nargs="+",
+        default=list(DEVICE_MIX),
+        help="recorded device description files of pydevccu, that are assigned round robin",
+    )
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE, help="events per second")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="events per multicall")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION, help="seconds to send events")
+    parser.add_argument("--jitter", type=float, default=0.0, help="relative variation of the send interval (0-1)")
+    parser.add_argument("--senders", type=int, default=1, help="number of concurrent connections")
+    parser.add_argument(
+        "--drain-timeout", type=float, default=DEFAULT_DRAIN_TIMEOUT, help="seconds to wait for outstanding events"
+    )
+    parser.add_argument("--seed", type=int, help="seed of the jitter")
+    parser.add_argument("--output", help="file to write the json result to, default is stdout")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    # The load creates many devices and events. Keep the log of hahomematic quiet.
+    logging.getLogger("hahomematic").setLevel(logging.WARNING)
+
+    profile = LoadProfile(
+        rate=args.rate,
+        duration=args.duration,
+        batch_size=args.batch_size,
+        jitter=min(max(args.jitter, 0.0), 1.0),
+        senders=max(args.senders, 1),
+        drain_timeout=args.drain_timeout,
+        seed=args.seed,
+    )
+    report = asyncio.run(_run(devices=args.devices, device_mix=tuple(args.device_mix), profile=profile))
+    data = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+    if args.output:
+        with open(args.output, mode="wb") as file_pointer:
+            file_pointer.write(data)
+    else:
+        sys.stdout.write(data.decode())
+        sys.stdout.write("\n")
+    return 0 if report["result"]["dropped"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
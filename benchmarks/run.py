@@ -0,0 +1,313 @@
+"""
+Run the benchmarks on synthetic installations and write the results as json.
+
+Usage:
+    python -m benchmarks.run --sizes 50 500 2000 --output results.json
+    python -m benchmarks.run --sizes 50 --baseline results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+import gc
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+from time import perf_counter
+import tracemalloc
+from typing import Any, Final
+
+import orjson
+
+from benchmarks.installation import SyntheticInstallation, started_central
+from hahomematic.central import CentralUnit
+from hahomematic.const import VERSION, Parameter, ParameterType, ParamsetKey
+from hahomematic.model.generic import GenericDataPoint
+from hahomematic_support.client_local import ClientLocal
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+DEFAULT_SIZES: Final = (50, 500, 2000)
+DEFAULT_EVENT_COUNT: Final = 20000
+DEFAULT_ROUND_TRIP_COUNT: Final = 2000
+# A benchmark is reported as regression, if it is slower than the baseline by this factor.
+DEFAULT_REGRESSION_THRESHOLD: Final = 1.2
+
+
+@dataclass
+class BenchmarkResult:
+    """Result of a benchmark on an installation."""
+
+    benchmark: str
+    size: int
+    value: float
+    unit: str
+    # True, if lower values are better.
+    lower_is_better: bool = True
+    details: dict[str, Any] = field(default_factory=dict)
+
+
+async def run_benchmarks(
+    size: int, workdir: str, event_count: int = DEFAULT_EVENT_COUNT, round_trip_count: int = DEFAULT_ROUND_TRIP_COUNT
+) -> list[BenchmarkResult]:
+    """Run all benchmarks on an installation of the given size."""
+    installation = SyntheticInstallation(size=size)
+    storage_folder = os.path.join(workdir, f"storage-{size}")
+    results: list[BenchmarkResult] = []
+
+    start = perf_counter()
+    async with started_central(installation=installation, storage_folder=storage_folder) as central:
+        results.append(
+            BenchmarkResult(
+                benchmark="startup_cold",
+                size=size,
+                value=perf_counter() - start,
+                unit="s",
+                details={"devices": len(central.devices), "data_points": _count_data_points(central=central)},
+            )
+        )
+        results.append(await _measure_cache_save(central=central, size=size))
+        results.append(await _measure_events(central=central, size=size, event_count=event_count))
+        results.append(await _measure_set_value_round_trips(central=central, size=size, count=round_trip_count))
+
+    start = perf_counter()
+    async with started_central(installation=installation, storage_folder=storage_folder) as central:
+        results.append(BenchmarkResult(benchmark="startup_warm", size=size, value=perf_counter() - start, unit="s"))
+        results.append(await _measure_cache_load(central=central, size=size))
+
+    results.append(
+        await _measure_memory_per_device(
+            installation=installation, storage_folder=os.path.join(workdir, f"storage-memory-{size}")
+        )
+    )
+    return results
+
+
+async def _measure_cache_save(central: CentralUnit, size: int) -> BenchmarkResult:
+    """Measure the time to save the device and paramset descriptions."""
+    start = perf_counter()
+    await central.save_caches(save_device_descriptions=True, save_paramset_descriptions=True)
+    return BenchmarkResult(benchmark="cache_save", size=size, value=perf_counter() - start, unit="s")
+
+
+async def _measure_cache_load(central: CentralUnit, size: int) -> BenchmarkResult:
+    """Measure the time to load the device and paramset descriptions."""
+    # Loading is skipped, if the content of the file equals the cache.
+    central.device_descriptions.last_hash_saved = ""
+    central.paramset_descriptions.last_hash_saved = ""
+    start = perf_counter()
+    await central.device_descriptions.load()
+    await central.paramset_descriptions.load()
+    return BenchmarkResult(benchmark="cache_load", size=size, value=perf_counter() - start, unit="s")
+
+
+async def _measure_events(central: CentralUnit, size: int, event_count: int) -> BenchmarkResult:
+    """Measure the throughput of events through data_point_event."""
+    if not (events := get_events(central=central)):
+        return BenchmarkResult(benchmark="events", size=size, value=0.0, unit="events/s", lower_is_better=False)
+
+    start = perf_counter()
+    for idx in range(event_count):
+        interface_id, channel_address, parameter, value = events[idx % len(events)]
+        await central.data_point_event(interface_id, channel_address, parameter, value)
+    duration = perf_counter() - start
+    return BenchmarkResult(
+        benchmark="events",
+        size=size,
+        value=event_count / duration,
+        unit="events/s",
+        lower_is_better=False,
+        details={"events": event_count, "distinct_events": len(events)},
+    )
+
+
+async def _measure_set_value_round_trips(central: CentralUnit, size: int, count: int) -> BenchmarkResult:
+    """Measure set_value round trips from the data point to the updated value."""
+    switches = [
+        data_point
+        for data_point in _get_generic_data_points(central=central)
+        if data_point.parameter == Parameter.STATE
+        and data_point.hmtype == ParameterType.BOOL
+        and data_point.is_writeable
+    ]
+    if not switches:
+        return BenchmarkResult(benchmark="set_value_round_trip", size=size, value=0.0, unit="s")
+
+    durations: list[float] = []
+    for idx in range(count):
+        data_point = switches[idx % len(switches)]
+        value = not data_point.value
+        start = perf_counter()
+        await data_point.send_value(value=value)
+        durations.append(perf_counter() - start)
+        if data_point.value is not value:
+            _LOGGER.warning("SET_VALUE_ROUND_TRIP: Value of %s was not updated", data_point.full_name)
+    return BenchmarkResult(
+        benchmark="set_value_round_trip",
+        size=size,
+        value=statistics.mean(durations),
+        unit="s",
+        details=get_percentiles(values=durations),
+    )
+
+
+async def _measure_memory_per_device(installation: SyntheticInstallation, storage_folder: str) -> BenchmarkResult:
+    """Measure the memory, that is allocated per device by a cold start."""
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        async with started_central(installation=installation, storage_folder=storage_folder) as central:
+            # The local client keeps the raw paramset descriptions, a real client does not.
+            if isinstance(client := central.primary_client, ClientLocal):
+                client._paramset_descriptions_cache.clear()  # pylint: disable=protected-access
+            gc.collect()
+            current, peak = tracemalloc.get_traced_memory()
+            devices = len(central.devices)
+    finally:
+        tracemalloc.stop()
+    return BenchmarkResult(
+        benchmark="memory_per_device",
+        size=installation.size,
+        value=(current - baseline) / max(devices, 1),
+        unit="bytes",
+        details={"total": current - baseline, "peak": peak - baseline},
+    )
+
+
+def _get_generic_data_points(central: CentralUnit) -> list[GenericDataPoint]:
+    """Return the generic data points of the VALUES paramset, that support events."""
+    return [
+        data_point
+        for device in central.devices
+        for data_point in device.generic_data_points
+        if data_point.paramset_key == ParamsetKey.VALUES and data_point.supports_events
+    ]
+
+
+def get_events(central: CentralUnit) -> list[tuple[str, str, str, Any]]:
+    """Return events (interface_id, channel_address, parameter, value), that change the data points of the central."""
+    return [
+        (data_point.device.interface_id, data_point.channel.address, data_point.parameter, value)
+        for data_point in _get_generic_data_points(central=central)
+        # A change of CONFIG_PENDING reloads the paramset descriptions of the device.
+        if data_point.parameter != Parameter.CONFIG_PENDING
+        for value in _get_event_values(data_point=data_point)
+    ]
+
+
+def _get_event_values(data_point: GenericDataPoint) -> tuple[Any, ...]:
+    """Return two raw values, that change the value of the data point."""
+    match data_point.hmtype:
+        case ParameterType.BOOL | ParameterType.ACTION:
+            return (True, False)
+        case ParameterType.FLOAT | ParameterType.INTEGER:
+            return (data_point.min, data_point.max)
+        case ParameterType.ENUM:
+            return (0, 1) if data_point.values and len(data_point.values) > 1 else ()
+        case ParameterType.STRING:
+            return ("a", "b")
+    return ()
+
+
+def _count_data_points(central: CentralUnit) -> int:
+    """Return the number of data points of all devices."""
+    return sum(len(device.get_data_points()) for device in central.devices)
+
+
+def get_percentiles(values: list[float]) -> dict[str, float]:
+    """Return percentiles of the values."""
+    if len(values) < 2:
+        return {}
+    quantiles = statistics.quantiles(values, n=100)
+    return {"p50": quantiles[49], "p95": quantiles[94], "p99": quantiles[98], "max": max(values)}
+
+
+def compare_results(
+    results: list[dict[str, Any]], baseline: list[dict[str, Any]], threshold: float = DEFAULT_REGRESSION_THRESHOLD
+) -> list[str]:
+    """Return the regressions of the results compared to the baseline."""
+    baseline_values = {(result["benchmark"], result["size"]): result for result in baseline}
+    regressions: list[str] = []
+    for result in results:
+        if (base := baseline_values.get((result["benchmark"], result["size"]))) is None or not base["value"]:
+            continue
+        ratio = result["value"] / base["value"]
+        if not result["lower_is_better"]:
+            ratio = 1 / ratio if ratio else float("inf")
+        if ratio > threshold:
+            regressions.append(
+                f"{result['benchmark']}[{result['size']}]: {result['value']:.6g} {result['unit']} "
+                f"(baseline {base['value']:.6g}, {ratio:.2f}x worse)"
+            )
+    return regressions
+
+
+async def _run(sizes: tuple[int, ...], event_count: int, round_trip_count: int) -> dict[str, Any]:
+    """Run the benchmarks for all sizes."""
+    results: list[BenchmarkResult] = []
+    with tempfile.TemporaryDirectory(prefix="hahomematic-benchmarks-") as workdir:
+        for size in sizes:
+            _LOGGER.info("Running benchmarks for %i devices", size)
+            results.extend(
+                await run_benchmarks(
+                    size=size, workdir=workdir, event_count=event_count, round_trip_count=round_trip_count
+                )
+            )
+    return {
+        "meta": {
+            "hahomematic": VERSION,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created_at": datetime.now().isoformat(),
+        },
+        "results": [asdict(result) for result in results],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description="Run the hahomematic benchmarks on synthetic installations.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="numbers of devices")
+    parser.add_argument("--events", type=int, default=DEFAULT_EVENT_COUNT, help="number of events per size")
+    parser.add_argument(
+        "--round-trips", type=int, default=DEFAULT_ROUND_TRIP_COUNT, help="number of set_value round trips per size"
+    )
+    parser.add_argument("--output", help="file to write the json results to, default is stdout")
+    parser.add_argument("--baseline", help="json results to compare with. Regressions return exit code 1")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD, help="factor, that counts as regression"
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    # The benchmarks create many devices. Keep the log of hahomematic quiet.
+    logging.getLogger("hahomematic").setLevel(logging.WARNING)
+
+    report = asyncio.run(_run(sizes=tuple(args.sizes), event_count=args.events, round_trip_count=args.round_trips))
+    data = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+    if args.output:
+        with open(args.output, mode="wb") as file_pointer:
+            file_pointer.write(data)
+    else:
+        sys.stdout.write(data.decode())
+        sys.stdout.write("\n")
+
+    if args.baseline:
+        with open(args.baseline, mode="rb") as file_pointer:
+            baseline = orjson.loads(file_pointer.read())
+        if regressions := compare_results(
+            results=report["results"], baseline=baseline["results"], threshold=args.threshold
+        ):
+            for regression in regressions:
+                _LOGGER.warning("REGRESSION: %s", regression)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
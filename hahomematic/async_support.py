@@ -3,35 +3,75 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Collection, Coroutine
+from collections.abc import Callable, Collection, Coroutine, Mapping
 from concurrent.futures import ThreadPoolExecutor
 from concurrent.futures._base import CancelledError
-from functools import wraps
+from functools import partial, wraps
 import logging
+from logging import DEBUG
+import threading
 from time import monotonic
 from typing import Any, Final, cast
 
-from hahomematic.const import BLOCK_LOG_TIMEOUT
+from hahomematic.const import BLOCK_LOG_TIMEOUT, LOOP_LAG_SAMPLE_INTERVAL
 from hahomematic.exceptions import HaHomematicException
+from hahomematic.metrics import Gauge, MetricsRegistry
 from hahomematic.support import debug_enabled, reduce_args
 
 _LOGGER: Final = logging.getLogger(__name__)
 
+# Executor jobs are started in worker threads of different executors.
+_EXECUTOR_METRICS_LOCK: Final = threading.Lock()
+
 
 class Looper:
-    """Helper class for event loop support."""
+    """
+    Helper class for event loop support.
+
+    Tasks are tracked until they are done. The number of tasks in flight can be limited by task name,
+    so a flood of tasks is dropped instead of growing unbounded. Tasks, where only the latest target is relevant,
+    can be merged.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, metrics: MetricsRegistry | None = None, task_limits: Mapping[str, int] | None = None) -> None:
         """Init the loop helper."""
         self._tasks: Final[set[asyncio.Future[Any]]] = set()
         self._loop = asyncio.get_event_loop()
+        self._metrics: Final = metrics
+        self._lag_sample_handle: asyncio.TimerHandle | None = None
+        # {prefix, metrics of the tasks}
+        self._task_metrics: Final[dict[str, _TaskMetrics]] = {}
+        # {prefix, max tasks in flight}
+        self._task_limits: Final[Mapping[str, int]] = task_limits or {}
+        # {prefix, tasks in flight}
+        self._limited_counts: Final[dict[str, int]] = {}
+        # {(name, name_args), target of a task, that is not started yet}
+        self._merged_targets: Final[dict[tuple[str, tuple[Any, ...]], _MergedTarget]] = {}
+        self._idle: Final = asyncio.Event()
+        self._idle.set()
 
     async def block_till_done(self) -> None:
         """Block until all pending work is done."""
         # To flush out any call_soon_threadsafe
         await asyncio.sleep(0)
+        if (current_task := asyncio.current_task()) in self._tasks:
+            # The current task would never be done, so the tracked tasks are awaited one by one.
+            await self._block_till_tasks_done(current_task=current_task)
+            return
+        wait_time = 0
+        while not self._idle.is_set():
+            try:
+                await asyncio.wait_for(self._idle.wait(), timeout=BLOCK_LOG_TIMEOUT)
+            except TimeoutError:
+                if all(cancelling(task) for task in self._tasks):
+                    return
+                wait_time += BLOCK_LOG_TIMEOUT
+                for task in self._tasks:
+                    _LOGGER.debug("Waited %s seconds for task: %s", wait_time, task)
+
+    async def _block_till_tasks_done(self, current_task: asyncio.Future[Any]) -> None:
+        """Block until all tasks except the current task are done."""
         start_time: float | None = None
-        current_task = asyncio.current_task()
         while tasks := [task for task in self._tasks if task is not current_task and not cancelling(task)]:
             await self._await_and_log_pending(tasks)
 
@@ -61,10 +101,26 @@ class Looper:
             for task in pending:
                 _LOGGER.debug("Waited %s seconds for task: %s", wait_time, task)
 
-    def create_task(self, target: Coroutine[Any, Any, Any], name: str) -> None:
-        """Add task to the executor pool."""
+    def create_task(
+        self,
+        target: Coroutine[Any, Any, Any],
+        name: str,
+        name_args: tuple[Any, ...] = (),
+        merge: bool = False,
+    ) -> None:
+        """
+        Add task to the event loop. This method can be run in any thread.
+
+        The name_args (e.g. interface_id, channel_address) are only appended to the name of the task,
+        if debug logging is enabled. With merge, a task, that is not started yet, and has the same name and name_args,
+        runs the latest target instead, e.g. for events, where only the latest value is relevant.
+        """
         try:
-            self._loop.call_soon_threadsafe(self._async_create_task, target, name)
+            created_at = monotonic() if self._metrics is not None else 0.0
+            if self._is_in_loop():
+                self._async_create_task(target, name, name_args, merge, created_at)
+            else:
+                self._loop.call_soon_threadsafe(self._async_create_task, target, name, name_args, merge, created_at)
         except CancelledError:
             _LOGGER.debug(
                 "create_task: task cancelled for %s",
@@ -72,12 +128,110 @@ class Looper:
             )
             return
 
-    def _async_create_task[_R](self, target: Coroutine[Any, Any, _R], name: str) -> asyncio.Task[_R]:
+    def call_soon(self, callback: Callable[..., Any], *args: Any) -> asyncio.Handle:
+        """Schedule a callback for the next loop iteration. This method must be run in the event_loop."""
+        return self._loop.call_soon(callback, *args)
+
+    def _is_in_loop(self) -> bool:
+        """Return if the caller runs in the event_loop."""
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def _async_create_task(
+        self,
+        target: Coroutine[Any, Any, Any],
+        name: str,
+        name_args: tuple[Any, ...],
+        merge: bool,
+        created_at: float,
+    ) -> None:
         """Create a task from within the event_loop. This method must be run in the event_loop."""
-        task = self._loop.create_task(target, name=name)
+        # The name is static, the variable parts are passed as name_args.
+        prefix = name
+        merge_key = (name, name_args)
+        merged_target: _MergedTarget | None = None
+        if merge and (pending_target := self._merged_targets.get(merge_key)) is not None:
+            pending_target.replace(target=target)
+            self._count_task(name="tasks_merged_total", description="Number of merged tasks", prefix=prefix)
+            return
+        if (limit := self._task_limits.get(prefix)) is not None:
+            if (count := self._limited_counts.get(prefix, 0)) >= limit:
+                target.close()
+                self._count_task(name="tasks_dropped_total", description="Number of dropped tasks", prefix=prefix)
+                _LOGGER.debug("create_task: Dropped task %s. Limit of %i tasks in flight reached", name, limit)
+                return
+            self._limited_counts[prefix] = count + 1
+        if merge:
+            merged_target = self._merged_targets[merge_key] = _MergedTarget(target=target)
+            target = self._run_merged_target(merge_key=merge_key, merged_target=merged_target)
+        task_name = "-".join((name, *map(str, name_args))) if _LOGGER.isEnabledFor(DEBUG) else name
+        if (task_metrics := self._get_task_metrics(prefix=prefix)) is None:
+            task = self._loop.create_task(target, name=task_name)
+            self._track_task(task=task)
+        else:
+            task = self._loop.create_task(
+                _measure_task_start(target=target, task_metrics=task_metrics, created_at=created_at), name=task_name
+            )
+            self._track_task(task=task)
+            task_metrics.created.inc()
+            task_metrics.in_flight.inc()
+            task.add_done_callback(partial(_release_measured_task, task_metrics=task_metrics, target=target))
+        if limit is not None:
+            task.add_done_callback(lambda _: self._release_limited_task(prefix=prefix))
+        if merged_target is not None:
+            task.add_done_callback(
+                partial(self._close_unstarted_target, merge_key=merge_key, merged_target=merged_target)
+            )
+
+    async def _run_merged_target(self, merge_key: tuple[str, tuple[Any, ...]], merged_target: _MergedTarget) -> Any:
+        """Run the latest target of merged tasks. Tasks created from now on are not merged into it."""
+        self._release_merged_target(merge_key=merge_key, merged_target=merged_target)
+        return await merged_target.target
+
+    def _close_unstarted_target(
+        self, _: asyncio.Future[Any], merge_key: tuple[str, tuple[Any, ...]], merged_target: _MergedTarget
+    ) -> None:
+        """Close the target of merged tasks, if the task was cancelled before it was started."""
+        if self._release_merged_target(merge_key=merge_key, merged_target=merged_target):
+            merged_target.target.close()
+
+    def _release_merged_target(self, merge_key: tuple[str, tuple[Any, ...]], merged_target: _MergedTarget) -> bool:
+        """Stop merging tasks into the target. Return False, if it was released before."""
+        if self._merged_targets.get(merge_key) is not merged_target:
+            return False
+        del self._merged_targets[merge_key]
+        return True
+
+    def _release_limited_task(self, prefix: str) -> None:
+        """Release a done task from the limit of its prefix."""
+        self._limited_counts[prefix] -= 1
+
+    def _track_task(self, task: asyncio.Future[Any]) -> None:
+        """Track the task until it is done."""
         self._tasks.add(task)
-        task.add_done_callback(self._tasks.remove)
-        return task
+        self._idle.clear()
+        task.add_done_callback(self._untrack_task)
+
+    def _untrack_task(self, task: asyncio.Future[Any]) -> None:
+        """Remove a done task from the tracked tasks."""
+        self._tasks.discard(task)
+        if not self._tasks:
+            self._idle.set()
+
+    def _count_task(self, name: str, description: str, prefix: str) -> None:
+        """Increment a task counter of a prefix."""
+        if self._metrics is not None:
+            self._metrics.counter(name=name, description=description, labels={"prefix": prefix}).inc()
+
+    def _get_task_metrics(self, prefix: str) -> _TaskMetrics | None:
+        """Return the metrics of the tasks with the prefix. The metrics are only looked up once per prefix."""
+        if self._metrics is None:
+            return None
+        if (task_metrics := self._task_metrics.get(prefix)) is None:
+            task_metrics = self._task_metrics[prefix] = _TaskMetrics(metrics=self._metrics, prefix=prefix)
+        return task_metrics
 
     def run_coroutine(self, coro: Coroutine, name: str) -> Any:
         """Call coroutine from sync."""
@@ -99,15 +253,46 @@ class Looper:
     ) -> asyncio.Future[_T]:
         """Add an executor job from within the event_loop."""
         try:
+            if (task_metrics := self._get_task_metrics(prefix=name)) is not None:
+                target = _measure_executor_job(task_metrics=task_metrics, target=target)
             task = self._loop.run_in_executor(executor, target, *args)
-            self._tasks.add(task)
-            task.add_done_callback(self._tasks.remove)
+            self._track_task(task=task)
+            if task_metrics is not None:
+                task_metrics.created.inc()
+                task_metrics.in_flight.inc()
+                task.add_done_callback(partial(_release_measured_task, task_metrics=task_metrics))
         except (TimeoutError, CancelledError) as err:  # pragma: no cover
             message = f"async_add_executor_job: task cancelled for {name} [{reduce_args(args=err.args)}]"
             _LOGGER.debug(message)
             raise HaHomematicException(message) from err
         return task
 
+    def start_lag_sampling(self, interval: float = LOOP_LAG_SAMPLE_INTERVAL) -> None:
+        """Start to sample the lag of the event loop periodically. This method must be run in the event_loop."""
+        if self._metrics is None or self._lag_sample_handle is not None:
+            return
+        self._schedule_lag_sample(interval=interval)
+
+    def stop_lag_sampling(self) -> None:
+        """Stop to sample the lag of the event loop."""
+        if self._lag_sample_handle is not None:
+            self._lag_sample_handle.cancel()
+            self._lag_sample_handle = None
+
+    def _schedule_lag_sample(self, interval: float) -> None:
+        """Schedule the next sample of the event loop lag."""
+        self._lag_sample_handle = self._loop.call_later(
+            interval, self._sample_lag, interval, self._loop.time() + interval
+        )
+
+    def _sample_lag(self, interval: float, expected_at: float) -> None:
+        """Record, how late the sample was executed by the event loop."""
+        if self._metrics is not None:
+            self._metrics.histogram(
+                name="event_loop_lag_seconds", description="Delay of scheduled callbacks in the event loop"
+            ).observe(max(self._loop.time() - expected_at, 0.0))
+        self._schedule_lag_sample(interval=interval)
+
     def cancel_tasks(self) -> None:
         """Cancel running tasks."""
         for task in self._tasks.copy():
@@ -115,6 +300,86 @@ class Looper:
                 task.cancel()
 
 
+class _MergedTarget:
+    """The latest target of merged tasks."""
+
+    __slots__ = ("target",)
+
+    def __init__(self, target: Coroutine[Any, Any, Any]) -> None:
+        """Init the merged target."""
+        self.target = target
+
+    def replace(self, target: Coroutine[Any, Any, Any]) -> None:
+        """Replace the target by a newer one."""
+        self.target.close()
+        self.target = target
+
+
+class _TaskMetrics:
+    """The metrics of the tasks with the same name prefix."""
+
+    __slots__ = ("_metrics", "_prefix", "_queue_depth", "created", "in_flight", "start_delay")
+
+    def __init__(self, metrics: MetricsRegistry, prefix: str) -> None:
+        """Init the task metrics."""
+        self._metrics = metrics
+        self._prefix = prefix
+        self._queue_depth: Gauge | None = None
+        labels = {"prefix": prefix}
+        self.created = metrics.counter(name="tasks_created_total", description="Number of created tasks", labels=labels)
+        self.in_flight = metrics.gauge(name="tasks_in_flight", description="Number of tasks in flight", labels=labels)
+        self.start_delay = metrics.histogram(
+            name="task_start_delay_seconds",
+            description="Delay between the creation and the start of tasks",
+            labels=labels,
+        )
+
+    @property
+    def queue_depth(self) -> Gauge:
+        """Return the executor queue depth. It is only created for executor jobs."""
+        if self._queue_depth is None:
+            self._queue_depth = self._metrics.gauge(
+                name="executor_queue_depth",
+                description="Number of executor jobs waiting for a worker",
+                labels={"prefix": self._prefix},
+            )
+        return self._queue_depth
+
+
+async def _measure_task_start[_R](target: Coroutine[Any, Any, _R], task_metrics: _TaskMetrics, created_at: float) -> _R:
+    """Record the delay between the creation and the start of a task."""
+    task_metrics.start_delay.observe(monotonic() - created_at)
+    return await target
+
+
+def _release_measured_task(
+    _: asyncio.Future[Any], task_metrics: _TaskMetrics, target: Coroutine[Any, Any, Any] | None = None
+) -> None:
+    """Remove a done task from the tasks in flight."""
+    task_metrics.in_flight.dec()
+    if target is not None:
+        # The target is not awaited, if the task is cancelled before it was started.
+        target.close()
+
+
+def _measure_executor_job[_T](task_metrics: _TaskMetrics, target: Callable[..., _T]) -> Callable[..., _T]:
+    """Track the executor queue depth and the delay until the job is started by a worker."""
+    queue_depth = task_metrics.queue_depth
+    start_delay = task_metrics.start_delay
+    created_at = monotonic()
+    with _EXECUTOR_METRICS_LOCK:
+        queue_depth.inc()
+
+    def run_job(*args: Any) -> _T:
+        """Run the job in the worker thread."""
+        with _EXECUTOR_METRICS_LOCK:
+            queue_depth.dec()
+            start_delay.observe(monotonic() - created_at)
+        return target(*args)
+
+    return run_job
+
+
 def cancelling(task: asyncio.Future[Any]) -> bool:
     """Return True if task is cancelling."""
     return bool((cancelling_ := getattr(task, "cancelling", None)) and cancelling_())
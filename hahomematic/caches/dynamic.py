@@ -7,10 +7,12 @@ from collections.abc import Mapping
 from datetime import datetime
 from functools import lru_cache
 import logging
+from time import monotonic
 from typing import Any, Final, cast
 
 from hahomematic import central as hmcu
 from hahomematic.const import (
+    COMMAND_CACHE_MAX_SIZE,
     DP_KEY_VALUE,
     INIT_DATETIME,
     LAST_COMMAND_SEND_STORE_TIMEOUT,
@@ -34,13 +36,36 @@ _LOGGER: Final = logging.getLogger(__name__)
 
 
 class CommandCache:
-    """Cache for send commands."""
+    """
+    Cache for send commands.
 
-    def __init__(self, interface_id: str) -> None:
+    Entries are kept in send order with a monotonic timestamp, so expired entries
+    are always at the front and can be removed in bulk by `cleanup`.
+    """
+
+    def __init__(self, interface_id: str, max_size: int = COMMAND_CACHE_MAX_SIZE) -> None:
         """Init command cache."""
         self._interface_id: Final = interface_id
-        # (paramset_key, device_address, channel_no, parameter)
-        self._last_send_command: Final[dict[DataPointKey, tuple[Any, datetime]]] = {}
+        self._max_size: Final = max_size
+        # (paramset_key, device_address, channel_no, parameter) -> (value, monotonic send time)
+        self._last_send_command: Final[dict[DataPointKey, tuple[Any, float]]] = {}
+        self._expired_count: int = 0
+        self._evicted_count: int = 0
+
+    @property
+    def size(self) -> int:
+        """Return the number of unconfirmed send commands."""
+        return len(self._last_send_command)
+
+    @property
+    def expired_count(self) -> int:
+        """Return the number of send commands, that expired without confirmation."""
+        return self._expired_count
+
+    @property
+    def evicted_count(self) -> int:
+        """Return the number of send commands, that were evicted due to the size limit."""
+        return self._evicted_count
 
     def add_set_value(
         self,
@@ -60,7 +85,7 @@ class CommandCache:
             paramset_key=ParamsetKey.VALUES,
             parameter=parameter,
         )
-        self._last_send_command[dpk] = (value, datetime.now())
+        self._store(dpk=dpk, value=value, send_at=monotonic())
         return {(dpk, value)}
 
     def add_put_paramset(
@@ -68,6 +93,7 @@ class CommandCache:
     ) -> set[DP_KEY_VALUE]:
         """Add data from put paramset command."""
         dpk_values: set[DP_KEY_VALUE] = set()
+        send_at = monotonic()
         for parameter, value in values.items():
             dpk = DataPointKey(
                 interface_id=self._interface_id,
@@ -75,7 +101,7 @@ class CommandCache:
                 paramset_key=paramset_key,
                 parameter=parameter,
             )
-            self._last_send_command[dpk] = (value, datetime.now())
+            self._store(dpk=dpk, value=value, send_at=send_at)
             dpk_values.add((dpk, value))
         return dpk_values
 
@@ -93,14 +119,13 @@ class CommandCache:
 
     def get_last_value_send(self, dpk: DataPointKey, max_age: int = LAST_COMMAND_SEND_STORE_TIMEOUT) -> Any:
         """Return the last send values."""
-        if result := self._last_send_command.get(dpk):
-            value, last_send_dt = result
-            if last_send_dt and changed_within_seconds(last_change=last_send_dt, max_age=max_age):
-                return value
-            self.remove_last_value_send(
-                dpk=dpk,
-                max_age=max_age,
-            )
+        if (result := self._last_send_command.get(dpk)) is None:
+            return None
+        value, send_at = result
+        if monotonic() - send_at < max_age:
+            return value
+        del self._last_send_command[dpk]
+        self._expired_count += 1
         return None
 
     def remove_last_value_send(
@@ -110,12 +135,38 @@ class CommandCache:
         max_age: int = LAST_COMMAND_SEND_STORE_TIMEOUT,
     ) -> None:
         """Remove the last send value."""
-        if result := self._last_send_command.get(dpk):
-            stored_value, last_send_dt = result
-            if not changed_within_seconds(last_change=last_send_dt, max_age=max_age) or (
-                value is not None and stored_value == value
-            ):
-                del self._last_send_command[dpk]
+        if (result := self._last_send_command.get(dpk)) is None:
+            return
+        stored_value, send_at = result
+        if expired := monotonic() - send_at >= max_age:
+            self._expired_count += 1
+        if expired or (value is not None and stored_value == value):
+            del self._last_send_command[dpk]
+
+    def cleanup(self, max_age: int = LAST_COMMAND_SEND_STORE_TIMEOUT) -> int:
+        """Remove all expired send commands and return the number of removed entries."""
+        expire_before = monotonic() - max_age
+        expired_dpks: list[DataPointKey] = []
+        for dpk, (_, send_at) in self._last_send_command.items():
+            if send_at > expire_before:
+                break
+            expired_dpks.append(dpk)
+        for dpk in expired_dpks:
+            del self._last_send_command[dpk]
+        self._expired_count += len(expired_dpks)
+        return len(expired_dpks)
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        self._last_send_command.clear()
+
+    def _store(self, dpk: DataPointKey, value: Any, send_at: float) -> None:
+        """Store a send command at the end of the send order and enforce the size limit."""
+        self._last_send_command.pop(dpk, None)
+        self._last_send_command[dpk] = (value, send_at)
+        if len(self._last_send_command) > self._max_size:
+            del self._last_send_command[next(iter(self._last_send_command))]
+            self._evicted_count += 1
 
 
 class DeviceDetailsCache:
@@ -21,6 +21,7 @@ from hahomematic.const import (
     CACHE_PATH,
     FILE_DEVICES,
     FILE_PARAMSETS,
+    FILE_VALUES,
     INIT_DATETIME,
     UTF_8,
     DataOperationResult,
@@ -92,9 +93,7 @@ class BasePersistentCache(ABC):
             return DataOperationResult.SAVE_SUCCESS
 
         async with self._save_load_semaphore:
-            return await self._central.looper.async_add_executor_job(
-                _perform_save, name=f"save-persistent-cache-{self._filename}"
-            )
+            return await self._central.looper.async_add_executor_job(_perform_save, name="save-persistent-cache")
 
     @property
     def _should_save(self) -> bool:
@@ -122,9 +121,7 @@ class BasePersistentCache(ABC):
             return DataOperationResult.LOAD_SUCCESS
 
         async with self._save_load_semaphore:
-            return await self._central.looper.async_add_executor_job(
-                _perform_load, name=f"load-persistent-cache-{self._filename}"
-            )
+            return await self._central.looper.async_add_executor_job(_perform_load, name="load-persistent-cache")
 
     async def clear(self) -> None:
         """Remove stored file from disk."""
@@ -390,3 +387,68 @@ class ParamsetDescriptionCache(BasePersistentCache):
     async def save(self) -> DataOperationResult:
         """Save current paramset descriptions to disk."""
         return await super().save()
+
+
+class ValueSnapshotCache(BasePersistentCache):
+    """Cache for the last known values of the data points, that are restored on start."""
+
+    _file_postfix = FILE_VALUES
+
+    def __init__(self, central: hmcu.CentralUnit) -> None:
+        """Init the value snapshot cache."""
+        # {interface_id, {channel_address, {paramset_key, {parameter, (value, modified_at, refreshed_at)}}}}
+        self._snapshot: Final[dict[str, dict[str, dict[str, dict[str, tuple[Any, float, float]]]]]] = {}
+        super().__init__(
+            central=central,
+            persistent_cache=self._snapshot,
+        )
+
+    @property
+    def _enabled(self) -> bool:
+        """Return if the value snapshot is enabled."""
+        return self._central.config.use_caches and self._central.config.enable_value_snapshot
+
+    def create_snapshot(self) -> None:
+        """Create a snapshot of the valid values of the readable generic data points."""
+        self._snapshot.clear()
+        for device in self._central.devices:
+            for data_point in device.generic_data_points:
+                if not data_point.is_readable or (value_snapshot := data_point.get_value_snapshot()) is None:
+                    continue
+                self._snapshot.setdefault(device.interface_id, {}).setdefault(
+                    data_point.channel.address, {}
+                ).setdefault(data_point.paramset_key, {})[data_point.parameter] = value_snapshot
+
+    def restore_device(self, device: Device) -> bool:
+        """Restore the values of the device from the snapshot. Return if values have been restored."""
+        if not (channels := self._snapshot.get(device.interface_id)):
+            return False
+        restored = False
+        for data_point in device.generic_data_points:
+            if (
+                value_snapshot := channels.get(data_point.channel.address, {})
+                .get(data_point.paramset_key, {})
+                .get(data_point.parameter)
+            ) is None:
+                continue
+            value, modified_at, refreshed_at = value_snapshot
+            data_point.restore_value_snapshot(value=value, modified_at=modified_at, refreshed_at=refreshed_at)
+            restored = True
+        # The snapshot is only used once per device
+        for channel_address in device.channels:
+            channels.pop(channel_address, None)
+        return restored
+
+    async def load(self) -> DataOperationResult:
+        """Load the value snapshot from disk."""
+        if not self._enabled:
+            _LOGGER.debug("load: value snapshot is disabled for %s", self._central.name)
+            return DataOperationResult.NO_LOAD
+        return await super().load()
+
+    async def save(self) -> DataOperationResult:
+        """Create and save the value snapshot to disk."""
+        if not self._enabled:
+            return DataOperationResult.NO_SAVE
+        self.create_snapshot()
+        return await super().save()
@@ -0,0 +1,218 @@
+"""Capture of the backend traffic of a central, and replay of captured traffic."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Sequence
+from datetime import datetime
+import logging
+import os
+from queue import SimpleQueue
+import threading
+from time import monotonic
+from typing import Any, Final
+
+import orjson
+
+from hahomematic.const import CAPTURE_PATH, TrafficCaptureKind
+from hahomematic.exceptions import ClientException
+
+__all__ = ["TrafficRecorder", "TrafficReplay", "read_capture"]
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+_CAPTURE_FILE_EXTENSION: Final = "jsonl"
+_DUMPS_OPTIONS: Final = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+
+# Keys of a captured record.
+_ARGS: Final = "args"
+_DURATION: Final = "duration"
+_ERROR: Final = "error"
+_INTERFACE_ID: Final = "interface_id"
+_KIND: Final = "kind"
+_METHOD: Final = "method"
+_RESULT: Final = "result"
+_TS: Final = "ts"
+
+
+class TrafficRecorder:
+    """
+    Record the outgoing calls to the backend and the incoming callbacks of a central.
+
+    Every record is appended as a json line, so an interrupted capture stays readable.
+    Records are queued by the calling thread, and written by a writer thread,
+    that is started on the first record.
+    """
+
+    def __init__(self, storage_folder: str, central_name: str, enabled: bool) -> None:
+        """Init the traffic recorder."""
+        self._enabled: Final = enabled
+        self._central_name: Final = central_name
+        self._file_path: Final = os.path.join(
+            storage_folder,
+            CAPTURE_PATH,
+            f"{central_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{_CAPTURE_FILE_EXTENSION}",
+        )
+        self._lock: Final = threading.Lock()
+        # Serialized records of the writer thread. None stops the writer thread.
+        self._queue: SimpleQueue[bytes | None] = SimpleQueue()
+        self._writer: threading.Thread | None = None
+        self._started_at: Final = monotonic()
+
+    @property
+    def enabled(self) -> bool:
+        """Return if the capture of traffic is enabled."""
+        return self._enabled
+
+    @property
+    def file_path(self) -> str:
+        """Return the path of the capture file."""
+        return self._file_path
+
+    def record_call(
+        self,
+        interface_id: str | None,
+        method: str,
+        args: Sequence[Any],
+        duration: float,
+        result: Any = None,
+        error: Exception | None = None,
+    ) -> None:
+        """Record an outgoing call to the backend with its response."""
+        record: dict[str, Any] = {
+            _KIND: TrafficCaptureKind.CALL,
+            _INTERFACE_ID: interface_id,
+            _METHOD: method,
+            _ARGS: args,
+            _DURATION: duration,
+        }
+        if error is None:
+            record[_RESULT] = result
+        else:
+            record[_ERROR] = str(error)
+        self._write(record=record)
+
+    def record_event(self, interface_id: str, method: str, args: Sequence[Any]) -> None:
+        """Record an incoming callback of the backend."""
+        self._write(record={_KIND: TrafficCaptureKind.EVENT, _INTERFACE_ID: interface_id, _METHOD: method, _ARGS: args})
+
+    def close(self) -> None:
+        """Write the queued records, and close the capture file."""
+        with self._lock:
+            if (writer := self._writer) is None:
+                return
+            self._writer = None
+            self._queue.put(None)
+        writer.join()
+
+    def _write(self, record: dict[str, Any]) -> None:
+        """Queue a record for the capture file."""
+        if not self._enabled:
+            return
+        record[_TS] = monotonic() - self._started_at
+        try:
+            data = orjson.dumps(record, default=str, option=_DUMPS_OPTIONS)
+        except TypeError as err:
+            _LOGGER.debug("TRAFFIC_RECORDER: Unable to serialize record: %s", err)
+            return
+        with self._lock:
+            if self._writer is None:
+                self._queue = SimpleQueue()
+                self._writer = threading.Thread(
+                    target=self._run_writer,
+                    args=(self._queue,),
+                    name=f"TrafficRecorder for {self._central_name}",
+                    daemon=True,
+                )
+                self._writer.start()
+            self._queue.put(data)
+
+    def _run_writer(self, queue: SimpleQueue[bytes | None]) -> None:
+        """Append the queued records to the capture file. Runs in the writer thread."""
+        try:
+            os.makedirs(os.path.dirname(self._file_path), exist_ok=True)
+            with open(self._file_path, mode="ab") as file_pointer:
+                _LOGGER.info("TRAFFIC_RECORDER: Capturing backend traffic to %s", self._file_path)
+                while (data := queue.get()) is not None:
+                    file_pointer.write(data)
+        except OSError as err:
+            _LOGGER.debug("TRAFFIC_RECORDER: Unable to write records: %s", err)
+            # The queue is drained, so the callers are not affected.
+            while queue.get() is not None:
+                pass
+
+
+def read_capture(file_path: str) -> list[dict[str, Any]]:
+    """Read the records of a capture file. Incomplete lines are skipped."""
+    records: list[dict[str, Any]] = []
+    with open(file_path, mode="rb") as file_pointer:
+        for line in file_pointer:
+            try:
+                records.append(orjson.loads(line))
+            except orjson.JSONDecodeError:
+                _LOGGER.debug("READ_CAPTURE: Skipping incomplete record in %s", file_path)
+    return records
+
+
+class TrafficReplay:
+    """
+    Serve captured responses of an interface, and replay its captured callbacks.
+
+    The original timing is scaled by the speed factor. A speed of 0 replays without delays.
+    Repeated calls return the captured responses in order, and the last response afterwards.
+    """
+
+    def __init__(self, records: Sequence[dict[str, Any]], interface_id: str, speed: float = 1.0) -> None:
+        """Init the traffic replay."""
+        self._speed: Final = speed
+        # {(method, serialized args), captured responses}
+        self._responses: Final[dict[tuple[str, bytes], deque[dict[str, Any]]]] = {}
+        self._events: Final[list[dict[str, Any]]] = []
+        for record in records:
+            if record.get(_INTERFACE_ID) != interface_id:
+                continue
+            if record[_KIND] == TrafficCaptureKind.CALL:
+                self._responses.setdefault(_get_call_key(record[_METHOD], record[_ARGS]), deque()).append(record)
+            elif record[_KIND] == TrafficCaptureKind.EVENT:
+                self._events.append(record)
+
+    @property
+    def event_count(self) -> int:
+        """Return the number of captured callbacks."""
+        return len(self._events)
+
+    async def call(self, method: str, *args: Any) -> Any:
+        """Return the captured response of a call."""
+        if not (responses := self._responses.get(_get_call_key(method, args))):
+            _LOGGER.debug("TRAFFIC_REPLAY: No captured response for %s%s", method, args)
+            return None
+        record = responses.popleft() if len(responses) > 1 else responses[0]
+        await self._sleep(delay=record[_DURATION])
+        if (error := record.get(_ERROR)) is not None:
+            raise ClientException(error)
+        return record[_RESULT]
+
+    async def replay_events(self, interface_id: str, handler: Callable[..., Awaitable[Any]]) -> int:
+        """
+        Replay the captured callbacks with their original spacing.
+
+        The handler is awaited with the method, the interface_id and the remaining arguments of each callback.
+        """
+        previous_ts: float | None = None
+        for record in self._events:
+            if previous_ts is not None:
+                await self._sleep(delay=record[_TS] - previous_ts)
+            previous_ts = record[_TS]
+            await handler(record[_METHOD], interface_id, *record[_ARGS][1:])
+        return len(self._events)
+
+    async def _sleep(self, delay: float) -> None:
+        """Sleep for the scaled delay."""
+        if self._speed > 0 and delay > 0:
+            await asyncio.sleep(delay / self._speed)
+
+
+def _get_call_key(method: str, args: Sequence[Any]) -> tuple[str, bytes]:
+    """Return the lookup key of a call."""
+    return method, orjson.dumps(list(args), default=str, option=orjson.OPT_NON_STR_KEYS)
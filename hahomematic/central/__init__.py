@@ -22,44 +22,69 @@ import voluptuous as vol
 from hahomematic import client as hmcl
 from hahomematic.async_support import Looper, loop_check
 from hahomematic.caches.dynamic import CentralDataCache, DeviceDetailsCache
-from hahomematic.caches.persistent import DeviceDescriptionCache, ParamsetDescriptionCache
+from hahomematic.caches.persistent import DeviceDescriptionCache, ParamsetDescriptionCache, ValueSnapshotCache
 from hahomematic.caches.visibility import ParameterVisibilityCache
+from hahomematic.capture import TrafficRecorder
 from hahomematic.central import xml_rpc_server as xmlrpc
+from hahomematic.central.confirmation import PendingConfirmationRegistry
 from hahomematic.central.decorators import callback_backend_system, callback_event
+from hahomematic.central.index import DataPointIndex
+from hahomematic.central.memory import MemoryReport, create_memory_report
+from hahomematic.central.timeline import StartupTimeline
 from hahomematic.client.json_rpc import JsonRpcAioHttpClient
 from hahomematic.client.xml_rpc import XmlRpcProxy
+from hahomematic.clock import Clock
 from hahomematic.const import (
     CALLBACK_TYPE,
     CATEGORIES,
+    COMMAND_CACHE_CLEANUP_INTERVAL,
     CONNECTION_CHECKER_INTERVAL,
     DATA_POINT_EVENTS,
     DATETIME_FORMAT_MILLIS,
     DEFAULT_ENABLE_DEVICE_FIRMWARE_CHECK,
+    DEFAULT_ENABLE_EVENT_TRACING,
+    DEFAULT_ENABLE_MEMORY_REPORT,
     DEFAULT_ENABLE_PROGRAM_SCAN,
+    DEFAULT_ENABLE_SYSVAR_PUSH,
     DEFAULT_ENABLE_SYSVAR_SCAN,
+    DEFAULT_ENABLE_TRAFFIC_CAPTURE,
+    DEFAULT_ENABLE_VALUE_SNAPSHOT,
+    DEFAULT_EVENT_TRACE_LOG_SAMPLE_RATE,
     DEFAULT_IGNORE_CUSTOM_DEVICE_DEFINITION_MODELS,
+    DEFAULT_LAZY_DEVICE_ERROR_EVENTS,
     DEFAULT_MAX_READ_WORKERS,
+    DEFAULT_METRICS_PORT,
     DEFAULT_PERIODIC_REFRESH_INTERVAL,
+    DEFAULT_PROFILER_DURATION,
     DEFAULT_PROGRAM_MARKERS,
     DEFAULT_SYS_SCAN_INTERVAL,
     DEFAULT_SYSVAR_MARKERS,
+    DEFAULT_SYSVAR_PUSH_SCAN_INTERVAL,
     DEFAULT_TLS,
     DEFAULT_UN_IGNORES,
     DEFAULT_VERIFY_TLS,
+    DEFAULT_WRITE_COALESCING_WINDOW,
     DEVICE_FIRMWARE_CHECK_INTERVAL,
     DEVICE_FIRMWARE_DELIVERING_CHECK_INTERVAL,
     DEVICE_FIRMWARE_UPDATING_CHECK_INTERVAL,
     IGNORE_FOR_UN_IGNORE_PARAMETERS,
+    INIT_MONOTONIC,
     INTERFACES_REQUIRING_PERIODIC_REFRESH,
     IP_ANY_V4,
+    LAST_COMMAND_SEND_STORE_TIMEOUT,
     LOCAL_HOST,
+    MEMORY_REPORT_INTERVAL,
     PORT_ANY,
     PRIMARY_CLIENT_CANDIDATE_INTERFACES,
+    SYSVAR_ADDRESS,
+    SYSVAR_PUSH_MAX_AGE,
+    SYSVAR_STATE_PATH_ROOT,
     TIMEOUT,
     UN_IGNORE_WILDCARD,
     BackendSystemEvent,
     DataPointCategory,
     DataPointKey,
+    DataPointUsage,
     DescriptionMarker,
     DeviceDescription,
     DeviceFirmwareState,
@@ -81,6 +106,7 @@ from hahomematic.exceptions import (
     NoClientsException,
     NoConnectionException,
 )
+from hahomematic.metrics import MetricsExporter, MetricsRegistry
 from hahomematic.model import create_data_points_and_events
 from hahomematic.model.custom import CustomDataPoint, create_custom_data_points
 from hahomematic.model.data_point import BaseParameterDataPoint, CallbackDataPoint
@@ -95,8 +121,11 @@ from hahomematic.model.hub import (
     Hub,
     ProgramDpType,
 )
+from hahomematic.model.lazy import LazyEvent
 from hahomematic.model.support import PayloadMixin
+from hahomematic.profiler import SamplingProfiler
 from hahomematic.support import check_config, get_channel_no, get_device_address, get_ip_addr, reduce_args
+from hahomematic.tracing import EventTracer
 
 __all__ = ["CentralConfig", "CentralUnit", "INTERFACE_EVENT_SCHEMA"]
 
@@ -122,6 +151,7 @@ class CentralUnit(PayloadMixin):
 
     def __init__(self, central_config: CentralConfig) -> None:
         """Init the central unit."""
+        super().__init__()
         self._started: bool = False
         self._device_add_semaphore: Final = asyncio.Semaphore()
         self._connection_state: Final = CentralConnectionState()
@@ -130,16 +160,31 @@ class CentralUnit(PayloadMixin):
         self._config: Final = central_config
         self._url: Final = self._config.create_central_url()
         self._model: str | None = None
-        self._looper = Looper()
+        self._metrics: Final = MetricsRegistry()
+        self._looper = Looper(metrics=self._metrics, task_limits=self._config.task_limits)
+        self._event_tracer: Final = EventTracer(
+            metrics=self._metrics,
+            enabled=self._config.enable_event_tracing,
+            log_sample_rate=self._config.event_trace_log_sample_rate,
+        )
+        self._traffic_recorder: Final = TrafficRecorder(
+            storage_folder=self._config.storage_folder,
+            central_name=self._config.name,
+            enabled=self._config.enable_traffic_capture,
+        )
+        self._startup_timeline: Final = StartupTimeline(name=self._config.name)
+        self._profiler: Final = SamplingProfiler(storage_folder=self._config.storage_folder, name=self._config.name)
+        self._clock: Final = self._config.clock or Clock()
         self._xml_rpc_server: xmlrpc.XmlRpcServer | None = None
         self._json_rpc_client: JsonRpcAioHttpClient | None = None
 
         # Caches for CCU data
-        self._data_cache: Final = CentralDataCache(central=self)
-        self._device_details: Final = DeviceDetailsCache(central=self)
-        self._device_descriptions: Final = DeviceDescriptionCache(central=self)
-        self._paramset_descriptions: Final = ParamsetDescriptionCache(central=self)
-        self._parameter_visibility: Final = ParameterVisibilityCache(central=self)
+        self._data_cache: Final[CentralDataCache] = CentralDataCache(central=self)
+        self._device_details: Final[DeviceDetailsCache] = DeviceDetailsCache(central=self)
+        self._device_descriptions: Final[DeviceDescriptionCache] = DeviceDescriptionCache(central=self)
+        self._paramset_descriptions: Final[ParamsetDescriptionCache] = ParamsetDescriptionCache(central=self)
+        self._parameter_visibility: Final[ParameterVisibilityCache] = ParameterVisibilityCache(central=self)
+        self._value_snapshot: Final = ValueSnapshotCache(central=self)
 
         self._primary_client: hmcl.Client | None = None
         # {interface_id, client}
@@ -151,10 +196,17 @@ class CentralUnit(PayloadMixin):
         self._sysvar_data_point_event_subscriptions: Final[dict[str, Callable]] = {}
         # {device_address, device}
         self._devices: Final[dict[str, Device]] = {}
+        self._data_point_index: Final = DataPointIndex()
         # {sysvar_name, sysvar_data_point}
         self._sysvar_data_points: Final[dict[str, GenericSysvarDataPoint]] = {}
         # {sysvar_name, program_button}
         self._program_data_points: Final[dict[str, ProgramDpType]] = {}
+        # {legacy_name, sysvar_data_point}
+        self._sysvar_data_points_by_legacy_name: Final[dict[str, GenericSysvarDataPoint]] = {}
+        # {legacy_name, program_button}
+        self._program_data_points_by_legacy_name: Final[dict[str, ProgramDpType]] = {}
+        # {category, {unique_id, hub_data_point}}
+        self._hub_data_points_by_category: Final[dict[DataPointCategory, dict[str, GenericHubDataPoint]]] = {}
         # Signature: (name, *args)
         # e.g. DEVICES_CREATED, HUB_REFRESHED
         self._backend_system_callbacks: Final[set[Callable]] = set()
@@ -169,8 +221,12 @@ class CentralUnit(PayloadMixin):
         self._scheduler: Final = _Scheduler(central=self)
         self._hub: Hub = Hub(central=self)
         self._version: str | None = None
-        # store last event received datetime by interface_id
-        self._last_events: Final[dict[str, datetime]] = {}
+        # store last event received monotonic time by interface_id
+        self._last_events: Final[dict[str, float]] = {}
+        self._last_sysvar_push: float = INIT_MONOTONIC
+        self._pending_confirmations: Final = PendingConfirmationRegistry()
+        self._metrics.register_collector(self._collect_metrics)
+        self._metrics_exporter: MetricsExporter | None = None
         self._xml_rpc_callback_ip: str = IP_ANY_V4
         self._listen_ip_addr: str = IP_ANY_V4
         self._listen_port: int = PORT_ANY
@@ -180,6 +236,13 @@ class CentralUnit(PayloadMixin):
         """Return the availability of the central."""
         return all(client.available for client in self._clients.values())
 
+    @property
+    def is_sysvar_push_active(self) -> bool:
+        """Return if system variable changes have been pushed recently."""
+        return self._config.enable_sysvar_push and self._clock.changed_within_seconds(
+            monotonic_time=self._last_sysvar_push, max_age=SYSVAR_PUSH_MAX_AGE
+        )
+
     @property
     def callback_ip_addr(self) -> str:
         """Return the xml rpc server callback ip address."""
@@ -195,6 +258,11 @@ class CentralUnit(PayloadMixin):
         """Return all clients."""
         return tuple(self._clients.values())
 
+    @property
+    def clock(self) -> Clock:
+        """Return the clock of the central."""
+        return self._clock
+
     @property
     def config(self) -> CentralConfig:
         """Return central config."""
@@ -249,6 +317,36 @@ class CentralUnit(PayloadMixin):
         """Return if XmlRPC-Server is alive."""
         return all(client.is_callback_alive() for client in self._clients.values())
 
+    @property
+    def event_tracer(self) -> EventTracer:
+        """Return the tracer of backend events."""
+        return self._event_tracer
+
+    @property
+    def profiler(self) -> SamplingProfiler:
+        """Return the sampling profiler."""
+        return self._profiler
+
+    def memory_report(self) -> MemoryReport:
+        """Return the approximate memory use of the central by subsystem, and update the memory gauges."""
+        report = create_memory_report(central=self)
+        self._set_memory_gauges(metrics=self._metrics, report=report)
+        return report
+
+    def start_profiler(self, duration: float) -> bool:
+        """Sample the central for the duration in seconds, e.g. in steady state. Return False, if already running."""
+        return self._profiler.start(duration=duration)
+
+    @property
+    def startup_timeline(self) -> StartupTimeline:
+        """Return the timeline of the last startup."""
+        return self._startup_timeline
+
+    @property
+    def traffic_recorder(self) -> TrafficRecorder:
+        """Return the recorder of the backend traffic."""
+        return self._traffic_recorder
+
     @property
     def json_rpc_client(self) -> JsonRpcAioHttpClient:
         """Return the json rpc client."""
@@ -256,6 +354,16 @@ class CentralUnit(PayloadMixin):
             self._json_rpc_client = self._config.create_json_rpc_client(central=self)
         return self._json_rpc_client
 
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """Return the metrics registry of the central."""
+        return self._metrics
+
+    @property
+    def metrics_listen_port(self) -> int | None:
+        """Return the port of the metrics exporter."""
+        return self._metrics_exporter.listen_port if self._metrics_exporter else None
+
     @property
     def paramset_descriptions(self) -> ParamsetDescriptionCache:
         """Return paramset_descriptions cache."""
@@ -271,6 +379,11 @@ class CentralUnit(PayloadMixin):
         """Return clients that need to poll data."""
         return tuple(client for client in self._clients.values() if not client.supports_push_updates)
 
+    @property
+    def unconfirmed_write_counts(self) -> Mapping[str, int]:
+        """Return the number of unconfirmed writes by interface_id."""
+        return {interface_id: client.last_value_send_cache.size for interface_id, client in self._clients.items()}
+
     @property
     def primary_client(self) -> hmcl.Client | None:
         """Return the primary client of the backend."""
@@ -290,6 +403,11 @@ class CentralUnit(PayloadMixin):
         """Return the xml rpc listening server port."""
         return self._listen_port
 
+    @property
+    def pending_confirmations(self) -> PendingConfirmationRegistry:
+        """Return the registry of send values waiting for confirmation."""
+        return self._pending_confirmations
+
     @property
     def looper(self) -> Looper:
         """Return the loop support."""
@@ -350,7 +468,12 @@ class CentralUnit(PayloadMixin):
     def add_sysvar_data_point(self, sysvar_data_point: GenericSysvarDataPoint) -> None:
         """Add new program button."""
         if (vid := sysvar_data_point.vid) is not None:
+            if (existing_dp := self._sysvar_data_points.get(vid)) is not None:
+                self._remove_sysvar_data_point_from_indexes(sysvar_data_point=existing_dp)
             self._sysvar_data_points[vid] = sysvar_data_point
+        if sysvar_data_point.legacy_name:
+            self._sysvar_data_points_by_legacy_name[sysvar_data_point.legacy_name] = sysvar_data_point
+        self._add_hub_data_point_to_category_index(hub_data_point=sysvar_data_point)
         if sysvar_data_point.state_path not in self._sysvar_data_point_event_subscriptions:
             self._sysvar_data_point_event_subscriptions[sysvar_data_point.state_path] = sysvar_data_point.event
 
@@ -359,12 +482,19 @@ class CentralUnit(PayloadMixin):
         if (sysvar_dp := self.get_sysvar_data_point(vid=vid)) is not None:
             sysvar_dp.fire_device_removed_callback()
             del self._sysvar_data_points[vid]
+            self._remove_sysvar_data_point_from_indexes(sysvar_data_point=sysvar_dp)
             if sysvar_dp.state_path in self._sysvar_data_point_event_subscriptions:
                 del self._sysvar_data_point_event_subscriptions[sysvar_dp.state_path]
 
     def add_program_data_point(self, program_dp: ProgramDpType) -> None:
         """Add new program button."""
+        if (existing_dp := self._program_data_points.get(program_dp.pid)) is not None:
+            self._remove_program_data_point_from_indexes(program_dp=existing_dp)
         self._program_data_points[program_dp.pid] = program_dp
+        for hub_data_point in (program_dp.button, program_dp.switch):
+            if hub_data_point.legacy_name:
+                self._program_data_points_by_legacy_name[hub_data_point.legacy_name] = program_dp
+            self._add_hub_data_point_to_category_index(hub_data_point=hub_data_point)
 
     def remove_program_button(self, pid: str) -> None:
         """Remove a program button."""
@@ -372,6 +502,39 @@ class CentralUnit(PayloadMixin):
             program_dp.button.fire_device_removed_callback()
             program_dp.switch.fire_device_removed_callback()
             del self._program_data_points[pid]
+            self._remove_program_data_point_from_indexes(program_dp=program_dp)
+
+    def _add_hub_data_point_to_category_index(self, hub_data_point: GenericHubDataPoint) -> None:
+        """Add a hub data point to the category index."""
+        self._hub_data_points_by_category.setdefault(hub_data_point.category, {})[hub_data_point.unique_id] = (
+            hub_data_point
+        )
+
+    def _remove_program_data_point_from_indexes(self, program_dp: ProgramDpType) -> None:
+        """Remove a program data point from the legacy_name and category indexes."""
+        for hub_data_point in (program_dp.button, program_dp.switch):
+            if (
+                hub_data_point.legacy_name
+                and self._program_data_points_by_legacy_name.get(hub_data_point.legacy_name) is program_dp
+            ):
+                del self._program_data_points_by_legacy_name[hub_data_point.legacy_name]
+            self._remove_hub_data_point_from_category_index(hub_data_point=hub_data_point)
+
+    def _remove_sysvar_data_point_from_indexes(self, sysvar_data_point: GenericSysvarDataPoint) -> None:
+        """Remove a sysvar data point from the legacy_name and category indexes."""
+        if (
+            sysvar_data_point.legacy_name
+            and self._sysvar_data_points_by_legacy_name.get(sysvar_data_point.legacy_name) is sysvar_data_point
+        ):
+            del self._sysvar_data_points_by_legacy_name[sysvar_data_point.legacy_name]
+        self._remove_hub_data_point_from_category_index(hub_data_point=sysvar_data_point)
+
+    def _remove_hub_data_point_from_category_index(self, hub_data_point: GenericHubDataPoint) -> None:
+        """Remove a hub data point from the category index."""
+        if (
+            by_unique_id := self._hub_data_points_by_category.get(hub_data_point.category)
+        ) is not None and by_unique_id.get(hub_data_point.unique_id) is hub_data_point:
+            del by_unique_id[hub_data_point.unique_id]
 
     def identify_channel(self, text: str) -> Channel | None:
         """Identify channel within a text."""
@@ -395,11 +558,15 @@ class CentralUnit(PayloadMixin):
         if self._started:
             _LOGGER.debug("START: Central %s already started", self.name)
             return
-        if self._config.enabled_interface_configs and (
-            ip_addr := await self._identify_ip_addr(port=tuple(self._config.enabled_interface_configs)[0].port)
-        ):
-            self._xml_rpc_callback_ip = ip_addr
-            self._listen_ip_addr = self._config.listen_ip_addr if self._config.listen_ip_addr else ip_addr
+        if self._config.profiler_duration:
+            self._profiler.start(duration=self._config.profiler_duration)
+        self._startup_timeline.start()
+        if self._config.enabled_interface_configs:
+            with self._startup_timeline.phase(name="identify_ip_addr"):
+                ip_addr = await self._identify_ip_addr(port=tuple(self._config.enabled_interface_configs)[0].port)
+            if ip_addr:
+                self._xml_rpc_callback_ip = ip_addr
+                self._listen_ip_addr = self._config.listen_ip_addr if self._config.listen_ip_addr else ip_addr
 
         listen_port: int = (
             self._config.listen_port
@@ -407,19 +574,23 @@ class CentralUnit(PayloadMixin):
             else self._config.callback_port or self._config.default_callback_port
         )
         try:
-            if (
-                xml_rpc_server := xmlrpc.create_xml_rpc_server(ip_addr=self._listen_ip_addr, port=listen_port)
-                if self._config.enable_server
-                else None
-            ):
-                self._xml_rpc_server = xml_rpc_server
-                self._listen_port = xml_rpc_server.listen_port
-                self._xml_rpc_server.add_central(self)
+            with self._startup_timeline.phase(name="start_xml_rpc_server"):
+                if (
+                    xml_rpc_server := xmlrpc.create_xml_rpc_server(ip_addr=self._listen_ip_addr, port=listen_port)
+                    if self._config.enable_server
+                    else None
+                ):
+                    self._xml_rpc_server = xml_rpc_server
+                    self._listen_port = xml_rpc_server.listen_port
+                    self._xml_rpc_server.add_central(self)
         except OSError as oserr:
             raise HaHomematicException(
                 f"START: Failed to start central unit {self.name}: {reduce_args(args=oserr.args)}"
             ) from oserr
 
+        await self._start_metrics_exporter()
+        self._looper.start_lag_sampling()
+
         if self._config.start_direct:
             if await self._create_clients():
                 for client in self._clients.values():
@@ -427,9 +598,11 @@ class CentralUnit(PayloadMixin):
         else:
             await self._start_clients()
             if self._config.enable_server:
-                self._start_scheduler()
+                with self._startup_timeline.phase(name="start_scheduler"):
+                    self._start_scheduler()
 
         self._started = True
+        self._startup_timeline.finish()
 
     async def stop(self) -> None:
         """Stop processing of the central unit."""
@@ -437,8 +610,14 @@ class CentralUnit(PayloadMixin):
             _LOGGER.debug("STOP: Central %s not started", self.name)
             return
         await self.save_caches(save_device_descriptions=True, save_paramset_descriptions=True)
+        await self._value_snapshot.save()
+        self._startup_timeline.stop()
         self._stop_scheduler()
         await self._stop_clients()
+        await self._stop_metrics_exporter()
+        self._looper.stop_lag_sampling()
+        if self._profiler.is_running:
+            await self._looper.async_add_executor_job(self._profiler.stop, name="stop-profiler")
         if self._json_rpc_client and self._json_rpc_client.is_activated:
             await self._json_rpc_client.logout()
             await self._json_rpc_client.stop()
@@ -459,12 +638,63 @@ class CentralUnit(PayloadMixin):
 
         # wait until tasks are finished
         await self.looper.block_till_done()
+        await self._looper.async_add_executor_job(self._traffic_recorder.close, name="close-traffic-recorder")
 
         DONE = asyncio.Event()
         while self._has_active_threads:
             await DONE.wait()
         self._started = False
 
+    async def _start_metrics_exporter(self) -> None:
+        """Start the prometheus exporter of the metrics, if configured."""
+        if self._config.metrics_port is None or self._metrics_exporter is not None:
+            return
+        metrics_exporter = MetricsExporter(registry=self._metrics, ip_addr=LOCAL_HOST, port=self._config.metrics_port)
+        try:
+            await metrics_exporter.start()
+        except OSError as oserr:
+            _LOGGER.warning(
+                "START_METRICS_EXPORTER: Unable to start metrics exporter for %s: %s",
+                self.name,
+                reduce_args(args=oserr.args),
+            )
+            return
+        self._metrics_exporter = metrics_exporter
+
+    async def _stop_metrics_exporter(self) -> None:
+        """Stop the prometheus exporter of the metrics."""
+        if self._metrics_exporter is not None:
+            await self._metrics_exporter.stop()
+            self._metrics_exporter = None
+
+    def _collect_metrics(self, metrics: MetricsRegistry) -> None:
+        """Update the gauges of the central. The memory gauges are updated by the scheduler, or by memory_report."""
+        metrics.gauge(name="devices", description="Number of devices").set(len(self._devices))
+        for interface_id, client in self._clients.items():
+            labels = {"interface_id": interface_id}
+            metrics.gauge(name="client_available", description="Availability of the clients", labels=labels).set(
+                int(client.available)
+            )
+            metrics.gauge(name="unconfirmed_writes", description="Number of unconfirmed writes", labels=labels).set(
+                client.last_value_send_cache.size
+            )
+
+    @staticmethod
+    def _set_memory_gauges(metrics: MetricsRegistry, report: MemoryReport) -> None:
+        """Update the memory gauges from a memory report."""
+        for subsystem, size in report.subsystems.items():
+            metrics.gauge(
+                name="memory_bytes", description="Approximate memory use by subsystem", labels={"subsystem": subsystem}
+            ).set(size)
+        for class_name, (count, size) in report.data_points.items():
+            labels = {"class": class_name}
+            metrics.gauge(name="data_points", description="Number of data points by class", labels=labels).set(count)
+            metrics.gauge(
+                name="data_point_memory_bytes",
+                description="Approximate memory use of data points by class",
+                labels=labels,
+            ).set(size)
+
     async def restart_clients(self) -> None:
         """Restart clients."""
         await self._stop_clients()
@@ -496,13 +726,16 @@ class CentralUnit(PayloadMixin):
     async def _refresh_device_descriptions(self, client: hmcl.Client, device_address: str | None = None) -> None:
         """Refresh device descriptions."""
         device_descriptions: tuple[DeviceDescription, ...] | None = None
-        if (
-            device_address
-            and (device_description := await client.get_device_description(device_address=device_address)) is not None
-        ):
-            device_descriptions = (device_description,)
-        else:
-            device_descriptions = await client.list_devices()
+        with self._startup_timeline.phase(name="list_devices", interface_id=client.interface_id) as phase:
+            if (
+                device_address
+                and (device_description := await client.get_device_description(device_address=device_address))
+                is not None
+            ):
+                device_descriptions = (device_description,)
+            else:
+                device_descriptions = await client.list_devices()
+            phase.count = len(device_descriptions) if device_descriptions else 0
 
         if device_descriptions:
             await self._add_new_devices(
@@ -513,11 +746,20 @@ class CentralUnit(PayloadMixin):
     async def _start_clients(self) -> None:
         """Start clients ."""
         if await self._create_clients():
-            await self._load_caches()
-            if new_device_addresses := self._check_for_new_device_addresses():
-                await self._create_devices(new_device_addresses=new_device_addresses)
-            await self._init_hub()
-            await self._init_clients()
+            with self._startup_timeline.phase(name="load_caches") as phase:
+                await self._load_caches()
+                new_device_addresses = self._check_for_new_device_addresses()
+                phase.count = sum(len(device_addresses) for device_addresses in new_device_addresses.values())
+            if new_device_addresses:
+                with self._startup_timeline.phase(name="create_devices") as phase:
+                    await self._create_devices(new_device_addresses=new_device_addresses)
+                    phase.count = len(self._devices)
+            with self._startup_timeline.phase(name="init_hub") as phase:
+                await self._init_hub()
+                phase.count = len(self._program_data_points) + len(self._sysvar_data_points)
+            with self._startup_timeline.phase(name="init_clients") as phase:
+                await self._init_clients()
+                phase.count = len(self._clients)
 
     async def _stop_clients(self) -> None:
         """Stop clients."""
@@ -543,26 +785,29 @@ class CentralUnit(PayloadMixin):
             )
             return False
 
-        # create primary clients
-        for interface_config in self._config.enabled_interface_configs:
-            if interface_config.interface in PRIMARY_CLIENT_CANDIDATE_INTERFACES:
-                await self._create_client(interface_config=interface_config)
-
-        # create secondary clients
-        for interface_config in self._config.enabled_interface_configs:
-            if interface_config.interface not in PRIMARY_CLIENT_CANDIDATE_INTERFACES:
-                if (
-                    self.primary_client is not None
-                    and interface_config.interface not in self.primary_client.system_information.available_interfaces
-                ):
-                    _LOGGER.warning(
-                        "CREATE_CLIENTS failed: Interface: %s is not available for backend %s",
-                        interface_config.interface,
-                        self.name,
-                    )
-                    interface_config.disable()
-                    continue
-                await self._create_client(interface_config=interface_config)
+        with self._startup_timeline.phase(name="create_clients") as phase:
+            # create primary clients
+            for interface_config in self._config.enabled_interface_configs:
+                if interface_config.interface in PRIMARY_CLIENT_CANDIDATE_INTERFACES:
+                    await self._create_client(interface_config=interface_config)
+
+            # create secondary clients
+            for interface_config in self._config.enabled_interface_configs:
+                if interface_config.interface not in PRIMARY_CLIENT_CANDIDATE_INTERFACES:
+                    if (
+                        self.primary_client is not None
+                        and interface_config.interface
+                        not in self.primary_client.system_information.available_interfaces
+                    ):
+                        _LOGGER.warning(
+                            "CREATE_CLIENTS failed: Interface: %s is not available for backend %s",
+                            interface_config.interface,
+                            self.name,
+                        )
+                        interface_config.disable()
+                        continue
+                    await self._create_client(interface_config=interface_config)
+            phase.count = len(self._clients)
 
         if self.has_all_enabled_clients:
             _LOGGER.debug(
@@ -585,16 +830,17 @@ class CentralUnit(PayloadMixin):
     async def _create_client(self, interface_config: hmcl.InterfaceConfig) -> None:
         """Create a client."""
         try:
-            if client := await hmcl.create_client(
-                central=self,
-                interface_config=interface_config,
-            ):
-                _LOGGER.debug(
-                    "CREATE_CLIENT: Adding client %s to %s",
-                    client.interface_id,
-                    self.name,
-                )
-                self._clients[client.interface_id] = client
+            with self._startup_timeline.phase(name="create_client", interface_id=interface_config.interface_id):
+                if client := await hmcl.create_client(
+                    central=self,
+                    interface_config=interface_config,
+                ):
+                    _LOGGER.debug(
+                        "CREATE_CLIENT: Adding client %s to %s",
+                        client.interface_id,
+                        self.name,
+                    )
+                    self._clients[client.interface_id] = client
         except BaseHomematicException as ex:
             self.fire_interface_event(
                 interface_id=interface_config.interface_id,
@@ -619,8 +865,13 @@ class CentralUnit(PayloadMixin):
                 )
                 del self._clients[client.interface_id]
                 continue
-            if await client.initialize_proxy() == ProxyInitState.INIT_SUCCESS:
-                _LOGGER.debug("INIT_CLIENTS: client %s initialized for %s", client.interface_id, self.name)
+            # The backend sends the devices by newDevices, after the proxy is initialized.
+            self._startup_timeline.add_pending_interface(interface_id=client.interface_id)
+            with self._startup_timeline.phase(name="init_client", interface_id=client.interface_id):
+                if await client.initialize_proxy() == ProxyInitState.INIT_SUCCESS:
+                    _LOGGER.debug("INIT_CLIENTS: client %s initialized for %s", client.interface_id, self.name)
+                else:
+                    self._startup_timeline.finish_interface(interface_id=client.interface_id)
 
     async def _de_init_clients(self) -> None:
         """De-init clients."""
@@ -738,14 +989,12 @@ class CentralUnit(PayloadMixin):
         registered: bool | None = None,
     ) -> tuple[CallbackDataPoint, ...]:
         """Return all externally registered data points."""
-        all_data_points: list[CallbackDataPoint] = []
-        for device in self._devices.values():
-            if interface and interface != device.interface:
-                continue
-            all_data_points.extend(
-                device.get_data_points(category=category, exclude_no_create=exclude_no_create, registered=registered)
-            )
-        return tuple(all_data_points)
+        return tuple(
+            data_point
+            for data_point in self._data_point_index.get_data_points(category=category, interface=interface)
+            if ((exclude_no_create and data_point.usage != DataPointUsage.NO_CREATE) or exclude_no_create is False)
+            and (registered is None or data_point.is_registered == registered)
+        )
 
     def get_readable_generic_data_points(
         self, paramset_key: ParamsetKey | None = None, interface: Interface | None = None
@@ -753,12 +1002,8 @@ class CentralUnit(PayloadMixin):
         """Return the readable generic data points."""
         return tuple(
             ge
-            for ge in self.get_data_points(interface=interface)
-            if (
-                isinstance(ge, GenericDataPoint)
-                and ge.is_readable
-                and ((paramset_key and ge.paramset_key == paramset_key) or paramset_key is None)
-            )
+            for ge in self._data_point_index.get_generic_data_points(paramset_key=paramset_key, interface=interface)
+            if ge.is_readable and ge.usage != DataPointUsage.NO_CREATE
         )
 
     def _get_primary_client(self) -> hmcl.Client | None:
@@ -772,12 +1017,16 @@ class CentralUnit(PayloadMixin):
     def get_hub_data_points(
         self, category: DataPointCategory | None = None, registered: bool | None = None
     ) -> tuple[GenericHubDataPoint, ...]:
-        """Return the program data points."""
-        return tuple(
-            he
-            for he in (self.program_data_points + self.sysvar_data_points)
-            if (category is None or he.category == category) and (registered is None or he.is_registered == registered)
-        )
+        """Return the hub data points."""
+        if category is None:
+            hub_data_points: tuple[GenericHubDataPoint, ...] = self.program_data_points + self.sysvar_data_points
+        elif (by_unique_id := self._hub_data_points_by_category.get(category)) is not None:
+            hub_data_points = tuple(by_unique_id.values())
+        else:
+            return ()
+        if registered is None:
+            return hub_data_points
+        return tuple(he for he in hub_data_points if he.is_registered == registered)
 
     def get_events(self, event_type: EventType, registered: bool | None = None) -> tuple[tuple[GenericEvent, ...], ...]:
         """Return all channel event data points."""
@@ -819,6 +1068,7 @@ class CentralUnit(PayloadMixin):
             await self._paramset_descriptions.load()
             await self._device_details.load()
             await self._data_cache.load()
+            await self._value_snapshot.load()
         except orjson.JSONDecodeError as ex:  # pragma: no cover
             _LOGGER.warning(
                 "LOAD_CACHES failed: Unable to load caches for %s: %s",
@@ -836,44 +1086,64 @@ class CentralUnit(PayloadMixin):
         _LOGGER.debug("CREATE_DEVICES: Starting to create devices for %s", self.name)
 
         new_devices = set[Device]()
+        restored_interfaces = set[Interface]()
 
         for interface_id, device_addresses in new_device_addresses.items():
-            for device_address in device_addresses:
-                # Do we check for duplicates here? For now, we do.
-                if device_address in self._devices:
-                    continue
-                device: Device | None = None
-                try:
-                    device = Device(
-                        central=self,
-                        interface_id=interface_id,
-                        device_address=device_address,
-                    )
-                except Exception as ex:  # pragma: no cover
-                    _LOGGER.error(
-                        "CREATE_DEVICES failed: %s [%s] Unable to create device: %s, %s",
-                        type(ex).__name__,
-                        reduce_args(args=ex.args),
-                        interface_id,
-                        device_address,
-                    )
-                try:
-                    if device:
-                        create_data_points_and_events(device=device)
-                        create_custom_data_points(device=device)
-                        await device.load_value_cache()
-                        new_devices.add(device)
-                        self._devices[device_address] = device
-                except Exception as ex:  # pragma: no cover
-                    _LOGGER.error(
-                        "CREATE_DEVICES failed: %s [%s] Unable to create data points: %s, %s",
-                        type(ex).__name__,
-                        reduce_args(args=ex.args),
-                        interface_id,
-                        device_address,
-                    )
+            with self._startup_timeline.phase(name="create_devices", interface_id=interface_id) as phase:
+                for device_address in device_addresses:
+                    # Do we check for duplicates here? For now, we do.
+                    if device_address in self._devices:
+                        continue
+                    device: Device | None = None
+                    try:
+                        device = Device(
+                            central=self,
+                            interface_id=interface_id,
+                            device_address=device_address,
+                        )
+                    except Exception as ex:  # pragma: no cover
+                        _LOGGER.error(
+                            "CREATE_DEVICES failed: %s [%s] Unable to create device: %s, %s",
+                            type(ex).__name__,
+                            reduce_args(args=ex.args),
+                            interface_id,
+                            device_address,
+                        )
+                    try:
+                        if device:
+                            create_data_points_and_events(device=device)
+                            create_custom_data_points(device=device)
+                            if self._value_snapshot.restore_device(device=device):
+                                restored_interfaces.add(device.interface)
+                                self.looper.create_task(
+                                    device.load_value_cache(),
+                                    name="revalidate-value-cache",
+                                    name_args=(device.address,),
+                                )
+                            else:
+                                await device.load_value_cache()
+                            new_devices.add(device)
+                            self._devices[device_address] = device
+                            self._data_point_index.add_device(device=device)
+                    except Exception as ex:  # pragma: no cover
+                        _LOGGER.error(
+                            "CREATE_DEVICES failed: %s [%s] Unable to create data points: %s, %s",
+                            type(ex).__name__,
+                            reduce_args(args=ex.args),
+                            interface_id,
+                            device_address,
+                        )
+                phase.count = len(device_addresses)
         _LOGGER.debug("CREATE_DEVICES: Finished creating devices for %s", self.name)
 
+        # Restored values are revalidated in the background.
+        for interface in restored_interfaces:
+            self.looper.create_task(
+                self.load_and_refresh_data_point_data(interface=interface, paramset_key=ParamsetKey.VALUES),
+                name="revalidate-values",
+                name_args=(interface,),
+            )
+
         if new_devices:
             new_dps = _get_new_data_points(new_devices=new_devices)
             new_channel_events = _get_new_channel_events(new_devices=new_devices)
@@ -913,6 +1183,7 @@ class CentralUnit(PayloadMixin):
     async def add_new_devices(self, interface_id: str, device_descriptions: tuple[DeviceDescription, ...]) -> None:
         """Add new devices to central unit."""
         await self._add_new_devices(interface_id=interface_id, device_descriptions=device_descriptions)
+        self._startup_timeline.finish_interface(interface_id=interface_id)
 
     @inspector(measure_performance=True)
     async def _add_new_devices(self, interface_id: str, device_descriptions: tuple[DeviceDescription, ...]) -> None:
@@ -946,26 +1217,31 @@ class CentralUnit(PayloadMixin):
             client = self._clients[interface_id]
             save_paramset_descriptions = False
             save_device_descriptions = False
-            for dev_desc in device_descriptions:
-                try:
-                    self._device_descriptions.add_device(interface_id=interface_id, device_description=dev_desc)
-                    save_device_descriptions = True
-                    if dev_desc["ADDRESS"] not in known_addresses:
-                        await client.fetch_paramset_descriptions(device_description=dev_desc)
-                        save_paramset_descriptions = True
-                except Exception as ex:  # pragma: no cover
-                    save_device_descriptions = False
-                    save_paramset_descriptions = False
-                    _LOGGER.error(
-                        "ADD_NEW_DEVICES failed: %s [%s]",
-                        type(ex).__name__,
-                        reduce_args(args=ex.args),
-                    )
+            with self._startup_timeline.phase(name="fetch_paramset_descriptions", interface_id=interface_id) as phase:
+                fetched = 0
+                for dev_desc in device_descriptions:
+                    try:
+                        self._device_descriptions.add_device(interface_id=interface_id, device_description=dev_desc)
+                        save_device_descriptions = True
+                        if dev_desc["ADDRESS"] not in known_addresses:
+                            await client.fetch_paramset_descriptions(device_description=dev_desc)
+                            save_paramset_descriptions = True
+                            fetched += 1
+                    except Exception as ex:  # pragma: no cover
+                        save_device_descriptions = False
+                        save_paramset_descriptions = False
+                        _LOGGER.error(
+                            "ADD_NEW_DEVICES failed: %s [%s]",
+                            type(ex).__name__,
+                            reduce_args(args=ex.args),
+                        )
+                phase.count = fetched
 
-            await self.save_caches(
-                save_device_descriptions=save_device_descriptions,
-                save_paramset_descriptions=save_paramset_descriptions,
-            )
+            with self._startup_timeline.phase(name="save_caches", interface_id=interface_id):
+                await self.save_caches(
+                    save_device_descriptions=save_device_descriptions,
+                    save_paramset_descriptions=save_paramset_descriptions,
+                )
             if new_device_addresses := self._check_for_new_device_addresses():
                 await self._device_details.load()
                 await self._data_cache.load()
@@ -1033,6 +1309,13 @@ class CentralUnit(PayloadMixin):
                     )
             return
 
+        # Pushed change of a system variable. The parameter contains the id of the system variable.
+        if channel_address == SYSVAR_ADDRESS:
+            if self._config.enable_sysvar_push:
+                self._last_sysvar_push = self._clock.monotonic()
+                self.sysvar_data_point_path_event(state_path=f"{SYSVAR_STATE_PATH_ROOT}/{parameter}", value=value)
+            return
+
         dpk = DataPointKey(
             interface_id=interface_id,
             channel_address=channel_address,
@@ -1042,7 +1325,8 @@ class CentralUnit(PayloadMixin):
 
         if dpk in self._data_point_key_event_subscriptions:
             try:
-                for callback_handler in self._data_point_key_event_subscriptions[dpk]:
+                # Iterate over a copy, because lazy data points replace their handler, when they are created.
+                for callback_handler in tuple(self._data_point_key_event_subscriptions[dpk]):
                     if callable(callback_handler):
                         await callback_handler(value)
             except RuntimeError as rte:  # pragma: no cover
@@ -1062,6 +1346,16 @@ class CentralUnit(PayloadMixin):
                     reduce_args(args=ex.args),
                 )
 
+        if self._pending_confirmations.is_pending(dpk=dpk):
+            # The send values are confirmed by the converted value, e.g. for string payloads of path events.
+            if (
+                data_point := self.get_generic_data_point(
+                    channel_address=channel_address, parameter=parameter, paramset_key=ParamsetKey.VALUES
+                )
+            ) is not None:
+                value = data_point.value
+            self._pending_confirmations.confirm(dpk=dpk, value=value)
+
     def data_point_path_event(self, state_path: str, value: str) -> None:
         """If a device emits some sort event, we will handle it here."""
         _LOGGER.debug(
@@ -1078,7 +1372,8 @@ class CentralUnit(PayloadMixin):
                     parameter=dpk.parameter,
                     value=value,
                 ),
-                name=f"device-data-point-event-{dpk.interface_id}-{dpk.channel_address}-{dpk.parameter}",
+                name="device-data-point-event",
+                name_args=(dpk.interface_id, dpk.channel_address, dpk.parameter),
             )
 
     def sysvar_data_point_path_event(self, state_path: str, value: str) -> None:
@@ -1093,7 +1388,9 @@ class CentralUnit(PayloadMixin):
             try:
                 callback_handler = self._sysvar_data_point_event_subscriptions[state_path]
                 if callable(callback_handler):
-                    self._looper.create_task(callback_handler(value), name=f"sysvar-data-point-event-{state_path}")
+                    self._looper.create_task(
+                        callback_handler(value), name="sysvar-data-point-event", name_args=(state_path,), merge=True
+                    )
             except RuntimeError as rte:  # pragma: no cover
                 _LOGGER.debug(
                     "EVENT: RuntimeError [%s]. Failed to call callback for: %s",
@@ -1114,9 +1411,9 @@ class CentralUnit(PayloadMixin):
         _LOGGER.debug("LIST_DEVICES: interface_id = %s, channel_count = %i", interface_id, len(result))
         return result
 
-    def add_event_subscription(self, data_point: BaseParameterDataPoint) -> None:
+    def add_event_subscription(self, data_point: BaseParameterDataPoint | LazyEvent) -> None:
         """Add data_point to central event subscription."""
-        if isinstance(data_point, (GenericDataPoint, GenericEvent)) and (
+        if isinstance(data_point, (GenericDataPoint, GenericEvent, LazyEvent)) and (
             data_point.is_readable or data_point.supports_events
         ):
             if data_point.dpk not in self._data_point_key_event_subscriptions:
@@ -1148,6 +1445,7 @@ class CentralUnit(PayloadMixin):
                 device.address,
             )
             return
+        self._data_point_index.remove_device(device=device)
         device.remove()
 
         self._device_descriptions.remove_device(device=device)
@@ -1155,21 +1453,36 @@ class CentralUnit(PayloadMixin):
         self._device_details.remove_device(device=device)
         del self._devices[device.address]
 
-    def remove_event_subscription(self, data_point: BaseParameterDataPoint) -> None:
+    def remove_event_subscription(self, data_point: BaseParameterDataPoint | LazyEvent) -> None:
         """Remove event subscription from central collections."""
-        if isinstance(data_point, (GenericDataPoint, GenericEvent)) and data_point.supports_events:
+        if isinstance(data_point, (GenericDataPoint, GenericEvent, LazyEvent)) and data_point.supports_events:
             if data_point.dpk in self._data_point_key_event_subscriptions:
                 del self._data_point_key_event_subscriptions[data_point.dpk]
             if data_point.state_path in self._data_point_path_event_subscriptions:
                 del self._data_point_path_event_subscriptions[data_point.state_path]
 
+    def remove_lazy_event_subscription(self, lazy_event: LazyEvent) -> None:
+        """Remove the event handler of a lazy event, before the event is created."""
+        if (
+            event_handlers := self._data_point_key_event_subscriptions.get(lazy_event.dpk)
+        ) is not None and lazy_event.event in event_handlers:
+            event_handlers.remove(lazy_event.event)
+
     def get_last_event_dt(self, interface_id: str) -> datetime | None:
         """Return the last event dt."""
-        return self._last_events.get(interface_id)
+        if (last_event := self._last_events.get(interface_id)) is None:
+            return None
+        return self._clock.to_datetime(monotonic_time=last_event)
+
+    def get_seconds_since_last_event(self, interface_id: str) -> float | None:
+        """Return the seconds since the last event by the monotonic clock."""
+        if (last_event := self._last_events.get(interface_id)) is None:
+            return None
+        return self._clock.monotonic() - last_event
 
     def set_last_event_dt(self, interface_id: str) -> None:
         """Set the last event dt."""
-        self._last_events[interface_id] = datetime.now()
+        self._last_events[interface_id] = self._clock.monotonic()
 
     async def execute_program(self, pid: str) -> bool:
         """Execute a program on CCU / Homegear."""
@@ -1307,9 +1620,7 @@ class CentralUnit(PayloadMixin):
         if vid and (sysvar := self._sysvar_data_points.get(vid)):
             return sysvar
         if legacy_name:
-            for sysvar in self._sysvar_data_points.values():
-                if sysvar.legacy_name == legacy_name:
-                    return sysvar
+            return self._sysvar_data_points_by_legacy_name.get(legacy_name)
         return None
 
     def get_program_data_point(self, pid: str | None = None, legacy_name: str | None = None) -> ProgramDpType | None:
@@ -1317,9 +1628,7 @@ class CentralUnit(PayloadMixin):
         if pid and (program := self._program_data_points.get(pid)):
             return program
         if legacy_name:
-            for program in self._program_data_points.values():
-                if legacy_name in (program.button.legacy_name, program.switch.legacy_name):
-                    return program
+            return self._program_data_points_by_legacy_name.get(legacy_name)
         return None
 
     def get_data_point_path(self) -> tuple[str, ...]:
@@ -1373,6 +1682,7 @@ class CentralUnit(PayloadMixin):
         await self._paramset_descriptions.clear()
         self._device_details.clear()
         self._data_cache.clear()
+        await self._value_snapshot.clear()
 
     def register_homematic_callback(self, cb: Callable) -> CALLBACK_TYPE:
         """Register ha_event callback in central."""
@@ -1473,8 +1783,10 @@ class _Scheduler(threading.Thread):
         threading.Thread.__init__(self, name=f"ConnectionChecker for {central.name}")
         self._central: Final = central
         self._active = True
+        self._sysvar_refreshed_at: float = INIT_MONOTONIC
         self._scheduler_jobs = [
             _SchedulerJob(task=self._check_connection, run_interval=CONNECTION_CHECKER_INTERVAL),
+            _SchedulerJob(task=self._cleanup_command_caches, run_interval=COMMAND_CACHE_CLEANUP_INTERVAL),
             _SchedulerJob(
                 task=self._refresh_client_data,
                 run_interval=self._central.config.periodic_refresh_interval,
@@ -1497,6 +1809,11 @@ class _Scheduler(threading.Thread):
                 run_interval=DEVICE_FIRMWARE_UPDATING_CHECK_INTERVAL,
             ),
         ]
+        if self._central.config.enable_memory_report:
+            # The deep size estimation runs in the event loop, so it is opt-in.
+            self._scheduler_jobs.append(
+                _SchedulerJob(task=self._update_memory_report, run_interval=MEMORY_REPORT_INTERVAL)
+            )
 
     def run(self) -> None:
         """Run the scheduler thread."""
@@ -1564,6 +1881,22 @@ class _Scheduler(threading.Thread):
                 reduce_args(args=ex.args),
             )
 
+    @inspector(re_raise=False)
+    async def _cleanup_command_caches(self) -> None:
+        """Remove expired send commands from the command caches."""
+        for client in self._central.clients:
+            if expired := client.last_value_send_cache.cleanup(max_age=LAST_COMMAND_SEND_STORE_TIMEOUT):
+                _LOGGER.debug(
+                    "CLEANUP_COMMAND_CACHES: Removed %i unconfirmed send commands for %s",
+                    expired,
+                    client.interface_id,
+                )
+
+    @inspector(re_raise=False)
+    async def _update_memory_report(self) -> None:
+        """Update the memory gauges of the metrics."""
+        self._central.memory_report()
+
     @inspector(re_raise=False)
     async def _refresh_client_data(self) -> None:
         """Refresh client data."""
@@ -1581,6 +1914,16 @@ class _Scheduler(threading.Thread):
         """Refresh system variables."""
         if not self._central.config.enable_sysvar_scan or not self._central.available:
             return
+        # While changes are pushed, system variables are only polled as safety net, if configured.
+        if (
+            (push_scan_interval := self._central.config.sysvar_push_scan_interval) is not None
+            and self._central.is_sysvar_push_active
+            and self._central.clock.changed_within_seconds(
+                monotonic_time=self._sysvar_refreshed_at, max_age=push_scan_interval
+            )
+        ):
+            return
+        self._sysvar_refreshed_at = self._central.clock.monotonic()
 
         _LOGGER.debug("REFRESH_SYSVAR_DATA: For %s", self._central.name)
         await self._central.fetch_sysvar_data(scheduled=True)
@@ -1649,11 +1992,11 @@ class _SchedulerJob:
         self,
         task: Callable,
         run_interval: int,
-        next_run: datetime = datetime.now(),
+        next_run: datetime | None = None,
     ):
         """Init the job."""
         self._task: Final = task
-        self._next_run = next_run
+        self._next_run = next_run or datetime.now()
         self._run_interval: Final = run_interval
 
     @property
@@ -1686,23 +2029,37 @@ class CentralConfig:
         client_session: ClientSession | None = None,
         callback_host: str | None = None,
         callback_port: int | None = None,
+        clock: Clock | None = None,
         enable_device_firmware_check: bool = DEFAULT_ENABLE_DEVICE_FIRMWARE_CHECK,
+        enable_event_tracing: bool = DEFAULT_ENABLE_EVENT_TRACING,
+        enable_memory_report: bool = DEFAULT_ENABLE_MEMORY_REPORT,
         enable_program_scan: bool = DEFAULT_ENABLE_PROGRAM_SCAN,
+        enable_sysvar_push: bool = DEFAULT_ENABLE_SYSVAR_PUSH,
         enable_sysvar_scan: bool = DEFAULT_ENABLE_SYSVAR_SCAN,
+        enable_traffic_capture: bool = DEFAULT_ENABLE_TRAFFIC_CAPTURE,
+        enable_value_snapshot: bool = DEFAULT_ENABLE_VALUE_SNAPSHOT,
+        event_trace_log_sample_rate: float = DEFAULT_EVENT_TRACE_LOG_SAMPLE_RATE,
         ignore_custom_device_definition_models: tuple[str, ...] = DEFAULT_IGNORE_CUSTOM_DEVICE_DEFINITION_MODELS,
         interfaces_requiring_periodic_refresh: tuple[Interface, ...] = INTERFACES_REQUIRING_PERIODIC_REFRESH,
         json_port: int | None = None,
+        json_rpc_concurrency_limits: Mapping[str, int] | None = None,
+        lazy_device_error_events: bool = DEFAULT_LAZY_DEVICE_ERROR_EVENTS,
         listen_ip_addr: str | None = None,
         listen_port: int | None = None,
         max_read_workers: int = DEFAULT_MAX_READ_WORKERS,
+        metrics_port: int | None = DEFAULT_METRICS_PORT,
         periodic_refresh_interval: int = DEFAULT_PERIODIC_REFRESH_INTERVAL,
+        profiler_duration: float | None = DEFAULT_PROFILER_DURATION,
         program_markers: tuple[DescriptionMarker | str, ...] = DEFAULT_PROGRAM_MARKERS,
         start_direct: bool = False,
         sys_scan_interval: int = DEFAULT_SYS_SCAN_INTERVAL,
         sysvar_markers: tuple[DescriptionMarker | str, ...] = DEFAULT_SYSVAR_MARKERS,
+        sysvar_push_scan_interval: int | None = DEFAULT_SYSVAR_PUSH_SCAN_INTERVAL,
+        task_limits: Mapping[str, int] | None = None,
         tls: bool = DEFAULT_TLS,
         un_ignore_list: tuple[str, ...] = DEFAULT_UN_IGNORES,
         verify_tls: bool = DEFAULT_VERIFY_TLS,
+        write_coalescing_window: float | None = DEFAULT_WRITE_COALESCING_WINDOW,
     ) -> None:
         """Init the client config."""
         self._interface_configs: Final = interface_configs
@@ -1710,29 +2067,43 @@ class CentralConfig:
         self.callback_port: Final = callback_port
         self.central_id: Final = central_id
         self.client_session: Final = client_session
+        self.clock: Final = clock
         self.default_callback_port: Final = default_callback_port
         self.enable_device_firmware_check: Final = enable_device_firmware_check
+        self.enable_event_tracing: Final = enable_event_tracing
+        self.enable_memory_report: Final = enable_memory_report
         self.enable_program_scan: Final = enable_program_scan
+        self.enable_sysvar_push: Final = enable_sysvar_push
         self.enable_sysvar_scan: Final = enable_sysvar_scan
+        self.enable_traffic_capture: Final = enable_traffic_capture
+        self.enable_value_snapshot: Final = enable_value_snapshot
+        self.event_trace_log_sample_rate: Final = event_trace_log_sample_rate
         self.host: Final = host
         self.ignore_custom_device_definition_models: Final = ignore_custom_device_definition_models
         self.interfaces_requiring_periodic_refresh: Final = interfaces_requiring_periodic_refresh
         self.json_port: Final = json_port
+        self.json_rpc_concurrency_limits: Final = json_rpc_concurrency_limits
+        self.lazy_device_error_events: Final = lazy_device_error_events
         self.listen_ip_addr: Final = listen_ip_addr
         self.listen_port: Final = listen_port
         self.max_read_workers = max_read_workers
+        self.metrics_port: Final = metrics_port
         self.name: Final = name
         self.password: Final = password
         self.periodic_refresh_interval = periodic_refresh_interval
+        self.profiler_duration: Final = profiler_duration
         self.program_markers: Final = program_markers
         self.start_direct: Final = start_direct
         self.storage_folder: Final = storage_folder
         self.sys_scan_interval: Final = sys_scan_interval
         self.sysvar_markers: Final = sysvar_markers
+        self.sysvar_push_scan_interval: Final = sysvar_push_scan_interval
+        self.task_limits: Final = task_limits
         self.tls: Final = tls
         self.un_ignore_list: Final = un_ignore_list
         self.username: Final = username
         self.verify_tls: Final = verify_tls
+        self.write_coalescing_window: Final = write_coalescing_window
 
     @property
     def enable_server(self) -> bool:
@@ -1796,8 +2167,11 @@ class CentralConfig:
             device_url=central.url,
             connection_state=central.connection_state,
             client_session=self.client_session,
+            metrics=central.metrics,
+            recorder=central.traffic_recorder,
             tls=self.tls,
             verify_tls=self.verify_tls,
+            concurrency_limits=self.json_rpc_concurrency_limits,
         )
 
 
@@ -0,0 +1,112 @@
+"""Registry for send values, that are waiting for a confirmation by the backend."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+import logging
+from time import monotonic
+from typing import Any, Final
+
+from hahomematic.const import DP_KEY_VALUE, DataPointKey
+from hahomematic.metrics import LatencyHistogram
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+class PendingConfirmationRegistry:
+    """
+    Registry for send values, that are waiting for a confirmation event.
+
+    The registry is checked by the central for every received data point event,
+    so waiters are resolved without registering callbacks on the data points.
+    """
+
+    def __init__(self) -> None:
+        """Init the registry."""
+        self._pending: Final[dict[DataPointKey, list[_PendingConfirmation]]] = {}
+        self._latency: Final = LatencyHistogram()
+        self._timeout_count = 0
+
+    @property
+    def latency(self) -> LatencyHistogram:
+        """Return the histogram of the confirmation latencies."""
+        return self._latency
+
+    @property
+    def pending_count(self) -> int:
+        """Return the number of pending confirmations."""
+        return sum(len(pending) for pending in self._pending.values())
+
+    @property
+    def timeout_count(self) -> int:
+        """Return the number of confirmations, that timed out."""
+        return self._timeout_count
+
+    def is_pending(self, dpk: DataPointKey) -> bool:
+        """Return if a confirmation is pending for the data point key."""
+        return dpk in self._pending
+
+    async def wait_for_confirmation(self, dpk_values: Iterable[DP_KEY_VALUE], max_wait: float) -> bool:
+        """Wait until all send values are confirmed or the timeout is reached. Return if all were confirmed."""
+        loop = asyncio.get_running_loop()
+        waiters: list[_PendingConfirmation] = []
+        for dpk, value in dpk_values:
+            waiter = _PendingConfirmation(dpk=dpk, value=value, future=loop.create_future())
+            self._pending.setdefault(dpk, []).append(waiter)
+            waiters.append(waiter)
+        if not waiters:
+            return True
+        try:
+            _, not_done = await asyncio.wait([waiter.future for waiter in waiters], timeout=max_wait)
+        finally:
+            for waiter in waiters:
+                self._remove(waiter=waiter)
+        if not_done:
+            self._timeout_count += len(not_done)
+            for waiter in waiters:
+                if waiter.future in not_done:
+                    waiter.future.cancel()
+                    _LOGGER.debug(
+                        "WAIT_FOR_CONFIRMATION: Timeout waiting for event %s with value %s",
+                        waiter.dpk,
+                        waiter.value,
+                    )
+            return False
+        return True
+
+    def confirm(self, dpk: DataPointKey, value: Any) -> None:
+        """Resolve all waiters of the data point key, that wait for the value."""
+        if (waiters := self._pending.get(dpk)) is None:
+            return
+        for waiter in waiters:
+            if not waiter.future.done() and _is_close(value1=waiter.value, value2=value):
+                self._latency.observe(monotonic() - waiter.send_at)
+                waiter.future.set_result(value)
+                _LOGGER.debug("WAIT_FOR_CONFIRMATION: Finished event %s with value %s", dpk, value)
+
+    def _remove(self, waiter: _PendingConfirmation) -> None:
+        """Remove a waiter from the registry."""
+        if (waiters := self._pending.get(waiter.dpk)) is None:
+            return
+        waiters.remove(waiter)
+        if not waiters:
+            del self._pending[waiter.dpk]
+
+
+class _PendingConfirmation:
+    """A send value, that waits for a confirmation."""
+
+    def __init__(self, dpk: DataPointKey, value: Any, future: asyncio.Future[Any]) -> None:
+        """Init the pending confirmation."""
+        self.dpk: Final = dpk
+        self.value: Final = value
+        self.future: Final = future
+        self.send_at: Final = monotonic()
+
+
+def _is_close(value1: Any, value2: Any) -> bool:
+    """Check if the both values are close to each other."""
+    if isinstance(value1, float) and isinstance(value2, int | float):
+        return bool(round(value1, 2) == round(value2, 2))
+    return bool(value1 == value2)
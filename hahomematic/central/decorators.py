@@ -4,16 +4,17 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Awaitable, Callable
-from datetime import datetime
+from contextlib import nullcontext
 from functools import wraps
 import logging
 from typing import Any, Final, cast
 
 from hahomematic import central as hmcu, client as hmcl
 from hahomematic.central import xml_rpc_server as xmlrpc
-from hahomematic.const import BackendSystemEvent
+from hahomematic.const import BackendSystemEvent, EventTraceStage
 from hahomematic.exceptions import HaHomematicException
 from hahomematic.support import reduce_args
+from hahomematic.tracing import stamp_event_trace
 
 _LOGGER: Final = logging.getLogger(__name__)
 _INTERFACE_ID: Final = "interface_id"
@@ -66,7 +67,7 @@ def callback_backend_system(system_event: BackendSystemEvent) -> Callable:
                 args = args[1:]
                 interface_id: str = args[0] if len(args) > 0 else str(kwargs[_INTERFACE_ID])
                 if client := hmcl.get_client(interface_id=interface_id):
-                    client.modified_at = datetime.now()
+                    client.set_modified_at()
                     client.central.fire_backend_system_callback(system_event=system_event, **kwargs)
             except Exception as ex:  # pragma: no cover
                 _LOGGER.warning(
@@ -91,9 +92,17 @@ def callback_event[**_P, _R](
     @wraps(func)
     async def async_wrapper_event_callback(*args: _P.args, **kwargs: _P.kwargs) -> _R:
         """Wrap callback events."""
-        return_value = cast(_R, await func(*args, **kwargs))  # type: ignore[misc]
-        _exec_event_callback(*args, **kwargs)
-        return return_value
+        # All timestamps of the event are based on a single read of the clock.
+        central = args[0]
+        with central.clock.event_time() if isinstance(central, hmcu.CentralUnit) else nullcontext():
+            stamp_event_trace(EventTraceStage.DISPATCHED)
+            try:
+                return_value = cast(_R, await func(*args, **kwargs))  # type: ignore[misc]
+                _exec_event_callback(*args, **kwargs)
+            finally:
+                if isinstance(central, hmcu.CentralUnit):
+                    central.event_tracer.finish()
+            return return_value
 
     def _exec_event_callback(*args: Any, **kwargs: Any) -> None:
         """Execute the callback for a data_point event."""
@@ -101,7 +110,7 @@ def callback_event[**_P, _R](
             args = args[1:]
             interface_id: str = args[0] if len(args) > 1 else str(kwargs[_INTERFACE_ID])
             if client := hmcl.get_client(interface_id=interface_id):
-                client.modified_at = datetime.now()
+                client.set_modified_at()
                 client.central.fire_backend_parameter_callback(*args, **kwargs)
         except Exception as ex:  # pragma: no cover
             _LOGGER.warning("EXEC_DATA_POINT_EVENT_CALLBACK failed: Unable to reduce kwargs for event_callback")
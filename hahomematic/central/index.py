@@ -0,0 +1,86 @@
+"""Index of the data points of the devices registered in the central."""
+
+from __future__ import annotations
+
+from typing import Final
+
+from hahomematic.const import DataPointCategory, Interface, ParamsetKey
+from hahomematic.model.data_point import CallbackDataPoint
+from hahomematic.model.device import Device
+from hahomematic.model.generic import GenericDataPoint
+
+
+class DataPointIndex:
+    """
+    Index data points by interface, category and paramset_key.
+
+    The index is maintained when devices are added to or removed from the central,
+    so queries are proportional to the size of the selected bucket.
+    Usage and registration can change at runtime and are filtered at query time.
+    """
+
+    def __init__(self) -> None:
+        """Init the data point index."""
+        # {interface, {category, {data_point, None}}}
+        self._data_points: Final[dict[Interface, dict[DataPointCategory, dict[CallbackDataPoint, None]]]] = {}
+        # {(interface, paramset_key), {generic_data_point, None}}
+        self._generic_data_points: Final[dict[tuple[Interface, ParamsetKey], dict[GenericDataPoint, None]]] = {}
+
+    def add_device(self, device: Device) -> None:
+        """Add the data points of a device to the index."""
+        for data_point in device.get_data_points(exclude_no_create=False):
+            self.add_data_point(interface=device.interface, data_point=data_point)
+
+    def add_data_point(self, interface: Interface, data_point: CallbackDataPoint) -> None:
+        """Add a data point to the index."""
+        self._data_points.setdefault(interface, {}).setdefault(data_point.category, {})[data_point] = None
+        if isinstance(data_point, GenericDataPoint):
+            self._generic_data_points.setdefault((interface, data_point.paramset_key), {})[data_point] = None
+
+    def remove_device(self, device: Device) -> None:
+        """Remove the data points of a device from the index."""
+        for data_point in device.get_data_points(exclude_no_create=False):
+            if (by_category := self._data_points.get(device.interface)) is not None and (
+                data_points := by_category.get(data_point.category)
+            ) is not None:
+                data_points.pop(data_point, None)
+            if (
+                isinstance(data_point, GenericDataPoint)
+                and (generic_data_points := self._generic_data_points.get((device.interface, data_point.paramset_key)))
+                is not None
+            ):
+                generic_data_points.pop(data_point, None)
+
+    def get_data_points(
+        self,
+        category: DataPointCategory | None = None,
+        interface: Interface | None = None,
+    ) -> tuple[CallbackDataPoint, ...]:
+        """Return the indexed data points of the category and interface."""
+        by_categories = (
+            tuple(self._data_points.values())
+            if interface is None
+            else ((by_category,) if (by_category := self._data_points.get(interface)) is not None else ())
+        )
+        data_points: list[CallbackDataPoint] = []
+        for by_category in by_categories:
+            if category is None:
+                for category_data_points in by_category.values():
+                    data_points.extend(category_data_points)
+            elif (data_points_of_category := by_category.get(category)) is not None:
+                data_points.extend(data_points_of_category)
+        return tuple(data_points)
+
+    def get_generic_data_points(
+        self,
+        paramset_key: ParamsetKey | None = None,
+        interface: Interface | None = None,
+    ) -> tuple[GenericDataPoint, ...]:
+        """Return the indexed generic data points of the paramset_key and interface."""
+        generic_data_points: list[GenericDataPoint] = []
+        for (dp_interface, dp_paramset_key), data_points in self._generic_data_points.items():
+            if (interface is None or dp_interface == interface) and (
+                paramset_key is None or dp_paramset_key == paramset_key
+            ):
+                generic_data_points.extend(data_points)
+        return tuple(generic_data_points)
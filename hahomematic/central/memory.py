@@ -0,0 +1,202 @@
+"""Approximate memory accounting of a central by subsystem."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Collection, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from enum import Enum
+from functools import partial
+from itertools import islice
+import logging
+import sys
+import threading
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any, Final
+
+from hahomematic import central as hmcu, client as hmcl
+from hahomematic.async_support import Looper
+from hahomematic.const import MEMORY_SAMPLE_SIZE
+from hahomematic.metrics import MetricsRegistry
+from hahomematic.model.data_point import CallbackDataPoint
+from hahomematic.model.device import Channel, Device
+from hahomematic.model.lazy import LazyEvent
+
+__all__ = ["DeepSizeEstimator", "MemoryReport", "create_memory_report"]
+
+# Shared objects, that are not owned by a subsystem.
+_SHARED_TYPES: Final = (
+    type,
+    ModuleType,
+    FunctionType,
+    BuiltinFunctionType,
+    Enum,
+    asyncio.AbstractEventLoop,
+    logging.Logger,
+    type(threading.Lock()),
+)
+# Values without references to other objects, and callables, that are counted without the objects they are bound to.
+_LEAF_TYPES: Final = (str, bytes, bytearray, int, float, complex, bool, type(None), MethodType, partial)
+
+
+class DeepSizeEstimator:
+    """
+    Estimate the deep size of objects.
+
+    Containers with more items than the sample size are estimated by a sample of their items.
+    Objects of the boundary types are only counted, when they are passed as root,
+    so the objects of the model are not counted by the objects, that refer to them.
+    Every object is counted once per estimator.
+    """
+
+    def __init__(self, sample_size: int = MEMORY_SAMPLE_SIZE, boundary_types: tuple[type, ...] = ()) -> None:
+        """Init the deep size estimator."""
+        self._sample_size: Final = sample_size
+        self._boundary_types: Final = boundary_types
+        self._seen: Final[set[int]] = set()
+
+    def exclude(self, objects: Iterable[Any]) -> None:
+        """Exclude objects from the estimation, e.g. objects of a cache, that is counted by sampling."""
+        self._seen.update(id(obj) for obj in objects)
+
+    def get_size(self, obj: Any) -> int:
+        """Return the estimated deep size of an object in bytes."""
+        return self._get_size(obj=obj, root=True)
+
+    def get_sampled_size(self, objects: Sequence[Any]) -> int:
+        """Return the estimated deep size of the objects, that is extrapolated from a sample."""
+        if not objects:
+            return 0
+        sample = _get_sample(objects, count=len(objects), sample_size=self._sample_size)
+        return _extrapolate(sizes=[self._get_size(obj=obj, root=True) for obj in sample], count=len(objects))
+
+    def _get_size(self, obj: Any, root: bool = False) -> int:
+        """Return the deep size of an object."""
+        if (obj_id := id(obj)) in self._seen or isinstance(obj, _SHARED_TYPES):
+            return 0
+        if not root and isinstance(obj, self._boundary_types):
+            return 0
+        self._seen.add(obj_id)
+        size = sys.getsizeof(obj, 0)
+        if isinstance(obj, _LEAF_TYPES):
+            return size
+        if isinstance(obj, Mapping):
+            return size + self._get_items_size(
+                items=obj, count=len(obj), get_size=lambda key: self._get_size(key) + self._get_size(obj[key])
+            )
+        if isinstance(obj, Collection):
+            return size + self._get_items_size(items=obj, count=len(obj), get_size=self._get_size)
+        if hasattr(obj, "__dict__"):
+            size += self._get_size(vars(obj))
+        for cls in type(obj).__mro__:
+            for slot in getattr(cls, "__slots__", ()):
+                if slot not in ("__dict__", "__weakref__") and hasattr(obj, slot):
+                    size += self._get_size(getattr(obj, slot))
+        return size
+
+    def _get_items_size(self, items: Iterable[Any], count: int, get_size: Any) -> int:
+        """Return the size of the items of a container, that is extrapolated from a sample."""
+        if count == 0:
+            return 0
+        sample = _get_sample(items, count=count, sample_size=self._sample_size)
+        return _extrapolate(sizes=[get_size(item) for item in sample], count=count)
+
+
+@dataclass(slots=True)
+class MemoryReport:
+    """Approximate memory use of a central in bytes."""
+
+    # {subsystem, bytes}
+    subsystems: dict[str, int] = field(default_factory=dict)
+    # {class name, (count, bytes)}
+    data_points: dict[str, tuple[int, int]] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        """Return the total of all subsystems."""
+        return sum(self.subsystems.values())
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the report as dict."""
+        return {
+            "total": self.total,
+            "subsystems": dict(self.subsystems),
+            "data_points": {name: {"count": count, "bytes": size} for name, (count, size) in self.data_points.items()},
+        }
+
+
+def create_memory_report(central: hmcu.CentralUnit, sample_size: int = MEMORY_SAMPLE_SIZE) -> MemoryReport:
+    """Create a memory report of the central."""
+    # pylint: disable=protected-access
+    estimator = DeepSizeEstimator(
+        sample_size=sample_size,
+        boundary_types=(
+            hmcu.CentralUnit,
+            hmcl.Client,
+            Device,
+            Channel,
+            CallbackDataPoint,
+            LazyEvent,
+            Looper,
+            MetricsRegistry,
+        ),
+    )
+    devices = tuple(central._devices.values())
+    channels = tuple(channel for device in devices for channel in device.channels.values())
+    report = MemoryReport()
+    report.subsystems["device_descriptions"] = estimator.get_size(central._device_descriptions)
+    # The devices and channels refer to their descriptions in the cache.
+    estimator.exclude((*(device._description for device in devices), *(channel.description for channel in channels)))
+    report.subsystems["paramset_descriptions"] = estimator.get_size(central._paramset_descriptions)
+    report.subsystems["device_details"] = estimator.get_size(central._device_details)
+    report.subsystems["data_cache"] = estimator.get_size(central._data_cache)
+    report.subsystems["parameter_visibility"] = estimator.get_size(central._parameter_visibility)
+    report.subsystems["device_value_caches"] = estimator.get_sampled_size(
+        tuple(device.value_cache for device in devices)
+    )
+    report.subsystems["devices"] = estimator.get_sampled_size(devices) + estimator.get_sampled_size(channels)
+    report.subsystems["callbacks"] = sum(
+        estimator.get_size(registrations)
+        for registrations in (
+            central._data_point_key_event_subscriptions,
+            central._data_point_path_event_subscriptions,
+            central._sysvar_data_point_event_subscriptions,
+            central._backend_system_callbacks,
+            central._backend_parameter_callbacks,
+            central._homematic_callbacks,
+        )
+    )
+
+    # {class name, data points}
+    data_points_by_class: dict[str, list[Any]] = {}
+    for data_point in (
+        *(device.update_data_point for device in devices if device.update_data_point),
+        *(data_point for channel in channels for data_point in channel.get_data_points(exclude_no_create=False)),
+        *(event for channel in channels for event in channel.generic_events),
+        *(lazy_event for channel in channels for lazy_event in channel.lazy_events),
+        *central.program_data_points,
+        *central.sysvar_data_points,
+    ):
+        data_points_by_class.setdefault(type(data_point).__name__, []).append(data_point)
+    for name, data_points in sorted(data_points_by_class.items()):
+        report.data_points[name] = (len(data_points), estimator.get_sampled_size(data_points))
+    report.subsystems["data_points"] = sum(size for _, size in report.data_points.values())
+    return report
+
+
+def _get_sample(items: Iterable[Any], count: int, sample_size: int) -> list[Any]:
+    """Return an evenly distributed sample of the items."""
+    step = max(1, count // sample_size)
+    return list(islice(items, 0, None, step))[:sample_size]
+
+
+def _extrapolate(sizes: list[int], count: int) -> int:
+    """
+    Return the extrapolated size of all items from the sizes of a sample.
+
+    The first item of the sample also carries the objects, that are shared with the other items,
+    so it is not extrapolated.
+    """
+    if len(sizes) < 2 or len(sizes) >= count:
+        return sum(sizes)
+    return sizes[0] + int(sum(sizes[1:]) * (count - 1) / (len(sizes) - 1))
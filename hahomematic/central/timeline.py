@@ -0,0 +1,137 @@
+"""Timeline of the phases of the startup of a central."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+import logging
+from time import monotonic
+from typing import Any, Final
+
+__all__ = ["StartupPhase", "StartupTimeline"]
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class StartupPhase:
+    """A timed phase of the startup. Phases with an interface_id break down a phase by interface."""
+
+    name: str
+    interface_id: str | None = None
+    # Seconds since the start of the startup.
+    started_at: float = 0.0
+    duration: float = 0.0
+    # Number of items, that were handled by the phase (e.g. devices or clients).
+    count: int | None = None
+
+
+class StartupTimeline:
+    """
+    Record the duration and item count of the phases of the startup.
+
+    The startup is finished, when the central is started, and the initial device creation
+    of all pending interfaces is done. The devices of an interface are created after the start,
+    if the backend sends them by newDevices.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Init the startup timeline."""
+        self._name: Final = name
+        self._phases: Final[list[StartupPhase]] = []
+        self._pending_interface_ids: Final[set[str]] = set()
+        self._started_at: float | None = None
+        self._start_finished = False
+        self._duration: float | None = None
+
+    @property
+    def duration(self) -> float | None:
+        """Return the duration of the startup, if it is finished."""
+        return self._duration
+
+    @property
+    def is_recording(self) -> bool:
+        """Return if the startup is running."""
+        return self._started_at is not None and self._duration is None
+
+    @property
+    def pending_interface_ids(self) -> tuple[str, ...]:
+        """Return the interfaces, whose initial device creation is pending."""
+        return tuple(self._pending_interface_ids)
+
+    @property
+    def phases(self) -> tuple[StartupPhase, ...]:
+        """Return the recorded phases in the order they were started."""
+        return tuple(self._phases)
+
+    def start(self) -> None:
+        """Start the recording of a startup."""
+        self._phases.clear()
+        self._pending_interface_ids.clear()
+        self._started_at = monotonic()
+        self._start_finished = False
+        self._duration = None
+
+    def add_pending_interface(self, interface_id: str) -> None:
+        """Keep recording until the initial device creation of the interface is done."""
+        if self.is_recording:
+            self._pending_interface_ids.add(interface_id)
+
+    def finish_interface(self, interface_id: str) -> None:
+        """Finish the initial device creation of the interface."""
+        if interface_id not in self._pending_interface_ids:
+            return
+        self._pending_interface_ids.discard(interface_id)
+        if self._start_finished and not self._pending_interface_ids:
+            self._complete()
+
+    @contextmanager
+    def phase(self, name: str, interface_id: str | None = None) -> Iterator[StartupPhase]:
+        """Time a phase of the startup. The count of the yielded phase can be set within the context."""
+        phase = StartupPhase(name=name, interface_id=interface_id)
+        if not self.is_recording or self._started_at is None:
+            yield phase
+            return
+        start = monotonic()
+        phase.started_at = start - self._started_at
+        self._phases.append(phase)
+        try:
+            yield phase
+        finally:
+            phase.duration = monotonic() - start
+
+    def finish(self) -> None:
+        """Finish the start of the central. The timeline is logged, when no interface is pending."""
+        if not self.is_recording:
+            return
+        self._start_finished = True
+        if not self._pending_interface_ids:
+            self._complete()
+
+    def stop(self) -> None:
+        """Stop the recording of the startup, e.g. if the central is stopped before the startup is finished."""
+        self._pending_interface_ids.clear()
+        if self.is_recording and self._start_finished:
+            self._complete()
+
+    def _complete(self) -> None:
+        """Complete the recording of the startup, and log the timeline."""
+        if self._started_at is None:
+            return
+        self._duration = monotonic() - self._started_at
+        _LOGGER.info("STARTUP_TIMELINE: %s", self)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the timeline as dict."""
+        return {"duration": self._duration, "phases": [asdict(phase) for phase in self._phases]}
+
+    def __str__(self) -> str:
+        """Provide some useful information."""
+        phases = ", ".join(
+            f"{phase.name}{f'[{phase.interface_id}]' if phase.interface_id else ''}: "
+            f"{phase.duration:.3f}s{f' ({phase.count})' if phase.count is not None else ''}"
+            for phase in self._phases
+        )
+        duration = f"{self._duration:.3f}s" if self._duration is not None else "running"
+        return f"{self._name} started in {duration}: {phases}"
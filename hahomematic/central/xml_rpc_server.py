@@ -7,16 +7,20 @@ with the CCU or Homegear.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 import logging
 import threading
-from typing import Any, Final
+from typing import TYPE_CHECKING, Any, Final
 from xmlrpc.server import SimpleXMLRPCRequestHandler, SimpleXMLRPCServer
 
 from hahomematic import central as hmcu
 from hahomematic.central.decorators import callback_backend_system
-from hahomematic.const import IP_ANY_V4, PORT_ANY, BackendSystemEvent
+from hahomematic.const import IP_ANY_V4, PORT_ANY, BackendSystemEvent, EventTraceStage
 from hahomematic.support import find_free_port
 
+if TYPE_CHECKING:
+    from xmlrpc.client import _Marshallable
+
 _LOGGER: Final = logging.getLogger(__name__)
 
 
@@ -31,15 +35,22 @@ class RPCFunctions:
     def event(self, interface_id: str, channel_address: str, parameter: str, value: Any) -> None:
         """If a device emits some sort event, we will handle it here."""
         if central := self.get_central(interface_id):
-            central.looper.create_task(
-                central.data_point_event(
-                    interface_id=interface_id,
-                    channel_address=channel_address,
-                    parameter=parameter,
-                    value=value,
-                ),
-                name=f"event-{interface_id}-{channel_address}-{parameter}",
-            )
+            # The task of the event inherits the trace.
+            with central.event_tracer.trace(
+                interface_id=interface_id, channel_address=channel_address, parameter=parameter
+            ) as event_trace:
+                if event_trace:
+                    event_trace.stamp(EventTraceStage.SCHEDULED)
+                central.looper.create_task(
+                    central.data_point_event(
+                        interface_id=interface_id,
+                        channel_address=channel_address,
+                        parameter=parameter,
+                        value=value,
+                    ),
+                    name="event",
+                    name_args=(interface_id, channel_address, parameter),
+                )
 
     @callback_backend_system(system_event=BackendSystemEvent.ERROR)
     def error(self, interface_id: str, error_code: str, msg: str) -> None:
@@ -63,7 +74,8 @@ class RPCFunctions:
         if central := self.get_central(interface_id):
             central.looper.create_task(
                 central.add_new_devices(interface_id=interface_id, device_descriptions=tuple(device_descriptions)),
-                name=f"newDevices-{interface_id}",
+                name="newDevices",
+                name_args=(interface_id,),
             )
 
     def deleteDevices(self, interface_id: str, addresses: list[str]) -> None:
@@ -72,7 +84,8 @@ class RPCFunctions:
         if central := self.get_central(interface_id):
             central.looper.create_task(
                 central.delete_devices(interface_id=interface_id, addresses=tuple(addresses)),
-                name=f"deleteDevices-{interface_id}",
+                name="deleteDevices",
+                name_args=(interface_id,),
             )
 
     @callback_backend_system(system_event=BackendSystemEvent.UPDATE_DEVICE)
@@ -144,6 +157,23 @@ class HaHomematicXMLRPCServer(SimpleXMLRPCServer):
     system_listMethods(self, interface_id: str.
     """
 
+    # Set, if a registered central captures the backend traffic.
+    capture_traffic: bool = False
+
+    def _dispatch(self, method: str, params: Iterable[_Marshallable]) -> Any:
+        """Dispatch a call, and capture it for the central of the interface."""
+        if (
+            self.capture_traffic
+            and isinstance(params, tuple)
+            and params
+            and isinstance(interface_id := params[0], str)
+            and isinstance(self.instance, RPCFunctions)
+            and (central := self.instance.get_central(interface_id))
+            and central.traffic_recorder.enabled
+        ):
+            central.traffic_recorder.record_event(interface_id=interface_id, method=method, args=params)
+        return super()._dispatch(method, params)
+
     def system_listMethods(self, interface_id: str | None = None) -> list[str]:
         """
         Return a list of the methods supported by the server.
@@ -231,11 +261,19 @@ class XmlRpcServer(threading.Thread):
         """Register a central in the XmlRPC-Server."""
         if not self._centrals.get(central.name):
             self._centrals[central.name] = central
+            self._update_capture_traffic()
 
     def remove_central(self, central: hmcu.CentralUnit) -> None:
         """Unregister a central from XmlRPC-Server."""
         if self._centrals.get(central.name):
             del self._centrals[central.name]
+            self._update_capture_traffic()
+
+    def _update_capture_traffic(self) -> None:
+        """Capture incoming calls, if a registered central captures the backend traffic."""
+        self._simple_xml_rpc_server.capture_traffic = any(
+            central.traffic_recorder.enabled for central in self._centrals.values()
+        )
 
     def get_central(self, interface_id: str) -> hmcu.CentralUnit | None:
         """Return a central by interface_id."""
@@ -10,15 +10,16 @@ from typing import Any, Final, cast
 
 from hahomematic import central as hmcu
 from hahomematic.caches.dynamic import CommandCache, PingPongCache
+from hahomematic.client.batcher import WriteBatcher
 from hahomematic.client.xml_rpc import XmlRpcProxy
 from hahomematic.const import (
     CALLBACK_WARN_INTERVAL,
     DATETIME_FORMAT_MILLIS,
-    DEFAULT_CUSTOM_ID,
     DEFAULT_MAX_WORKERS,
     DP_KEY_VALUE,
     DUMMY_SERIAL,
     INIT_DATETIME,
+    INIT_MONOTONIC,
     INTERFACES_SUPPORTING_FIRMWARE_UPDATES,
     INTERFACES_SUPPORTING_XML_RPC,
     RECONNECT_WAIT,
@@ -41,6 +42,7 @@ from hahomematic.const import (
     ProgramData,
     ProxyInitState,
     SystemInformation,
+    SystemVariableChanges,
     SystemVariableData,
 )
 from hahomematic.decorators import inspector, measure_execution_time
@@ -95,7 +97,17 @@ class Client(ABC):
         self._proxy: XmlRpcProxy
         self._proxy_read: XmlRpcProxy
         self._system_information: SystemInformation
-        self.modified_at: datetime = INIT_DATETIME
+        self._write_batcher: Final = (
+            WriteBatcher(client=self, window=window)
+            if (window := client_config.central.config.write_coalescing_window) is not None
+            else None
+        )
+        # monotonic time of the central clock
+        self._modified_at: float = INIT_MONOTONIC
+
+    def set_modified_at(self) -> None:
+        """Set the time of the last successful communication with the backend by the central clock."""
+        self._modified_at = self.central.clock.monotonic()
 
     async def init_client(self) -> None:
         """Init the client."""
@@ -131,6 +143,18 @@ class Client(ABC):
         """Return the last value send cache."""
         return self._last_value_send_cache
 
+    @property
+    def write_batcher(self) -> WriteBatcher | None:
+        """Return the write batcher, if writes should be coalesced."""
+        return self._write_batcher
+
+    @property
+    def modified_at(self) -> datetime:
+        """Return the datetime of the last successful communication with the backend."""
+        if self._modified_at == INIT_MONOTONIC:
+            return INIT_DATETIME
+        return self.central.clock.to_datetime(monotonic_time=self._modified_at)
+
     @property
     @abstractmethod
     def model(self) -> str:
@@ -210,9 +234,9 @@ class Client(ABC):
                 reduce_args(args=ex.args),
                 self.interface_id,
             )
-            self.modified_at = INIT_DATETIME
+            self._modified_at = INIT_MONOTONIC
             return ProxyInitState.INIT_FAILED
-        self.modified_at = datetime.now()
+        self.set_modified_at()
         return ProxyInitState.INIT_SUCCESS
 
     async def deinitialize_proxy(self) -> ProxyInitState:
@@ -220,7 +244,7 @@ class Client(ABC):
         if not self.supports_xml_rpc:
             return ProxyInitState.DE_INIT_SUCCESS
 
-        if self.modified_at == INIT_DATETIME:
+        if self._modified_at == INIT_MONOTONIC:
             _LOGGER.debug(
                 "PROXY_DE_INIT: Skipping de-init for %s (not initialized)",
                 self.interface_id,
@@ -238,7 +262,7 @@ class Client(ABC):
             )
             return ProxyInitState.DE_INIT_FAILED
 
-        self.modified_at = INIT_DATETIME
+        self._modified_at = INIT_MONOTONIC
         return ProxyInitState.DE_INIT_SUCCESS
 
     async def reinitialize_proxy(self) -> ProxyInitState:
@@ -286,6 +310,8 @@ class Client(ABC):
 
     async def stop(self) -> None:
         """Stop depending services."""
+        # Commands, that are unconfirmed on stop, are never confirmed.
+        self._last_value_send_cache.clear()
         if not self.supports_xml_rpc:
             return
         await self._proxy.stop()
@@ -319,14 +345,16 @@ class Client(ABC):
             return False
         if not self.supports_push_updates:
             return True
-        return (datetime.now() - self.modified_at).total_seconds() < CALLBACK_WARN_INTERVAL
+        return self.central.clock.monotonic() - self._modified_at < CALLBACK_WARN_INTERVAL
 
     def is_callback_alive(self) -> bool:
         """Return if XmlRPC-Server is alive based on received events for this client."""
         if not self.supports_ping_pong:
             return True
-        if (last_events_dt := self.central.get_last_event_dt(interface_id=self.interface_id)) is not None:
-            if (seconds_since_last_event := (datetime.now() - last_events_dt).total_seconds()) > CALLBACK_WARN_INTERVAL:
+        if (
+            seconds_since_last_event := self.central.get_seconds_since_last_event(interface_id=self.interface_id)
+        ) is not None:
+            if seconds_since_last_event > CALLBACK_WARN_INTERVAL:
                 if self._is_callback_alive:
                     self.central.fire_interface_event(
                         interface_id=self.interface_id,
@@ -390,6 +418,13 @@ class Client(ABC):
     ) -> tuple[SystemVariableData, ...] | None:
         """Get all system variables from CCU / Homegear."""
 
+    @inspector(re_raise=False)
+    async def get_changed_system_variables(
+        self, markers: tuple[DescriptionMarker | str, ...], since: int
+    ) -> SystemVariableChanges | None:
+        """Get the system variables, that changed since the backend timestamp. Return None, if not supported."""
+        return None
+
     @abstractmethod
     @inspector(re_raise=False)
     async def get_all_programs(self, markers: tuple[DescriptionMarker | str, ...]) -> tuple[ProgramData, ...] | None:
@@ -1041,7 +1076,7 @@ class ClientCCU(Client):
                 else self.interface_id
             )
             await self._proxy.ping(calllerId)
-            self.modified_at = dt_now
+            self.set_modified_at()
         except BaseHomematicException as ex:
             _LOGGER.debug(
                 "CHECK_CONNECTION_AVAILABILITY failed: %s [%s]",
@@ -1050,7 +1085,7 @@ class ClientCCU(Client):
             )
         else:
             return True
-        self.modified_at = INIT_DATETIME
+        self._modified_at = INIT_MONOTONIC
         return False
 
     @inspector()
@@ -1100,6 +1135,13 @@ class ClientCCU(Client):
         """Get all system variables from CCU."""
         return await self._json_rpc_client.get_all_system_variables(markers=markers)
 
+    @inspector(re_raise=False)
+    async def get_changed_system_variables(
+        self, markers: tuple[DescriptionMarker | str, ...], since: int
+    ) -> SystemVariableChanges | None:
+        """Get the system variables from CCU, that changed since the backend timestamp."""
+        return await self._json_rpc_client.get_changed_system_variables(markers=markers, since=since)
+
     @inspector(re_raise=False)
     async def get_all_programs(self, markers: tuple[DescriptionMarker | str, ...]) -> tuple[ProgramData, ...]:
         """Get all programs, if available."""
@@ -1381,7 +1423,7 @@ class ClientHomegear(Client):
         """Check if proxy is still initialized."""
         try:
             await self._proxy.clientServerInitialized(self.interface_id)
-            self.modified_at = datetime.now()
+            self.set_modified_at()
         except BaseHomematicException as ex:
             _LOGGER.debug(
                 "CHECK_CONNECTION_AVAILABILITY failed: %s [%s]",
@@ -1390,7 +1432,7 @@ class ClientHomegear(Client):
             )
         else:
             return True
-        self.modified_at = INIT_DATETIME
+        self._modified_at = INIT_MONOTONIC
         return False
 
     @inspector()
@@ -1529,6 +1571,8 @@ class _ClientConfig:
             max_workers=max_workers,
             interface_id=self.interface_id,
             connection_state=self.central.connection_state,
+            metrics=self.central.metrics,
+            recorder=self.central.traffic_recorder,
             uri=self.xml_rpc_uri,
             headers=xml_rpc_headers,
             tls=config.tls,
@@ -1597,72 +1641,25 @@ async def _wait_for_state_change_or_timeout(
     dpk_values: set[DP_KEY_VALUE],
     wait_for_callback: int,
 ) -> None:
-    """Wait for a data_point to change state."""
-    waits = [
-        _track_single_data_point_state_change_or_timeout(
-            device=device,
-            dpk_value=dpk_value,
-            wait_for_callback=wait_for_callback,
-        )
-        for dpk_value in dpk_values
-    ]
-    await asyncio.gather(*waits)
-
-
-@measure_execution_time
-async def _track_single_data_point_state_change_or_timeout(
-    device: Device, dpk_value: DP_KEY_VALUE, wait_for_callback: int
-) -> None:
-    """Wait for a data_point to change state."""
-    ev = asyncio.Event()
-    dpk, value = dpk_value
-
-    def _async_event_changed(*args: Any, **kwargs: Any) -> None:
-        if dp:
-            _LOGGER.debug(
-                "TRACK_SINGLE_DATA_POINT_STATE_CHANGE_OR_TIMEOUT: Received event %s with value %s",
-                dpk,
-                dp.value,
-            )
-            if _isclose(value, dp.value):
-                _LOGGER.debug(
-                    "TRACK_SINGLE_DATA_POINT_STATE_CHANGE_OR_TIMEOUT: Finished event %s with value %s",
-                    dpk,
-                    dp.value,
-                )
-                ev.set()
-
-    if dp := device.get_generic_data_point(
-        channel_address=dpk.channel_address,
-        parameter=dpk.parameter,
-        paramset_key=ParamsetKey(dpk.paramset_key),
-    ):
-        if not dp.supports_events:
-            _LOGGER.debug(
-                "TRACK_SINGLE_DATA_POINT_STATE_CHANGE_OR_TIMEOUT: DataPoint supports no events %s",
-                dpk,
-            )
-            return
+    """Wait for data points to change state."""
+    trackable_dpk_values: list[DP_KEY_VALUE] = []
+    for dpk, value in dpk_values:
         if (
-            unsub := dp.register_data_point_updated_callback(cb=_async_event_changed, custom_id=DEFAULT_CUSTOM_ID)
+            dp := device.get_generic_data_point(
+                channel_address=dpk.channel_address,
+                parameter=dpk.parameter,
+                paramset_key=ParamsetKey(dpk.paramset_key),
+            )
         ) is None:
-            return
-
-        try:
-            async with asyncio.timeout(wait_for_callback):
-                await ev.wait()
-        except TimeoutError:
+            continue
+        if not dp.supports_events:
             _LOGGER.debug(
-                "TRACK_SINGLE_DATA_POINT_STATE_CHANGE_OR_TIMEOUT: Timeout waiting for event %s with value %s",
+                "WAIT_FOR_STATE_CHANGE_OR_TIMEOUT: DataPoint supports no events %s",
                 dpk,
-                dp.value,
             )
-        finally:
-            unsub()
-
+            continue
+        trackable_dpk_values.append((dpk, value))
 
-def _isclose(value1: Any, value2: Any) -> bool:
-    """Check if the both values are close to each other."""
-    if isinstance(value1, float):
-        return bool(round(value1, 2) == round(value2, 2))
-    return bool(value1 == value2)
+    await device.central.pending_confirmations.wait_for_confirmation(
+        dpk_values=trackable_dpk_values, max_wait=wait_for_callback
+    )
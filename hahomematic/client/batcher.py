@@ -0,0 +1,216 @@
+"""Write batcher to coalesce writes to the backend of an interface."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+import logging
+from typing import Any, Final
+
+from hahomematic import client as hmcl
+from hahomematic.const import DP_KEY_VALUE, ParamsetKey
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+class WriteBatcher:
+    """
+    Coalesce writes of an interface within a short window.
+
+    Single parameter writes are merged per paramset_key and channel, and the channels of a batch are sent
+    concurrently. A caller returns after the batch with its writes has been sent, so consecutive writes
+    of a caller (e.g. by collector_order) keep their order.
+    """
+
+    def __init__(self, client: hmcl.Client, window: float) -> None:
+        """Init the write batcher."""
+        self._client: Final = client
+        self._window: Final = window
+        self._pending: Final[list[_BatchedWrite]] = []
+        self._batch_count = 0
+        self._request_count = 0
+        self._write_count = 0
+
+    @property
+    def batch_count(self) -> int:
+        """Return the number of sent batches."""
+        return self._batch_count
+
+    @property
+    def request_count(self) -> int:
+        """Return the number of requests sent to the backend."""
+        return self._request_count
+
+    @property
+    def write_count(self) -> int:
+        """Return the number of writes added to batches."""
+        return self._write_count
+
+    async def send(
+        self,
+        paramset_key: ParamsetKey,
+        paramsets: Mapping[str, Mapping[str, Any]],
+        wait_for_callback: int | None,
+    ) -> set[DP_KEY_VALUE]:
+        """Add the paramsets by channel address to the next batch, and wait until the batch has been sent."""
+        write = _BatchedWrite(
+            paramset_key=paramset_key,
+            paramsets=paramsets,
+            wait_for_callback=wait_for_callback,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        if not self._pending:
+            self._client.central.looper.create_task(
+                self._send_batch_after_window(), name="write_batcher", name_args=(self._client.interface_id,)
+            )
+        self._pending.append(write)
+        self._write_count += 1
+        return await write.future
+
+    async def _send_batch_after_window(self) -> None:
+        """Wait for the coalescing window and send the pending writes."""
+        try:
+            await asyncio.sleep(self._window)
+        except asyncio.CancelledError:
+            # Callers must not wait forever, e.g. when the batch is cancelled on stop.
+            _cancel_writes(writes=self._take_pending())
+            raise
+        writes = self._take_pending()
+        try:
+            await self._send_batch(writes=writes)
+        finally:
+            _cancel_writes(writes=writes)
+
+    def _take_pending(self) -> tuple[_BatchedWrite, ...]:
+        """Return and clear the pending writes."""
+        writes = tuple(self._pending)
+        self._pending.clear()
+        return writes
+
+    async def _send_batch(self, writes: tuple[_BatchedWrite, ...]) -> None:
+        """Send the writes of a batch."""
+        # {(paramset_key, channel_address), requests in the order of the writes}
+        requests: dict[tuple[ParamsetKey, str], list[_ChannelRequest]] = {}
+        for write in writes:
+            for channel_address, values in write.paramsets.items():
+                channel_requests = requests.setdefault((write.paramset_key, channel_address), [])
+                if channel_requests and channel_requests[-1].can_merge(values=values):
+                    channel_requests[-1].add(write=write, values=values)
+                else:
+                    channel_requests.append(_ChannelRequest(write=write, values=values))
+
+        request_count = sum(len(channel_requests) for channel_requests in requests.values())
+        _LOGGER.debug(
+            "SEND_BATCH: Sending %i writes with %i requests for %s",
+            len(writes),
+            request_count,
+            self._client.interface_id,
+        )
+        self._batch_count += 1
+        self._request_count += request_count
+        await asyncio.gather(
+            *(
+                self._send_channel_requests(
+                    channel_address=channel_address, paramset_key=paramset_key, channel_requests=channel_requests
+                )
+                for (paramset_key, channel_address), channel_requests in requests.items()
+            )
+        )
+        for write in writes:
+            if not write.future.done():
+                write.future.set_result(write.dpk_values)
+
+    async def _send_channel_requests(
+        self, channel_address: str, paramset_key: ParamsetKey, channel_requests: list[_ChannelRequest]
+    ) -> None:
+        """Send the requests of a channel one after another, so the order of the writes is kept."""
+        for request in channel_requests:
+            try:
+                dpk_values = await send_channel_values(
+                    client=self._client,
+                    channel_address=channel_address,
+                    paramset_key=paramset_key,
+                    values=request.values,
+                    wait_for_callback=request.wait_for_callback,
+                )
+            except Exception as ex:
+                for write, _ in request.writes:
+                    if not write.future.done():
+                        write.future.set_exception(ex)
+                continue
+            # Each caller gets the send values of its own parameters.
+            for write, parameters in request.writes:
+                write.dpk_values.update((dpk, value) for dpk, value in dpk_values if dpk.parameter in parameters)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class _BatchedWrite:
+    """Paramsets by channel address of a caller, that wait for the next batch."""
+
+    paramset_key: ParamsetKey
+    paramsets: Mapping[str, Mapping[str, Any]]
+    wait_for_callback: int | None
+    future: asyncio.Future[set[DP_KEY_VALUE]]
+    dpk_values: set[DP_KEY_VALUE] = field(default_factory=set)
+
+
+class _ChannelRequest:
+    """
+    The values of a channel, that are sent by one request.
+
+    Only writes of a single parameter are merged, so the parameters of a caller,
+    that depend on their order (e.g. ON_TIME and STATE), are never reordered.
+    """
+
+    __slots__ = ("_is_mergeable", "values", "wait_for_callback", "writes")
+
+    def __init__(self, write: _BatchedWrite, values: Mapping[str, Any]) -> None:
+        """Init the channel request."""
+        self.values: Final[dict[str, Any]] = dict(values)
+        self.wait_for_callback: int | None = write.wait_for_callback
+        self.writes: Final[list[tuple[_BatchedWrite, frozenset[str]]]] = [(write, frozenset(values))]
+        self._is_mergeable: Final = len(values) == 1
+
+    def can_merge(self, values: Mapping[str, Any]) -> bool:
+        """Return if the values of a write can be merged into the request."""
+        return self._is_mergeable and len(values) == 1 and not self.values.keys() & values.keys()
+
+    def add(self, write: _BatchedWrite, values: Mapping[str, Any]) -> None:
+        """Merge the values of a write into the request."""
+        self.values.update(values)
+        self.writes.append((write, frozenset(values)))
+        if write.wait_for_callback is not None:
+            self.wait_for_callback = max(self.wait_for_callback or 0, write.wait_for_callback)
+
+
+async def send_channel_values(
+    client: hmcl.Client,
+    channel_address: str,
+    paramset_key: ParamsetKey,
+    values: Mapping[str, Any],
+    wait_for_callback: int | None,
+) -> set[DP_KEY_VALUE]:
+    """Send the values of a channel. A single value is sent by set_value, multiple values by put_paramset."""
+    if len(values) == 1:
+        ((parameter, value),) = values.items()
+        return await client.set_value(
+            channel_address=channel_address,
+            paramset_key=paramset_key,
+            parameter=parameter,
+            value=value,
+            wait_for_callback=wait_for_callback,
+        )
+    return await client.put_paramset(
+        channel_address=channel_address,
+        paramset_key=paramset_key,
+        values=dict(values),
+        wait_for_callback=wait_for_callback,
+    )
+
+
+def _cancel_writes(writes: tuple[_BatchedWrite, ...]) -> None:
+    """Cancel the writes, that are not done."""
+    for write in writes:
+        if not write.future.done():
+            write.future.cancel()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from asyncio import Semaphore
 from collections.abc import Mapping
 from datetime import datetime
@@ -11,7 +12,9 @@ from json import JSONDecodeError
 import logging
 import os
 from pathlib import Path
+import re
 from ssl import SSLContext
+from time import monotonic
 from typing import Any, Final
 from urllib.parse import unquote
 
@@ -27,12 +30,15 @@ import orjson
 
 from hahomematic import central as hmcu
 from hahomematic.async_support import Looper
+from hahomematic.capture import TrafficRecorder
 from hahomematic.const import (
     ALWAYS_ENABLE_SYSVARS_BY_ID,
     DEFAULT_INCLUDE_INTERNAL_PROGRAMS,
     DEFAULT_INCLUDE_INTERNAL_SYSVARS,
+    DESCRIPTION_CACHE_MAX_AGE,
     ISO_8859_1,
     JSON_SESSION_AGE,
+    JSON_SESSION_RENEW_MARGIN,
     MAX_CONCURRENT_HTTP_SESSIONS,
     PATH_JSON_RPC,
     REGA_SCRIPT_PATH,
@@ -47,6 +53,7 @@ from hahomematic.const import (
     ProgramData,
     RegaScript,
     SystemInformation,
+    SystemVariableChanges,
     SystemVariableData,
     SysvarType,
 )
@@ -58,6 +65,7 @@ from hahomematic.exceptions import (
     NoConnectionException,
     UnsupportedException,
 )
+from hahomematic.metrics import LatencyHistogram, MetricsRegistry
 from hahomematic.model.support import convert_value
 from hahomematic.support import (
     cleanup_text_from_html_tags,
@@ -74,8 +82,10 @@ class _JsonKey(StrEnum):
     """Enum for homematic json keys."""
 
     ADDRESS = "address"
+    CHANGED = "changed"
     CHANNEL_IDS = "channelIds"
     DESCRIPTION = "description"
+    DESCRIPTIONS = "descriptions"
     ERROR = "error"
     ID = "id"
     INTERFACE = "interface"
@@ -93,7 +103,9 @@ class _JsonKey(StrEnum):
     SERIAL = "serial"
     SESSION_ID = "_session_id_"
     SET = "set"
+    SINCE = "since"
     STATE = "state"
+    TIMESTAMP = "timestamp"
     TYPE = "type"
     UNIT = "unit"
     USERNAME = "username"
@@ -143,6 +155,29 @@ _PARALLEL_EXECUTION_LIMITED_JSONRPC_METHODS: Final = (
     _JsonRpcMethod.INTERFACE_GET_VALUE,
 )
 
+_SCRIPT_VARIABLE_PATTERN: Final = re.compile(r"##(\w+)##")
+
+# Keys of Program.getAll / SysVar.getAll, that identify a changed definition.
+_PROGRAM_DEFINITION_KEYS: Final = (_JsonKey.ID, _JsonKey.NAME, _JsonKey.IS_INTERNAL)
+_SYSVAR_DEFINITION_KEYS: Final = (
+    _JsonKey.ID,
+    _JsonKey.NAME,
+    _JsonKey.TYPE,
+    _JsonKey.UNIT,
+    _JsonKey.IS_INTERNAL,
+    _JsonKey.MIN_VALUE,
+    _JsonKey.MAX_VALUE,
+    _JsonKey.VALUE_LIST,
+)
+
+# Keys of get_changed_system_variables.fn, that are encoded by UriEncode().
+_ENCODED_SYSVAR_KEYS: Final = (_JsonKey.NAME, _JsonKey.UNIT, _JsonKey.VALUE, _JsonKey.VALUE_LIST)
+
+# Params and results, that are not written to a traffic capture, because they are credentials.
+_CAPTURE_EXCLUDED_PARAMS: Final = (_JsonKey.PASSWORD, _JsonKey.SESSION_ID, _JsonKey.USERNAME)
+_CAPTURE_REDACTED: Final = "REDACTED"
+_CAPTURE_REDACTED_RESULT_METHODS: Final = (_JsonRpcMethod.SESSION_LOGIN, _JsonRpcMethod.SESSION_RENEW)
+
 
 class JsonRpcAioHttpClient:
     """Connection to CCU JSON-RPC Server."""
@@ -156,6 +191,9 @@ class JsonRpcAioHttpClient:
         client_session: ClientSession | None,
         tls: bool = False,
         verify_tls: bool = False,
+        concurrency_limits: Mapping[str, int] | None = None,
+        metrics: MetricsRegistry | None = None,
+        recorder: TrafficRecorder | None = None,
     ) -> None:
         """Session setup."""
         self._client_session: Final = (
@@ -167,29 +205,51 @@ class JsonRpcAioHttpClient:
         self._connection_state: Final = connection_state
         self._username: Final = username
         self._password: Final = password
-        self._looper = Looper()
+        self._looper = Looper(metrics=metrics)
+        self._recorder: Final = recorder if recorder and recorder.enabled else None
         self._tls: Final = tls
         self._tls_context: Final[SSLContext | bool] = get_tls_context(verify_tls) if tls else False
         self._url: Final = f"{device_url}{PATH_JSON_RPC}"
-        self._script_cache: Final[dict[str, str]] = {}
+        self._script_cache: Final[dict[str, _ScriptTemplate]] = {}
         self._last_session_id_refresh: datetime | None = None
         self._session_id: str | None = None
+        self._session_lock: Final = asyncio.Lock()
+        self._session_renew_handle: asyncio.TimerHandle | None = None
+        self._session_used_since_refresh: bool = False
         self._supported_methods: tuple[str, ...] | None = None
+        self._supported_methods_lock: Final = asyncio.Lock()
         self._sema: Final = Semaphore(value=MAX_CONCURRENT_HTTP_SESSIONS)
+        self._method_semas: Final[dict[str, Semaphore]] = {
+            method: Semaphore(value=limit) for method, limit in (concurrency_limits or {}).items()
+        }
+        self._method_latencies: Final[dict[str, LatencyHistogram]] = {}
+        self._program_descriptions: Final = _DescriptionCache()
+        self._sysvar_descriptions: Final = _DescriptionCache()
+        self._changed_sysvar_descriptions: Final = _DescriptionCache()
 
     @property
     def is_activated(self) -> bool:
         """If session exists, then it is activated."""
         return self._session_id is not None
 
+    @property
+    def method_latencies(self) -> Mapping[str, LatencyHistogram]:
+        """Return the latency histograms by JSON-RPC method."""
+        return self._method_latencies
+
     async def _login_or_renew(self) -> bool:
-        """Renew JSON-RPC session or perform login."""
-        if not self.is_activated:
-            self._session_id = await self._do_login()
-            self._last_session_id_refresh = datetime.now()
-            return self._session_id is not None
-        if self._session_id:
-            self._session_id = await self._do_renew_login(self._session_id)
+        """Renew JSON-RPC session or perform login. Concurrent calls share a single login or renewal."""
+        if self.is_activated and self._has_session_recently_refreshed:
+            self._session_used_since_refresh = True
+            return True
+        async with self._session_lock:
+            if not self.is_activated:
+                if (session_id := await self._do_login()) is not None:
+                    self._set_session_refreshed()
+                self._session_id = session_id
+            elif self._session_id:
+                self._session_id = await self._do_renew_login(self._session_id)
+        self._session_used_since_refresh = True
         return self._session_id is not None
 
     async def _do_renew_login(self, session_id: str) -> str | None:
@@ -203,11 +263,47 @@ class JsonRpcAioHttpClient:
             extra_params={_JsonKey.SESSION_ID: session_id},
         )
         if response[_JsonKey.RESULT] is True:
-            self._last_session_id_refresh = datetime.now()
+            self._set_session_refreshed()
             _LOGGER.debug("DO_RENEW_LOGIN: method: %s [%s]", method, session_id)
             return session_id
 
-        return await self._do_login()
+        if (new_session_id := await self._do_login()) is not None:
+            self._set_session_refreshed()
+        return new_session_id
+
+    def _set_session_refreshed(self) -> None:
+        """Mark the session as refreshed, and schedule the renewal before the session age is reached."""
+        self._last_session_id_refresh = datetime.now()
+        self._session_used_since_refresh = False
+        self._cancel_session_renewal()
+        self._session_renew_handle = asyncio.get_running_loop().call_later(
+            JSON_SESSION_AGE - JSON_SESSION_RENEW_MARGIN, self._renew_session_in_background
+        )
+
+    def _cancel_session_renewal(self) -> None:
+        """Cancel the scheduled session renewal."""
+        if self._session_renew_handle is not None:
+            self._session_renew_handle.cancel()
+            self._session_renew_handle = None
+
+    def _renew_session_in_background(self) -> None:
+        """Renew the session, if it has been used since the last refresh. Idle sessions are renewed on next use."""
+        self._session_renew_handle = None
+        if self._session_id is None or not self._session_used_since_refresh:
+            return
+        self._looper.create_task(self._renew_session(), name="json_rpc_renew_session")
+
+    async def _renew_session(self) -> None:
+        """Renew the session ahead of its expiry."""
+        async with self._session_lock:
+            if not self._session_id:
+                return
+            # force the renewal, the session is within the renew margin
+            self._last_session_id_refresh = None
+            try:
+                self._session_id = await self._do_renew_login(self._session_id)
+            except BaseHomematicException as bhe:
+                _LOGGER.debug("RENEW_SESSION: Renewal failed: %s", reduce_args(args=bhe.args))
 
     @property
     def _has_session_recently_refreshed(self) -> bool:
@@ -244,14 +340,8 @@ class JsonRpcAioHttpClient:
 
         return session_id
 
-    async def _post(
-        self,
-        method: _JsonRpcMethod,
-        extra_params: dict[_JsonKey, Any] | None = None,
-        use_default_params: bool = True,
-        keep_session: bool = True,
-    ) -> dict[str, Any] | Any:
-        """Reusable JSON-RPC POST function."""
+    async def _get_session_id(self, keep_session: bool) -> str:
+        """Return the session id. Login, if required, and check the supported methods once."""
         if keep_session:
             await self._login_or_renew()
             session_id = self._session_id
@@ -262,7 +352,21 @@ class JsonRpcAioHttpClient:
             raise ClientException("Error while logging in")
 
         if self._supported_methods is None:
-            await self._check_supported_methods()
+            async with self._supported_methods_lock:
+                if self._supported_methods is None:
+                    await self._check_supported_methods()
+
+        return session_id
+
+    async def _post(
+        self,
+        method: _JsonRpcMethod,
+        extra_params: dict[_JsonKey, Any] | None = None,
+        use_default_params: bool = True,
+        keep_session: bool = True,
+    ) -> dict[str, Any] | Any:
+        """Reusable JSON-RPC POST function."""
+        session_id = await self._get_session_id(keep_session=keep_session)
 
         response = await self._do_post(
             session_id=session_id,
@@ -288,24 +392,14 @@ class JsonRpcAioHttpClient:
         keep_session: bool = True,
     ) -> dict[str, Any] | Any:
         """Reusable JSON-RPC POST_SCRIPT function."""
-        if keep_session:
-            await self._login_or_renew()
-            session_id = self._session_id
-        else:
-            session_id = await self._do_login()
+        session_id = await self._get_session_id(keep_session=keep_session)
 
-        if not session_id:
-            raise ClientException("Error while logging in")
-
-        if self._supported_methods is None:
-            await self._check_supported_methods()
-
-        if (script := await self._get_script(script_name=script_name)) is None:
+        if (script_template := await self._get_script(script_name=script_name)) is None:
             raise ClientException(f"Script file for {script_name} does not exist")
 
-        if extra_params:
-            for variable, value in extra_params.items():
-                script = script.replace(f"##{variable}##", value)
+        script = script_template.render(
+            variables={str(key): value for key, value in extra_params.items()} if extra_params else None
+        )
 
         method = _JsonRpcMethod.REGA_RUN_SCRIPT
         response = await self._do_post(
@@ -325,20 +419,20 @@ class JsonRpcAioHttpClient:
 
         return response
 
-    async def _get_script(self, script_name: str) -> str | None:
-        """Return a script from the script cache. Load if required."""
+    async def _get_script(self, script_name: str) -> _ScriptTemplate | None:
+        """Return a script template from the script cache. Load if required."""
         if script_name in self._script_cache:
             return self._script_cache[script_name]
 
-        def _load_script(script_name: str) -> str | None:
+        def _load_script(script_name: str) -> _ScriptTemplate | None:
             """Load script from file system."""
             script_file = os.path.join(Path(__file__).resolve().parent, REGA_SCRIPT_PATH, script_name)
             if script := Path(script_file).read_text(encoding=UTF_8):
-                self._script_cache[script_name] = script
-                return script
+                self._script_cache[script_name] = _ScriptTemplate(script=script)
+                return self._script_cache[script_name]
             return None
 
-        return await self._looper.async_add_executor_job(_load_script, script_name, name=f"load_script-{script_name}")
+        return await self._looper.async_add_executor_job(_load_script, script_name, name="load_script")
 
     async def _do_post(
         self,
@@ -373,15 +467,25 @@ class JsonRpcAioHttpClient:
                 timeout=ClientTimeout(total=TIMEOUT),
                 ssl=self._tls_context,
             )
-            if method in _PARALLEL_EXECUTION_LIMITED_JSONRPC_METHODS:
-                async with self._sema:
+            start = monotonic()
+            if (sema := self._get_semaphore(method=method)) is not None:
+                async with sema:
                     if (response := await post_call()) is None:
                         raise ClientException("POST method failed with no response")
             elif (response := await post_call()) is None:
                 raise ClientException("POST method failed with no response")
+            self._get_latency_histogram(method=method).observe(monotonic() - start)
 
             if response.status == 200:
                 json_response = await self._get_json_reponse(response=response)
+                if self._recorder is not None:
+                    self._recorder.record_call(
+                        interface_id=None,
+                        method=method,
+                        args=_get_capture_params(extra_params=extra_params),
+                        duration=monotonic() - start,
+                        result=_get_capture_response(method=method, json_response=json_response),
+                    )
 
                 if error := json_response[_JsonKey.ERROR]:
                     error_message = error[_JsonKey.MESSAGE]
@@ -424,6 +528,18 @@ class JsonRpcAioHttpClient:
             self.clear_session()
             raise ClientException(ex) from ex
 
+    def _get_semaphore(self, method: str) -> Semaphore | None:
+        """Return the semaphore, that limits the parallel execution of the method."""
+        if (sema := self._method_semas.get(method)) is not None:
+            return sema
+        return self._sema if method in _PARALLEL_EXECUTION_LIMITED_JSONRPC_METHODS else None
+
+    def _get_latency_histogram(self, method: str) -> LatencyHistogram:
+        """Return the latency histogram of the method."""
+        if (histogram := self._method_latencies.get(method)) is None:
+            histogram = self._method_latencies[method] = LatencyHistogram()
+        return histogram
+
     async def _get_json_reponse(self, response: ClientResponse) -> dict[str, Any] | Any:
         """Return the json object from response."""
         try:
@@ -446,6 +562,8 @@ class JsonRpcAioHttpClient:
 
     async def stop(self) -> None:
         """Stop the json rpc client."""
+        # A renewal must not be fired into a closed session.
+        self._cancel_session_renewal()
         if self._is_internal_session:
             await self._client_session.close()
 
@@ -474,6 +592,7 @@ class JsonRpcAioHttpClient:
 
     def clear_session(self) -> None:
         """Clear the current session."""
+        self._cancel_session_renewal()
         self._session_id = None
 
     async def execute_program(self, pid: str) -> bool:
@@ -574,87 +693,61 @@ class JsonRpcAioHttpClient:
 
         _LOGGER.debug("GET_ALL_SYSTEM_VARIABLES: Getting all system variables")
         if json_result := response[_JsonKey.RESULT]:
-            descriptions = await self._get_system_variable_descriptions()
-            for var in json_result:
-                enabled_default = False
-                extended_sysvar = False
-                var_id = var[_JsonKey.ID]
-                legacy_name = var[_JsonKey.NAME]
-                is_internal = var[_JsonKey.IS_INTERNAL]
-                if new_name := RENAME_SYSVAR_BY_NAME.get(legacy_name):
-                    legacy_name = new_name
-                if var_id in ALWAYS_ENABLE_SYSVARS_BY_ID:
-                    enabled_default = True
+            signature = _get_definition_signature(json_result=json_result, keys=_SYSVAR_DEFINITION_KEYS)
+            if not self._sysvar_descriptions.is_valid(signature=signature):
+                self._sysvar_descriptions.update(
+                    descriptions=await self._get_system_variable_descriptions(), signature=signature
+                )
+            descriptions = self._sysvar_descriptions.descriptions
+            variables.extend(
+                sysvar
+                for var in json_result
+                if (sysvar := _parse_system_variable(var=var, descriptions=descriptions, markers=markers))
+            )
 
-                if enabled_default is False and is_internal is True:
-                    if var_id in ALWAYS_ENABLE_SYSVARS_BY_ID:
-                        enabled_default = True
-                    elif markers:
-                        if DescriptionMarker.INTERNAL not in markers:
-                            continue
-                        enabled_default = True
-                    elif DEFAULT_INCLUDE_INTERNAL_SYSVARS is False:
-                        continue  # type: ignore[unreachable]
+        return tuple(variables)
 
-                description = descriptions.get(var_id)
-                if enabled_default is False and not is_internal and markers:
-                    if not element_matches_key(
-                        search_elements=markers,
-                        compare_with=description,
-                        ignore_case=False,
-                        do_left_wildcard_search=True,
-                    ):
-                        continue
-                    enabled_default = True
+    async def get_changed_system_variables(
+        self, markers: tuple[DescriptionMarker | str, ...], since: int
+    ) -> SystemVariableChanges | None:
+        """
+        Get the system variables from CCU, that changed since the backend timestamp.
 
-                org_data_type = var[_JsonKey.TYPE]
-                raw_value = var[_JsonKey.VALUE]
-                if org_data_type == SysvarType.NUMBER:
-                    data_type = SysvarType.FLOAT if "." in raw_value else SysvarType.INTEGER
-                else:
-                    data_type = org_data_type
+        All system variables are returned, if since is 0 or system variables are added, removed or their
+        descriptions are edited. Other edits of the definitions are picked up with the max age of the descriptions.
+        """
+        try:
+            response = await self._post_script(
+                script_name=RegaScript.GET_CHANGED_SYSTEM_VARIABLES, extra_params={_JsonKey.SINCE: since}
+            )
+        except JSONDecodeError as jderr:
+            raise ClientException(jderr) from jderr
 
-                if description:
-                    extended_sysvar = DescriptionMarker.HAHM in description
-                    # Remove default markers from description
-                    for marker in DescriptionMarker:
-                        description = description.replace(marker, "").strip()
-                unit = var[_JsonKey.UNIT]
-                values: tuple[str, ...] | None = None
-                if val_list := var.get(_JsonKey.VALUE_LIST):
-                    values = tuple(val_list.split(";"))
-                try:
-                    value = parse_sys_var(data_type=data_type, raw_value=raw_value)
-                    max_value = None
-                    if raw_max_value := var.get(_JsonKey.MAX_VALUE):
-                        max_value = parse_sys_var(data_type=data_type, raw_value=raw_max_value)
-                    min_value = None
-                    if raw_min_value := var.get(_JsonKey.MIN_VALUE):
-                        min_value = parse_sys_var(data_type=data_type, raw_value=raw_min_value)
-                    variables.append(
-                        SystemVariableData(
-                            vid=var_id,
-                            legacy_name=legacy_name,
-                            data_type=data_type,
-                            description=description,
-                            unit=unit,
-                            value=value,
-                            values=values,
-                            max_value=max_value,
-                            min_value=min_value,
-                            extended_sysvar=extended_sysvar,
-                            enabled_default=enabled_default,
-                        )
-                    )
-                except (ValueError, TypeError) as vterr:
-                    _LOGGER.warning(
-                        "GET_ALL_SYSTEM_VARIABLES failed: %s [%s] Failed to parse SysVar %s ",
-                        vterr.__class__.__name__,
-                        reduce_args(args=vterr.args),
-                        legacy_name,
-                    )
+        _LOGGER.debug("GET_CHANGED_SYSTEM_VARIABLES: Getting system variables changed since %i", since)
+        if not (json_result := response[_JsonKey.RESULT]):
+            return None
 
-        return tuple(variables)
+        descriptions = {
+            var_id: cleanup_text_from_html_tags(text=unquote(string=description, encoding=ISO_8859_1))
+            for var_id, description in json_result[_JsonKey.DESCRIPTIONS].items()
+        }
+        signature = hash(tuple(descriptions.items()))
+        if since:
+            if not self._changed_sysvar_descriptions.is_valid(signature=signature):
+                return await self.get_changed_system_variables(markers=markers, since=0)
+        else:
+            self._changed_sysvar_descriptions.update(descriptions=descriptions, signature=signature)
+
+        variables: list[SystemVariableData] = []
+        for var in json_result[_JsonKey.CHANGED]:
+            for key in _ENCODED_SYSVAR_KEYS:
+                var[key] = unquote(string=var[key], encoding=ISO_8859_1)
+            if sysvar := _parse_system_variable(var=var, descriptions=descriptions, markers=markers):
+                variables.append(sysvar)
+
+        return SystemVariableChanges(
+            timestamp=json_result[_JsonKey.TIMESTAMP], variables=tuple(variables), complete=not since
+        )
 
     async def _get_program_descriptions(self) -> Mapping[str, str]:
         """Get all program descriptions from CCU via script."""
@@ -966,7 +1059,12 @@ class JsonRpcAioHttpClient:
 
         _LOGGER.debug("GET_ALL_PROGRAMS: Getting all programs")
         if json_result := response[_JsonKey.RESULT]:
-            descriptions = await self._get_program_descriptions()
+            signature = _get_definition_signature(json_result=json_result, keys=_PROGRAM_DEFINITION_KEYS)
+            if not self._program_descriptions.is_valid(signature=signature):
+                self._program_descriptions.update(
+                    descriptions=await self._get_program_descriptions(), signature=signature
+                )
+            descriptions = self._program_descriptions.descriptions
             for prog in json_result:
                 enabled_default = False
                 if (is_internal := prog[_JsonKey.IS_INTERNAL]) is True:
@@ -1153,6 +1251,146 @@ class JsonRpcAioHttpClient:
         return None
 
 
+class _DescriptionCache:
+    """
+    Cache for program or system variable descriptions.
+
+    The descriptions are only fetched again, if the definitions of the backend changed or the max age is reached.
+    """
+
+    def __init__(self, max_age: int = DESCRIPTION_CACHE_MAX_AGE) -> None:
+        """Init the description cache."""
+        self._max_age: Final = max_age
+        self._descriptions: Mapping[str, str] = {}
+        self._signature: int | None = None
+        self._refreshed_at: float | None = None
+
+    @property
+    def descriptions(self) -> Mapping[str, str]:
+        """Return the cached descriptions."""
+        return self._descriptions
+
+    def is_valid(self, signature: int) -> bool:
+        """Return if the cached descriptions match the definitions with the signature."""
+        return (
+            self._refreshed_at is not None
+            and self._signature == signature
+            and monotonic() - self._refreshed_at < self._max_age
+        )
+
+    def update(self, descriptions: Mapping[str, str], signature: int) -> None:
+        """Update the cached descriptions."""
+        self._descriptions = descriptions
+        self._signature = signature
+        self._refreshed_at = monotonic()
+
+
+class _ScriptTemplate:
+    """Rega script, that is split once into text and variables for fast rendering."""
+
+    def __init__(self, script: str) -> None:
+        """Init the script template."""
+        self._script: Final = script
+        # odd indexes contain the variable names
+        self._parts: Final = tuple(_SCRIPT_VARIABLE_PATTERN.split(script))
+
+    def render(self, variables: Mapping[str, Any] | None = None) -> str:
+        """Return the script with the variables replaced by their values."""
+        if not variables or len(self._parts) == 1:
+            return self._script
+        return "".join(
+            part if idx % 2 == 0 else str(variables[part]) if part in variables else f"##{part}##"
+            for idx, part in enumerate(self._parts)
+        )
+
+
+def _get_definition_signature(json_result: list[dict[str, Any]], keys: tuple[_JsonKey, ...]) -> int:
+    """Return a signature of the definitions of programs or system variables, that excludes the values."""
+    return hash(tuple(tuple(str(item.get(key)) for key in keys) for item in json_result))
+
+
+def _parse_system_variable(
+    var: dict[str, Any], descriptions: Mapping[str, str], markers: tuple[DescriptionMarker | str, ...]
+) -> SystemVariableData | None:
+    """Return the system variable of a SysVar.getAll entry, or None, if it is filtered or unparsable."""
+    enabled_default = False
+    extended_sysvar = False
+    var_id = var[_JsonKey.ID]
+    legacy_name = var[_JsonKey.NAME]
+    is_internal = var[_JsonKey.IS_INTERNAL]
+    if new_name := RENAME_SYSVAR_BY_NAME.get(legacy_name):
+        legacy_name = new_name
+    if var_id in ALWAYS_ENABLE_SYSVARS_BY_ID:
+        enabled_default = True
+
+    if enabled_default is False and is_internal is True:
+        if var_id in ALWAYS_ENABLE_SYSVARS_BY_ID:
+            enabled_default = True
+        elif markers:
+            if DescriptionMarker.INTERNAL not in markers:
+                return None
+            enabled_default = True
+        elif DEFAULT_INCLUDE_INTERNAL_SYSVARS is False:
+            return None  # type: ignore[unreachable]
+
+    description = descriptions.get(var_id)
+    if enabled_default is False and not is_internal and markers:
+        if not element_matches_key(
+            search_elements=markers,
+            compare_with=description,
+            ignore_case=False,
+            do_left_wildcard_search=True,
+        ):
+            return None
+        enabled_default = True
+
+    org_data_type = var[_JsonKey.TYPE]
+    raw_value = var[_JsonKey.VALUE]
+    if org_data_type == SysvarType.NUMBER:
+        data_type = SysvarType.FLOAT if "." in raw_value else SysvarType.INTEGER
+    else:
+        data_type = org_data_type
+
+    if description:
+        extended_sysvar = DescriptionMarker.HAHM in description
+        # Remove default markers from description
+        for marker in DescriptionMarker:
+            description = description.replace(marker, "").strip()
+    unit = var[_JsonKey.UNIT]
+    values: tuple[str, ...] | None = None
+    if val_list := var.get(_JsonKey.VALUE_LIST):
+        values = tuple(val_list.split(";"))
+    try:
+        value = parse_sys_var(data_type=data_type, raw_value=raw_value)
+        max_value = None
+        if raw_max_value := var.get(_JsonKey.MAX_VALUE):
+            max_value = parse_sys_var(data_type=data_type, raw_value=raw_max_value)
+        min_value = None
+        if raw_min_value := var.get(_JsonKey.MIN_VALUE):
+            min_value = parse_sys_var(data_type=data_type, raw_value=raw_min_value)
+    except (ValueError, TypeError) as vterr:
+        _LOGGER.warning(
+            "GET_ALL_SYSTEM_VARIABLES failed: %s [%s] Failed to parse SysVar %s ",
+            vterr.__class__.__name__,
+            reduce_args(args=vterr.args),
+            legacy_name,
+        )
+        return None
+    return SystemVariableData(
+        vid=var_id,
+        legacy_name=legacy_name,
+        data_type=data_type,
+        description=description,
+        unit=unit,
+        value=value,
+        values=values,
+        max_value=max_value,
+        min_value=min_value,
+        extended_sysvar=extended_sysvar,
+        enabled_default=enabled_default,
+    )
+
+
 def _get_params(
     session_id: bool | str,
     extra_params: dict[_JsonKey, Any] | None,
@@ -1164,3 +1402,18 @@ def _get_params(
         params.update(extra_params)
 
     return {str(key): str(value) for key, value in params.items()}
+
+
+def _get_capture_params(extra_params: dict[_JsonKey, Any] | None) -> list[dict[str, Any]]:
+    """Return the params of a call for the capture, without credentials and with the first line of a script."""
+    params = {str(key): value for key, value in (extra_params or {}).items() if key not in _CAPTURE_EXCLUDED_PARAMS}
+    if isinstance(script := params.get(_JsonKey.SCRIPT), str):
+        params[_JsonKey.SCRIPT] = script.split("\n", 1)[0]
+    return [params]
+
+
+def _get_capture_response(method: str, json_response: dict[str, Any]) -> dict[str, Any]:
+    """Return the response of a call for the capture, without the session id."""
+    if method in _CAPTURE_REDACTED_RESULT_METHODS and json_response.get(_JsonKey.RESULT) is not None:
+        return {**json_response, _JsonKey.RESULT: _CAPTURE_REDACTED}
+    return json_response
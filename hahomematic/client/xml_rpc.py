@@ -8,11 +8,13 @@ from enum import Enum, IntEnum, StrEnum
 import errno
 import logging
 from ssl import SSLError
+from time import monotonic
 from typing import Any, Final
 import xmlrpc.client
 
 from hahomematic import central as hmcu
 from hahomematic.async_support import Looper
+from hahomematic.capture import TrafficRecorder
 from hahomematic.const import ISO_8859_1
 from hahomematic.exceptions import (
     AuthFailure,
@@ -21,6 +23,7 @@ from hahomematic.exceptions import (
     NoConnectionException,
     UnsupportedException,
 )
+from hahomematic.metrics import MetricsRegistry
 from hahomematic.support import get_tls_context, reduce_args
 
 _LOGGER: Final = logging.getLogger(__name__)
@@ -70,12 +73,15 @@ class XmlRpcProxy(xmlrpc.client.ServerProxy):
         interface_id: str,
         connection_state: hmcu.CentralConnectionState,
         *args: Any,
+        metrics: MetricsRegistry | None = None,
+        recorder: TrafficRecorder | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize new proxy for server and get local ip."""
         self.interface_id: Final = interface_id
+        self._recorder: Final = recorder if recorder and recorder.enabled else None
         self._connection_state: Final = connection_state
-        self._looper: Final = Looper()
+        self._looper: Final = Looper(metrics=metrics)
         self._proxy_executor: Final = (
             ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=interface_id) if max_workers > 0 else None
         )
@@ -105,7 +111,6 @@ class XmlRpcProxy(xmlrpc.client.ServerProxy):
 
     async def __async_request(self, *args, **kwargs):  # type: ignore[no-untyped-def]
         """Call method on server side."""
-        parent = xmlrpc.client.ServerProxy
         try:
             method = args[0]
             if self._supported_methods and method not in self._supported_methods:
@@ -117,9 +122,7 @@ class XmlRpcProxy(xmlrpc.client.ServerProxy):
                 args = _cleanup_args(*args)
                 _LOGGER.debug("__ASYNC_REQUEST: %s", args)
                 result = await self._looper.async_add_executor_job(
-                    # pylint: disable=protected-access
-                    parent._ServerProxy__request,  # type: ignore[attr-defined]
-                    self,
+                    self._request,
                     *args,
                     name="xmp_rpc_proxy",
                     executor=self._proxy_executor,
@@ -158,6 +161,25 @@ class XmlRpcProxy(xmlrpc.client.ServerProxy):
         except Exception as ex:
             raise ClientException(ex) from ex
 
+    def _request(self, method: str, params: tuple[Any, ...]) -> Any:
+        """Execute the request in the executor, and capture it, if a recorder is set."""
+        # pylint: disable=protected-access
+        request = xmlrpc.client.ServerProxy._ServerProxy__request  # type: ignore[attr-defined]
+        if self._recorder is None:
+            return request(self, method, params)
+        start = monotonic()
+        try:
+            result = request(self, method, params)
+        except Exception as ex:
+            self._recorder.record_call(
+                interface_id=self.interface_id, method=method, args=params, duration=monotonic() - start, error=ex
+            )
+            raise
+        self._recorder.record_call(
+            interface_id=self.interface_id, method=method, args=params, duration=monotonic() - start, result=result
+        )
+        return result
+
     def __getattr__(self, *args, **kwargs):  # type: ignore[no-untyped-def]
         """Magic method dispatcher."""
         return xmlrpc.client._Method(self.__async_request, *args, **kwargs)
@@ -0,0 +1,120 @@
+"""Clock used for the timestamps within hahomematic."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+import time
+from typing import Final
+
+from hahomematic.const import INIT_DATETIME, INIT_MONOTONIC, MAX_CACHE_AGE
+from hahomematic.context import EVENT_TIME_VAR
+
+__all__ = ["Clock", "ManualClock"]
+
+
+class Clock:
+    """
+    Clock based on a monotonic time source.
+
+    Timestamps are stored as monotonic times, and are only converted to
+    wall clock datetimes, when they are exposed.
+    The offset between wall clock and monotonic time is captured once per clock,
+    so the conversions of a timestamp are stable.
+    Within event_time, the monotonic time is read only once.
+    """
+
+    __slots__ = ("_wall_offset",)
+
+    def __init__(self) -> None:
+        """Init the clock."""
+        self._wall_offset: Final = self._wall_time() - self._monotonic_time()
+
+    def monotonic(self) -> float:
+        """Return the monotonic time, or the time of the event, that is currently processed."""
+        if (event_time := self._get_event_time()) is not None:
+            return event_time
+        return self._monotonic_time()
+
+    def now(self) -> datetime:
+        """Return the current wall clock datetime."""
+        return self.to_datetime(monotonic_time=self.monotonic())
+
+    def to_datetime(self, monotonic_time: float) -> datetime:
+        """Convert a monotonic time to a wall clock datetime."""
+        if monotonic_time == INIT_MONOTONIC:
+            return INIT_DATETIME
+        return datetime.fromtimestamp(self.to_wall_time(monotonic_time=monotonic_time))
+
+    def to_wall_time(self, monotonic_time: float) -> float:
+        """Convert a monotonic time to a wall clock timestamp."""
+        return monotonic_time + self._wall_offset
+
+    def from_wall_time(self, wall_time: float) -> float:
+        """Convert a wall clock timestamp to a monotonic time."""
+        return wall_time - self._wall_offset
+
+    def changed_within_seconds(self, monotonic_time: float, max_age: int = MAX_CACHE_AGE) -> bool:
+        """Return, if the monotonic time is within the last max_age seconds."""
+        if monotonic_time == INIT_MONOTONIC:
+            return False
+        return self.monotonic() - monotonic_time < max_age
+
+    @contextmanager
+    def event_time(self) -> Iterator[float]:
+        """Read the monotonic time once, and use it for all timestamps of the current event."""
+        if (event_time := self._get_event_time()) is not None:
+            yield event_time
+            return
+        event_time = self._monotonic_time()
+        token = EVENT_TIME_VAR.set((asyncio.current_task(), event_time))
+        try:
+            yield event_time
+        finally:
+            EVENT_TIME_VAR.reset(token)
+
+    def _get_event_time(self) -> float | None:
+        """Return the time of the event, that is processed by the current task."""
+        if (event_time := EVENT_TIME_VAR.get()) is None:
+            return None
+        # Tasks, that are created while an event is processed, inherit the context,
+        # but must not use the time of the event.
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            return None
+        return event_time[1] if event_time[0] is task else None
+
+    def _monotonic_time(self) -> float:
+        """Return the time of the monotonic time source."""
+        return time.monotonic()
+
+    def _wall_time(self) -> float:
+        """Return the time of the wall clock."""
+        return time.time()
+
+
+class ManualClock(Clock):
+    """Clock, that is only advanced manually. Used for deterministic tests and benchmarks."""
+
+    __slots__ = ("_monotonic", "_start")
+
+    def __init__(self, start: datetime | None = None) -> None:
+        """Init the manual clock."""
+        self._monotonic = 1.0
+        self._start: Final = (start or datetime.now()).timestamp()
+        super().__init__()
+
+    def advance(self, seconds: float) -> None:
+        """Advance the clock by seconds."""
+        self._monotonic += seconds
+
+    def _monotonic_time(self) -> float:
+        """Return the time of the monotonic time source."""
+        return self._monotonic
+
+    def _wall_time(self) -> float:
+        """Return the time of the wall clock."""
+        return self._start + self._monotonic - 1.0
@@ -9,26 +9,37 @@ from enum import Enum, IntEnum, StrEnum
 import re
 from typing import Any, Final, NamedTuple, Required, TypedDict
 
-VERSION: Final = "2025.1.10"
+VERSION: Final = "2025.2.0"
 
 # default
 DEFAULT_CUSTOM_ID: Final = "custom_id"
 DEFAULT_ENABLE_DEVICE_FIRMWARE_CHECK: Final = False
+DEFAULT_ENABLE_EVENT_TRACING: Final = False
+DEFAULT_ENABLE_MEMORY_REPORT: Final = False
 DEFAULT_ENABLE_PROGRAM_SCAN: Final = True
+DEFAULT_ENABLE_SYSVAR_PUSH: Final = False
 DEFAULT_ENABLE_SYSVAR_SCAN: Final = True
+DEFAULT_ENABLE_TRAFFIC_CAPTURE: Final = False
+DEFAULT_ENABLE_VALUE_SNAPSHOT: Final = False
+DEFAULT_EVENT_TRACE_LOG_SAMPLE_RATE: Final = 0.0
 DEFAULT_IGNORE_CUSTOM_DEVICE_DEFINITION_MODELS: Final[tuple[str, ...]] = ()
 DEFAULT_INCLUDE_INTERNAL_PROGRAMS: Final = False
 DEFAULT_INCLUDE_INTERNAL_SYSVARS: Final = True
+DEFAULT_LAZY_DEVICE_ERROR_EVENTS: Final = False
 DEFAULT_MAX_READ_WORKERS: Final = 1
 DEFAULT_MAX_WORKERS: Final = 1
+DEFAULT_METRICS_PORT: Final[int | None] = None
 DEFAULT_MULTIPLIER: Final = 1.0
 DEFAULT_PERIODIC_REFRESH_INTERVAL: Final = 15
+DEFAULT_PROFILER_DURATION: Final[float | None] = None
 DEFAULT_PROGRAM_MARKERS: Final[tuple[DescriptionMarker | str, ...]] = ()
 DEFAULT_SYSVAR_MARKERS: Final[tuple[DescriptionMarker | str, ...]] = ()
+DEFAULT_SYSVAR_PUSH_SCAN_INTERVAL: Final[int | None] = None
 DEFAULT_SYS_SCAN_INTERVAL: Final = 30
 DEFAULT_TLS: Final = False
 DEFAULT_UN_IGNORES: Final[tuple[str, ...]] = ()
 DEFAULT_VERIFY_TLS: Final = False
+DEFAULT_WRITE_COALESCING_WINDOW: Final[float | None] = None
 
 # Default encoding for json service calls, persistent cache
 UTF_8: Final = "utf-8"
@@ -61,11 +72,15 @@ SYSVAR_ENABLE_DEFAULT: Final = "40", "41"
 ADDRESS_SEPARATOR: Final = ":"
 BLOCK_LOG_TIMEOUT = 60
 CACHE_PATH: Final = "cache"
+CAPTURE_PATH: Final = "capture"
+COMMAND_CACHE_MAX_SIZE: Final = 1000
+COMMAND_CACHE_CLEANUP_INTERVAL: Final = 30
 CONF_PASSWORD: Final = "password"
 CONF_USERNAME: Final = "username"
 CONNECTION_CHECKER_INTERVAL: Final = 15  # check if connection is available via rpc ping
 DATETIME_FORMAT: Final = "%d.%m.%Y %H:%M:%S"
 DATETIME_FORMAT_MILLIS: Final = "%d.%m.%Y %H:%M:%S.%f'"
+DESCRIPTION_CACHE_MAX_AGE: Final = 600  # 10m
 DEVICE_DESCRIPTIONS_DIR: Final = "export_device_descriptions"
 DEVICE_FIRMWARE_CHECK_INTERVAL: Final = 21600  # 6h
 DEVICE_FIRMWARE_DELIVERING_CHECK_INTERVAL: Final = 3600  # 1h
@@ -73,29 +88,40 @@ DEVICE_FIRMWARE_UPDATING_CHECK_INTERVAL: Final = 300  # 5m
 DUMMY_SERIAL = "SN0815"
 FILE_DEVICES: Final = "homematic_devices.json"
 FILE_PARAMSETS: Final = "homematic_paramsets.json"
+FILE_VALUES: Final = "homematic_values.json"
 HUB_PATH: Final = "hub"
 IDENTIFIER_SEPARATOR: Final = "@"
 INIT_DATETIME: Final = datetime.strptime("01.01.1970 00:00:00", DATETIME_FORMAT)
+INIT_MONOTONIC: Final = float("-inf")
 IP_ANY_V4: Final = "0.0.0.0"
 JSON_SESSION_AGE: Final = 90
+JSON_SESSION_RENEW_MARGIN: Final = 10
+KWARGS_ARG_CHANGED_FIELDS: Final = "changed_fields"
 KWARGS_ARG_DATA_POINT = "data_point"
 LAST_COMMAND_SEND_STORE_TIMEOUT: Final = 60
 LOCAL_HOST: Final = "127.0.0.1"
+LOOP_LAG_SAMPLE_INTERVAL: Final = 1.0
 MAX_CACHE_AGE: Final = 10
 MAX_CONCURRENT_HTTP_SESSIONS: Final = 3
 MAX_WAIT_FOR_CALLBACK: Final = 60
+MEMORY_REPORT_INTERVAL: Final = 300
+MEMORY_SAMPLE_SIZE: Final = 50
 NO_CACHE_ENTRY: Final = "NO_CACHE_ENTRY"
 PARAMSET_DESCRIPTIONS_DIR: Final = "export_paramset_descriptions"
 PATH_JSON_RPC: Final = "/api/homematic.cgi"
 PING_PONG_MISMATCH_COUNT: Final = 15
 PING_PONG_MISMATCH_COUNT_TTL: Final = 300
 PORT_ANY: Final = 0
+PROFILE_PATH: Final = "profile"
+PROFILER_HOTSPOT_COUNT: Final = 10
+PROFILER_SAMPLE_INTERVAL: Final = 0.01
 PROGRAM_ADDRESS: Final = "program"
 RECONNECT_WAIT: Final = 120  # wait with reconnect after a first ping was successful
 REGA_SCRIPT_PATH: Final = "../rega_scripts"
 REPORT_VALUE_USAGE_DATA: Final = "reportValueUsageData"
 REPORT_VALUE_USAGE_VALUE_ID: Final = "PRESS_SHORT"
 SYSVAR_ADDRESS: Final = "sysvar"
+SYSVAR_PUSH_MAX_AGE: Final = 600  # 10m, push is active, while pushes have been received within this age
 TIMEOUT: Final = 60  # default timeout for a connection
 UN_IGNORE_WILDCARD: Final = "all"
 WAIT_FOR_CALLBACK: Final[int | None] = None
@@ -237,6 +263,16 @@ class EventKey(StrEnum):
     VALUE = "value"
 
 
+class EventTraceStage(StrEnum):
+    """Enum with the stages of a traced backend event."""
+
+    RECEIVED = "received"
+    SCHEDULED = "scheduled"
+    DISPATCHED = "dispatched"
+    CONVERTED = "converted"
+    CALLBACKS_DONE = "callbacks_done"
+
+
 class EventType(StrEnum):
     """Enum with hahomematic event types."""
 
@@ -419,6 +455,7 @@ class RegaScript(StrEnum):
     """Enum with homematic rega scripts."""
 
     FETCH_ALL_DEVICE_DATA: Final = "fetch_all_device_data.fn"
+    GET_CHANGED_SYSTEM_VARIABLES: Final = "get_changed_system_variables.fn"
     GET_PROGRAM_DESCRIPTIONS: Final = "get_program_descriptions.fn"
     GET_SERIAL: Final = "get_serial.fn"
     GET_SYSTEM_VARIABLE_DESCRIPTIONS: Final = "get_system_variable_descriptions.fn"
@@ -487,6 +524,13 @@ class SysvarType(StrEnum):
     STRING = "STRING"
 
 
+class TrafficCaptureKind(StrEnum):
+    """Enum with the kinds of captured backend traffic."""
+
+    CALL = "call"
+    EVENT = "event"
+
+
 class ParameterType(StrEnum):
     """Enum for homematic parameter types."""
 
@@ -663,6 +707,15 @@ class SystemVariableData(HubData):
     values: tuple[str, ...] | None = None
 
 
+@dataclass(frozen=True, kw_only=True, slots=True)
+class SystemVariableChanges:
+    """Dataclass for the system variables, that changed since a timestamp of the backend."""
+
+    timestamp: int
+    variables: tuple[SystemVariableData, ...]
+    complete: bool = False
+
+
 @dataclass(frozen=True, kw_only=True, slots=True)
 class SystemInformation:
     """System information of the backend."""
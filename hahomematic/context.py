@@ -2,7 +2,18 @@
 
 from __future__ import annotations
 
+from asyncio import Task
 from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from hahomematic.tracing import EventTrace
 
 # context var for storing if call is running within a service
 IN_SERVICE_VAR: ContextVar[bool] = ContextVar("in_service_var", default=False)
+
+# context var for storing the task and the monotonic time of the event, that is currently processed
+EVENT_TIME_VAR: ContextVar[tuple[Task[Any] | None, float] | None] = ContextVar("event_time_var", default=None)
+
+# context var for storing the trace of the backend event, that is currently processed
+EVENT_TRACE_VAR: ContextVar[EventTrace | None] = ContextVar("event_trace_var", default=None)
@@ -11,6 +11,7 @@ from typing import Any, Final, ParamSpec, TypeVar, cast
 
 from hahomematic.context import IN_SERVICE_VAR
 from hahomematic.exceptions import BaseHomematicException
+from hahomematic.metrics import MetricsRegistry
 from hahomematic.support import reduce_args
 
 P = ParamSpec("P")
@@ -54,8 +55,6 @@ def inspector(  # noqa: C901
 
         """
 
-        start = monotonic() if measure_performance and _LOGGER.isEnabledFor(level=logging.DEBUG) else None
-
         def handle_exception(ex: Exception, func: Callable, is_sub_service_call: bool, is_homematic: bool) -> R:
             """Handle exceptions for decorated functions."""
             if not is_sub_service_call and log_level > logging.NOTSET:
@@ -69,6 +68,8 @@ def inspector(  # noqa: C901
         def wrap_sync_function(*args: P.args, **kwargs: P.kwargs) -> R:
             """Wrap sync functions."""
 
+            start = monotonic() if measure_performance else None
+            failed = True
             token = IN_SERVICE_VAR.set(True) if not IN_SERVICE_VAR.get() else None
             try:
                 return_value: R = func(*args, **kwargs)
@@ -81,17 +82,20 @@ def inspector(  # noqa: C901
                     IN_SERVICE_VAR.reset(token)
                 return handle_exception(ex=ex, func=func, is_sub_service_call=IN_SERVICE_VAR.get(), is_homematic=False)
             else:
+                failed = False
                 if token:
                     IN_SERVICE_VAR.reset(token)
                 return return_value
             finally:
-                if start:
-                    _log_performance_message(func, start, *args, **kwargs)
+                if start is not None:
+                    _record_execution(func, start, failed, *args, **kwargs)
 
         @wraps(func)
         async def wrap_async_function(*args: P.args, **kwargs: P.kwargs) -> R:
             """Wrap async functions."""
 
+            start = monotonic() if measure_performance else None
+            failed = True
             token = IN_SERVICE_VAR.set(True) if not IN_SERVICE_VAR.get() else None
             try:
                 return_value = await func(*args, **kwargs)  # type: ignore[misc]  # Await the async call
@@ -104,12 +108,13 @@ def inspector(  # noqa: C901
                     IN_SERVICE_VAR.reset(token)
                 return handle_exception(ex=ex, func=func, is_sub_service_call=IN_SERVICE_VAR.get(), is_homematic=False)
             else:
+                failed = False
                 if token:
                     IN_SERVICE_VAR.reset(token)
                 return cast(R, return_value)
             finally:
-                if start:
-                    _log_performance_message(func, start, *args, **kwargs)
+                if start is not None:
+                    _record_execution(func, start, failed, *args, **kwargs)
 
         # Check if the function is a coroutine or not and select the appropriate wrapper
         if asyncio.iscoroutinefunction(func):
@@ -121,8 +126,40 @@ def inspector(  # noqa: C901
     return create_wrapped_decorator
 
 
-def _log_performance_message(func: Callable, start: float, *args: P.args, **kwargs: P.kwargs) -> None:
+def _record_execution(func: Callable, start: float, failed: bool, *args: Any, **kwargs: Any) -> None:
+    """Record the execution time of a call in the metrics of the central and log it on debug."""
     delta = monotonic() - start
+    source = args[0] if args else next(iter(kwargs.values()), None)
+
+    if (metrics := _get_metrics_registry(obj=source)) is not None:
+        labels = {"function": func.__name__}
+        if interface_id := kwargs.get("interface_id") or getattr(source, "interface_id", None):
+            labels["interface_id"] = str(interface_id)
+        elif interface := kwargs.get("interface"):
+            labels["interface"] = str(interface)
+        metrics.histogram(
+            name="execution_duration_seconds", description="Execution time of measured functions", labels=labels
+        ).observe(delta)
+        metrics.counter(name="executions_total", description="Number of measured executions", labels=labels).inc()
+        if failed:
+            metrics.counter(
+                name="execution_errors_total", description="Number of failed measured executions", labels=labels
+            ).inc()
+
+    if _LOGGER.isEnabledFor(level=logging.DEBUG):
+        _log_performance_message(func, delta, *args, **kwargs)
+
+
+def _get_metrics_registry(obj: Any) -> MetricsRegistry | None:
+    """Return the metrics registry of a central unit, or of the central unit of an object."""
+    if isinstance(metrics := getattr(obj, "metrics", None), MetricsRegistry):
+        return metrics
+    if isinstance(metrics := getattr(getattr(obj, "central", None), "metrics", None), MetricsRegistry):
+        return metrics
+    return None
+
+
+def _log_performance_message(func: Callable, delta: float, *args: Any, **kwargs: Any) -> None:
     caller = str(args[0]) if len(args) > 0 else ""
 
     iface: str = ""
@@ -138,37 +175,50 @@ def _log_performance_message(func: Callable, start: float, *args: P.args, **kwar
     _LOGGER.info(message)
 
 
+# {class, (service_method_name, ...)}
+_SERVICE_CALL_NAMES: Final[dict[type, tuple[str, ...]]] = {}
+
+
 def get_service_calls(obj: object) -> dict[str, Callable]:
     """Get all methods decorated with the "bind_collector" or "service_call"  decorator."""
-    return {
-        name: getattr(obj, name)
-        for name in dir(obj)
-        if not name.startswith("_") and callable(getattr(obj, name)) and hasattr(getattr(obj, name), "ha_service")
-    }
+    if (names := _SERVICE_CALL_NAMES.get(obj_class := type(obj))) is None:
+        names = tuple(
+            name
+            for name in dir(obj_class)
+            if not name.startswith("_")
+            and callable(attribute := getattr(obj_class, name))
+            and hasattr(attribute, "ha_service")
+        )
+        _SERVICE_CALL_NAMES[obj_class] = names
+    return {name: getattr(obj, name) for name in names}
 
 
 def measure_execution_time[_CallableT: Callable[..., Any]](func: _CallableT) -> _CallableT:
     """Decorate function to measure the function execution time."""
 
-    start = monotonic() if _LOGGER.isEnabledFor(level=logging.DEBUG) else None
-
     @wraps(func)
     async def async_measure_wrapper(*args: Any, **kwargs: Any) -> Any:
         """Wrap method."""
+        start = monotonic()
+        failed = True
         try:
-            return await func(*args, **kwargs)
+            result = await func(*args, **kwargs)
+            failed = False
+            return result
         finally:
-            if start:
-                _log_performance_message(func, start, *args, **kwargs)
+            _record_execution(func, start, failed, *args, **kwargs)
 
     @wraps(func)
     def measure_wrapper(*args: Any, **kwargs: Any) -> Any:
         """Wrap method."""
+        start = monotonic()
+        failed = True
         try:
-            return func(*args, **kwargs)
+            result = func(*args, **kwargs)
+            failed = False
+            return result
         finally:
-            if start:
-                _log_performance_message(func, start, *args, **kwargs)
+            _record_execution(func, start, failed, *args, **kwargs)
 
     if asyncio.iscoroutinefunction(func):
         return async_measure_wrapper  # type: ignore[return-value]
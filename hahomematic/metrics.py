@@ -0,0 +1,364 @@
+"""Metrics used within hahomematic."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Callable, Mapping
+import logging
+import math
+from typing import Any, Final
+
+from aiohttp import web
+
+__all__ = ["LATENCY_BUCKETS", "Counter", "Gauge", "LatencyHistogram", "MetricsExporter", "MetricsRegistry"]
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+# Prefix of all exported metric names.
+METRICS_PREFIX: Final = "hahomematic_"
+PROMETHEUS_CONTENT_TYPE: Final = "text/plain; version=0.0.4; charset=utf-8"
+
+type _LabelsKey = tuple[tuple[str, str], ...]
+
+# Upper bounds of the latency buckets in seconds.
+LATENCY_BUCKETS: Final[tuple[float, ...]] = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class LatencyHistogram:
+    """Histogram for latencies with fixed bucket boundaries."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        """Init the histogram."""
+        self._buckets: Final = buckets
+        # the last bucket counts all values above the highest boundary
+        self._bucket_counts: Final[list[int]] = [0] * (len(buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._min = math.inf
+        self._max = 0.0
+
+    @property
+    def count(self) -> int:
+        """Return the number of observed values."""
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        """Return the sum of observed values."""
+        return self._sum
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of observed values."""
+        return self._sum / self._count if self._count else None
+
+    @property
+    def min(self) -> float | None:
+        """Return the smallest observed value."""
+        return self._min if self._count else None
+
+    @property
+    def max(self) -> float | None:
+        """Return the largest observed value."""
+        return self._max if self._count else None
+
+    @property
+    def buckets(self) -> Mapping[float, int]:
+        """Return the cumulative counts by bucket upper bound."""
+        result: dict[float, int] = {}
+        cumulative = 0
+        for bound, count in zip((*self._buckets, math.inf), self._bucket_counts, strict=True):
+            cumulative += count
+            result[bound] = cumulative
+        return result
+
+    def observe(self, value: float) -> None:
+        """Add a value to the histogram."""
+        self._bucket_counts[bisect_left(self._buckets, value)] += 1
+        self._count += 1
+        self._sum += value
+        self._min = min(self._min, value)
+        self._max = max(self._max, value)
+
+    def quantile(self, q: float) -> float | None:
+        """Return the upper bucket bound, that contains the given quantile."""
+        if not self._count:
+            return None
+        rank = q * self._count
+        for bound, cumulative in self.buckets.items():
+            if cumulative >= rank:
+                return min(bound, self._max)
+        return self._max  # pragma: no cover
+
+    def reset(self) -> None:
+        """Reset the histogram."""
+        self._bucket_counts[:] = [0] * len(self._bucket_counts)
+        self._count = 0
+        self._sum = 0.0
+        self._min = math.inf
+        self._max = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram as dict."""
+        return {
+            "count": self._count,
+            "sum": self._sum,
+            "mean": self.mean,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+
+class Counter:
+    """Monotonically increasing counter."""
+
+    __slots__ = ("_value",)
+
+    def __init__(self) -> None:
+        """Init the counter."""
+        self._value = 0.0
+
+    @property
+    def value(self) -> float:
+        """Return the value of the counter."""
+        return self._value
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter."""
+        self._value += amount
+
+    def reset(self) -> None:
+        """Reset the counter."""
+        self._value = 0.0
+
+
+class Gauge:
+    """Value that can go up and down."""
+
+    __slots__ = ("_value",)
+
+    def __init__(self) -> None:
+        """Init the gauge."""
+        self._value = 0.0
+
+    @property
+    def value(self) -> float:
+        """Return the value of the gauge."""
+        return self._value
+
+    def set(self, value: float) -> None:
+        """Set the value of the gauge."""
+        self._value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the gauge."""
+        self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease the gauge."""
+        self._value -= amount
+
+    def reset(self) -> None:
+        """Reset the gauge."""
+        self._value = 0.0
+
+
+class MetricsRegistry:
+    """Registry of the counters, gauges and histograms of a central unit."""
+
+    def __init__(self) -> None:
+        """Init the metrics registry."""
+        # {name, description}
+        self._descriptions: Final[dict[str, str]] = {}
+        # {name, {labels, metric}}
+        self._counters: Final[dict[str, dict[_LabelsKey, Counter]]] = {}
+        self._gauges: Final[dict[str, dict[_LabelsKey, Gauge]]] = {}
+        self._histograms: Final[dict[str, dict[_LabelsKey, LatencyHistogram]]] = {}
+        self._collectors: Final[list[Callable[[MetricsRegistry], None]]] = []
+
+    def register_collector(self, collector: Callable[[MetricsRegistry], None]) -> None:
+        """Register a collector, that updates metrics before a snapshot or an export."""
+        self._collectors.append(collector)
+
+    def collect(self) -> None:
+        """Update the metrics of the registered collectors."""
+        for collector in self._collectors:
+            try:
+                collector(self)
+            except Exception as ex:  # pragma: no cover
+                _LOGGER.debug("COLLECT: Metrics collector failed: %s", ex)
+
+    def counter(self, name: str, description: str = "", labels: Mapping[str, str] | None = None) -> Counter:
+        """Return the counter with the given name and labels. Create it, if it does not exist."""
+        by_labels = self._get_series(metrics=self._counters, name=name, description=description)
+        if (counter := by_labels.get(key := _get_labels_key(labels=labels))) is None:
+            counter = by_labels[key] = Counter()
+        return counter
+
+    def gauge(self, name: str, description: str = "", labels: Mapping[str, str] | None = None) -> Gauge:
+        """Return the gauge with the given name and labels. Create it, if it does not exist."""
+        by_labels = self._get_series(metrics=self._gauges, name=name, description=description)
+        if (gauge := by_labels.get(key := _get_labels_key(labels=labels))) is None:
+            gauge = by_labels[key] = Gauge()
+        return gauge
+
+    def histogram(self, name: str, description: str = "", labels: Mapping[str, str] | None = None) -> LatencyHistogram:
+        """Return the histogram with the given name and labels. Create it, if it does not exist."""
+        by_labels = self._get_series(metrics=self._histograms, name=name, description=description)
+        if (histogram := by_labels.get(key := _get_labels_key(labels=labels))) is None:
+            histogram = by_labels[key] = LatencyHistogram()
+        return histogram
+
+    def _get_series[_MetricT](
+        self, metrics: dict[str, dict[_LabelsKey, _MetricT]], name: str, description: str
+    ) -> dict[_LabelsKey, _MetricT]:
+        """Return the series of a metric."""
+        if (by_labels := metrics.get(name)) is None:
+            by_labels = metrics[name] = {}
+            self._descriptions[name] = description
+        return by_labels
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return a snapshot of all metrics, keyed by series name."""
+        self.collect()
+        return {
+            "counters": {
+                _get_series_name(name=name, labels=labels): counter.value
+                for name, by_labels in self._counters.items()
+                for labels, counter in by_labels.items()
+            },
+            "gauges": {
+                _get_series_name(name=name, labels=labels): gauge.value
+                for name, by_labels in self._gauges.items()
+                for labels, gauge in by_labels.items()
+            },
+            "histograms": {
+                _get_series_name(name=name, labels=labels): histogram.as_dict()
+                for name, by_labels in self._histograms.items()
+                for labels, histogram in by_labels.items()
+            },
+        }
+
+    def to_prometheus(self) -> str:
+        """Return all metrics in the prometheus text exposition format."""
+        self.collect()
+        lines: list[str] = []
+        for name, counters in self._counters.items():
+            self._add_prometheus_header(lines=lines, name=name, metric_type="counter")
+            lines.extend(
+                f"{_get_series_name(name=f'{METRICS_PREFIX}{name}', labels=labels)} {_format_value(counter.value)}"
+                for labels, counter in counters.items()
+            )
+        for name, gauges in self._gauges.items():
+            self._add_prometheus_header(lines=lines, name=name, metric_type="gauge")
+            lines.extend(
+                f"{_get_series_name(name=f'{METRICS_PREFIX}{name}', labels=labels)} {_format_value(gauge.value)}"
+                for labels, gauge in gauges.items()
+            )
+        for name, histograms in self._histograms.items():
+            self._add_prometheus_header(lines=lines, name=name, metric_type="histogram")
+            full_name = f"{METRICS_PREFIX}{name}"
+            for labels, histogram in histograms.items():
+                for bound, count in histogram.buckets.items():
+                    bucket_labels = (*labels, ("le", _format_value(bound)))
+                    lines.append(f"{_get_series_name(name=f'{full_name}_bucket', labels=bucket_labels)} {count}")
+                lines.append(
+                    f"{_get_series_name(name=f'{full_name}_sum', labels=labels)} {_format_value(histogram.sum)}"
+                )
+                lines.append(f"{_get_series_name(name=f'{full_name}_count', labels=labels)} {histogram.count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def _add_prometheus_header(self, lines: list[str], name: str, metric_type: str) -> None:
+        """Add the HELP and TYPE lines of a metric."""
+        if description := self._descriptions.get(name):
+            lines.append(f"# HELP {METRICS_PREFIX}{name} {description}")
+        lines.append(f"# TYPE {METRICS_PREFIX}{name} {metric_type}")
+
+    def reset(self) -> None:
+        """Reset all metrics."""
+        for counters in self._counters.values():
+            for counter in counters.values():
+                counter.reset()
+        for gauges in self._gauges.values():
+            for gauge in gauges.values():
+                gauge.reset()
+        for histograms in self._histograms.values():
+            for histogram in histograms.values():
+                histogram.reset()
+
+
+class MetricsExporter:
+    """Serve the metrics of a registry in the prometheus text format."""
+
+    def __init__(self, registry: MetricsRegistry, ip_addr: str, port: int) -> None:
+        """Init the metrics exporter."""
+        self._registry: Final = registry
+        self._ip_addr: Final = ip_addr
+        self._port: Final = port
+        self._runner: web.AppRunner | None = None
+
+    @property
+    def listen_port(self) -> int | None:
+        """Return the port the exporter is listening on."""
+        if self._runner is None:
+            return None
+        for address in self._runner.addresses:
+            return int(address[1])
+        return None  # pragma: no cover
+
+    async def start(self) -> None:
+        """Start serving the metrics."""
+        if self._runner is not None:
+            return
+        app = web.Application()
+        app.router.add_get("/metrics", self._handle_metrics)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        try:
+            await web.TCPSite(runner, host=self._ip_addr, port=self._port).start()
+        except OSError:
+            await runner.cleanup()
+            raise
+        self._runner = runner
+        _LOGGER.debug("START: Metrics exporter listening on %s:%s", self._ip_addr, self.listen_port)
+
+    async def stop(self) -> None:
+        """Stop serving the metrics."""
+        if self._runner is None:
+            return
+        await self._runner.cleanup()
+        self._runner = None
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        """Return the metrics."""
+        return web.Response(
+            body=self._registry.to_prometheus().encode(), headers={"Content-Type": PROMETHEUS_CONTENT_TYPE}
+        )
+
+
+def _get_labels_key(labels: Mapping[str, str] | None) -> _LabelsKey:
+    """Return the hashable key of labels."""
+    return tuple(sorted((key, str(value)) for key, value in labels.items())) if labels else ()
+
+
+def _get_series_name(name: str, labels: _LabelsKey) -> str:
+    """Return the name of a series including its labels."""
+    if not labels:
+        return name
+    formatted = ",".join(f'{key}="{_escape_label_value(value)}"' for key, value in labels)
+    return f"{name}{{{formatted}}}"
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape a label value for the prometheus text format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    """Format a value for the prometheus text format."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
@@ -19,6 +19,7 @@ from hahomematic.decorators import inspector
 from hahomematic.model import device as hmd
 from hahomematic.model.event import create_event_and_append_to_channel
 from hahomematic.model.generic import create_data_point_and_append_to_channel
+from hahomematic.model.lazy import LazyEvent
 
 __all__ = ["create_data_points_and_events"]
 
@@ -99,11 +100,16 @@ def _process_parameter(
         parameter_data["OPERATIONS"] = 3
 
     if _should_create_event(parameter_data=parameter_data, parameter=parameter):
-        create_event_and_append_to_channel(
-            channel=channel,
-            parameter=parameter,
-            parameter_data=parameter_data,
-        )
+        if channel.device.central.config.lazy_device_error_events and parameter.startswith(DEVICE_ERROR_EVENTS):
+            channel.add_lazy_event(
+                LazyEvent(channel=channel, parameter=parameter, operations=parameter_data["OPERATIONS"])
+            )
+        else:
+            create_event_and_append_to_channel(
+                channel=channel,
+                parameter=parameter,
+                parameter_data=parameter_data,
+            )
     if _should_skip_data_point(
         parameter_data=parameter_data, parameter=parameter, parameter_is_un_ignored=parameter_is_un_ignored
     ):
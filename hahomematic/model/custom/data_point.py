@@ -3,18 +3,22 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Mapping
-from datetime import datetime
 import logging
 from typing import Any, Final, cast
 
-from hahomematic.const import CALLBACK_TYPE, INIT_DATETIME, CallSource, DataPointKey, DataPointUsage
-from hahomematic.decorators import get_service_calls
+from hahomematic.const import (
+    CALLBACK_TYPE,
+    INIT_MONOTONIC,
+    KWARGS_ARG_DATA_POINT,
+    CallSource,
+    DataPointKey,
+    DataPointUsage,
+)
 from hahomematic.model import device as hmd
 from hahomematic.model.custom import definition as hmed
 from hahomematic.model.custom.const import CDPD, DeviceProfile, Field
 from hahomematic.model.custom.support import CustomConfig
-from hahomematic.model.data_point import BaseDataPoint, CallParameterCollector
-from hahomematic.model.decorators import state_property
+from hahomematic.model.data_point import BaseDataPoint, CallbackDataPoint, CallParameterCollector
 from hahomematic.model.generic import data_point as hmge
 from hahomematic.model.support import (
     DataPointNameData,
@@ -58,8 +62,15 @@ class CustomDataPoint(BaseDataPoint):
         self._allow_undefined_generic_data_points: Final[bool] = self._device_def[CDPD.ALLOW_UNDEFINED_GENERIC_DPS]
         self._data_points: Final[dict[Field, hmge.GenericDataPoint]] = {}
         self._init_data_points()
+        self._readable_data_points: Final = tuple(dp for dp in self._data_points.values() if dp.is_readable)
+        # Aggregates of the readable data points, that are updated by the internal callbacks.
+        self._invalid_data_points: Final = {dp for dp in self._readable_data_points if not dp.is_valid}
+        self._uncertain_data_points: Final = {dp for dp in self._readable_data_points if dp.state_uncertain}
+        self._modified_at = max((dp.modified_at_monotonic for dp in self._readable_data_points), default=INIT_MONOTONIC)
+        self._refreshed_at = max(
+            (dp.refreshed_at_monotonic for dp in self._readable_data_points), default=INIT_MONOTONIC
+        )
         self._init_data_point_fields()
-        self._service_methods = get_service_calls(obj=self)
 
     def _init_data_point_fields(self) -> None:
         """Init the data point fields."""
@@ -78,24 +89,6 @@ class CustomDataPoint(BaseDataPoint):
         """Return the base channel no of the data point."""
         return self._base_no
 
-    @state_property
-    def modified_at(self) -> datetime:
-        """Return the latest last update timestamp."""
-        modified_at: datetime = INIT_DATETIME
-        for data_point in self._readable_data_points:
-            if (data_point_modified_at := data_point.modified_at) and data_point_modified_at > modified_at:
-                modified_at = data_point_modified_at
-        return modified_at
-
-    @state_property
-    def refreshed_at(self) -> datetime:
-        """Return the latest last refresh timestamp."""
-        refreshed_at: datetime = INIT_DATETIME
-        for data_point in self._readable_data_points:
-            if (data_point_refreshed_at := data_point.refreshed_at) and data_point_refreshed_at > refreshed_at:
-                refreshed_at = data_point_refreshed_at
-        return refreshed_at
-
     @property
     def unconfirmed_last_values_send(self) -> Mapping[Field, Any]:
         """Return the unconfirmed values send for the data point."""
@@ -113,17 +106,16 @@ class CustomDataPoint(BaseDataPoint):
     @property
     def is_valid(self) -> bool:
         """Return if the state is valid."""
-        return all(dp.is_valid for dp in self._relevant_data_points)
+        if (relevant_data_points := self._relevant_data_points) is self._readable_data_points:
+            return not self._invalid_data_points
+        return all(dp.is_valid for dp in relevant_data_points)
 
     @property
     def state_uncertain(self) -> bool:
         """Return, if the state is uncertain."""
-        return any(dp.state_uncertain for dp in self._relevant_data_points)
-
-    @property
-    def _readable_data_points(self) -> tuple[hmge.GenericDataPoint, ...]:
-        """Returns the list of readable data points."""
-        return tuple(dp for dp in self._data_points.values() if dp.is_readable)
+        if (relevant_data_points := self._relevant_data_points) is self._readable_data_points:
+            return bool(self._uncertain_data_points)
+        return any(dp.state_uncertain for dp in relevant_data_points)
 
     @property
     def _relevant_data_points(self) -> tuple[hmge.GenericDataPoint, ...]:
@@ -249,10 +241,41 @@ class CustomDataPoint(BaseDataPoint):
             data_point.force_usage(forced_usage=DataPointUsage.NO_CREATE)
 
         self._unregister_callbacks.append(
-            data_point.register_internal_data_point_updated_callback(cb=self.fire_data_point_updated_callback)
+            data_point.register_internal_data_point_updated_callback(cb=self._on_data_point_updated)
         )
         self._data_points[field] = data_point
 
+    def _on_data_point_updated(self, *args: Any, **kwargs: Any) -> None:
+        """Update the aggregates by the updated data point, and fire the data point updated callbacks."""
+        if (data_point := kwargs.get(KWARGS_ARG_DATA_POINT)) is not None and data_point.is_readable:
+            self._update_aggregates(data_point=data_point)
+        self.fire_data_point_updated_callback(*args, **kwargs)
+
+    def _update_aggregates(self, data_point: hmge.GenericDataPoint) -> None:
+        """Update the aggregates by the updated data point."""
+        if data_point.is_valid:
+            self._invalid_data_points.discard(data_point)
+        else:
+            self._invalid_data_points.add(data_point)
+        if data_point.state_uncertain:
+            self._uncertain_data_points.add(data_point)
+        else:
+            self._uncertain_data_points.discard(data_point)
+
+        # The timestamps of a data point only decrease, when a temporary value is reset.
+        if (modified_at := data_point.modified_at_monotonic) >= self._modified_at:
+            self._modified_at = modified_at
+        else:
+            self._modified_at = max(dp.modified_at_monotonic for dp in self._readable_data_points)
+        if (refreshed_at := data_point.refreshed_at_monotonic) >= self._refreshed_at:
+            self._refreshed_at = refreshed_at
+        else:
+            self._refreshed_at = max(dp.refreshed_at_monotonic for dp in self._readable_data_points)
+
+    def _get_changed_fields(self, data_point: CallbackDataPoint) -> tuple[str, ...]:
+        """Return the fields, that are changed by an update of the data_point."""
+        return tuple(field.value for field, dp in self._data_points.items() if dp is data_point)
+
     def _unregister_data_point_updated_callback(self, cb: Callable, custom_id: str) -> None:
         """Unregister update callback."""
         for unregister in self._unregister_callbacks:
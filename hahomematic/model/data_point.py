@@ -3,26 +3,31 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import asyncio
 from collections.abc import Callable, Mapping
 from contextvars import Token
+from dataclasses import dataclass
 from datetime import datetime
 from functools import partial, wraps
 from inspect import getfullargspec
 import logging
-from typing import Any, Final, cast
+from typing import TYPE_CHECKING, Any, ClassVar, Final, cast
 
 import voluptuous as vol
 
-from hahomematic import central as hmcu, client as hmcl, support as hms, validator as val
+from hahomematic import central as hmcu, client as hmcl, validator as val
 from hahomematic.async_support import loop_check
+from hahomematic.client.batcher import send_channel_values
 from hahomematic.const import (
     CALLBACK_TYPE,
     DEFAULT_CUSTOM_ID,
     DEFAULT_MULTIPLIER,
     DP_KEY_VALUE,
-    INIT_DATETIME,
+    INIT_MONOTONIC,
     KEY_CHANNEL_OPERATION_MODE_VISIBILITY,
+    KWARGS_ARG_CHANGED_FIELDS,
     KWARGS_ARG_DATA_POINT,
+    MAX_CACHE_AGE,
     NO_CACHE_ENTRY,
     WAIT_FOR_CALLBACK,
     CallSource,
@@ -30,6 +35,7 @@ from hahomematic.const import (
     DataPointKey,
     DataPointUsage,
     EventKey,
+    EventTraceStage,
     Flag,
     Operations,
     Parameter,
@@ -52,6 +58,7 @@ from hahomematic.model.support import (
     generate_unique_id,
 )
 from hahomematic.support import reduce_args
+from hahomematic.tracing import stamp_event_trace
 
 __all__ = [
     "BaseDataPoint",
@@ -109,24 +116,52 @@ EVENT_DATA_SCHEMA = vol.Schema(
 )
 
 
-class CallbackDataPoint(ABC):
-    """Base class for callback data point."""
+class CallbackDataPoint(ABC, PayloadMixin):
+    """
+    Base class for callback data point.
+
+    The callback containers and service methods are created on first use,
+    because most data points are never registered.
+    """
 
-    _category: DataPointCategory
+    __slots__ = (
+        "_central",
+        "_changed_fields",
+        "_coalesced_data_point_updated_callbacks",
+        "_custom_id",
+        "_data_point_updated_callbacks",
+        "_device_removed_callbacks",
+        "_modified_at",
+        "_path_data",
+        "_refreshed_at",
+        "_service_methods",
+        "_temporary_modified_at",
+        "_temporary_refreshed_at",
+        "_unique_id",
+    )
+
+    if TYPE_CHECKING:
+        # The category is a class attribute of the subclasses, not a slot.
+        _category: ClassVar[DataPointCategory]
 
     def __init__(self, central: hmcu.CentralUnit, unique_id: str) -> None:
         """Init the callback data_point."""
+        PayloadMixin.__init__(self)
         self._central: Final = central
         self._unique_id: Final = unique_id
-        self._data_point_updated_callbacks: dict[Callable, str] = {}
-        self._device_removed_callbacks: list[Callable] = []
+        self._data_point_updated_callbacks: dict[Callable, str] | None = None
+        self._coalesced_data_point_updated_callbacks: dict[Callable, str] | None = None
+        # fields changed since the last coalesced callback, None if no callback is scheduled
+        self._changed_fields: set[str] | None = None
+        self._device_removed_callbacks: list[Callable] | None = None
         self._custom_id: str | None = None
         self._path_data = self._get_path_data()
-        self._modified_at: datetime = INIT_DATETIME
-        self._refreshed_at: datetime = INIT_DATETIME
-        self._temporary_modified_at: datetime = INIT_DATETIME
-        self._temporary_refreshed_at: datetime = INIT_DATETIME
-        self._service_methods: dict[str, Callable] = {}
+        # monotonic times of the central clock
+        self._modified_at: float = INIT_MONOTONIC
+        self._refreshed_at: float = INIT_MONOTONIC
+        self._temporary_modified_at: float = INIT_MONOTONIC
+        self._temporary_refreshed_at: float = INIT_MONOTONIC
+        self._service_methods: Mapping[str, Callable] | None = None
 
     @state_property
     @abstractmethod
@@ -161,21 +196,37 @@ class CallbackDataPoint(ABC):
     @property
     def is_valid(self) -> bool:
         """Return, if the value of the data_point is valid based on the refreshed at datetime."""
-        return self._refreshed_at > INIT_DATETIME
+        return self._refreshed_at > INIT_MONOTONIC
 
     @state_property
     def modified_at(self) -> datetime:
         """Return the last update datetime value."""
-        if self._temporary_modified_at > self._modified_at:
-            return self._temporary_modified_at
-        return self._modified_at
+        return self._central.clock.to_datetime(monotonic_time=self._last_modified_at)
 
     @state_property
     def refreshed_at(self) -> datetime:
         """Return the last refresh datetime value."""
-        if self._temporary_refreshed_at > self._refreshed_at:
-            return self._temporary_refreshed_at
-        return self._refreshed_at
+        return self._central.clock.to_datetime(monotonic_time=self._last_refreshed_at)
+
+    @property
+    def modified_at_monotonic(self) -> float:
+        """Return the monotonic time of the last update."""
+        return self._last_modified_at
+
+    @property
+    def refreshed_at_monotonic(self) -> float:
+        """Return the monotonic time of the last refresh."""
+        return self._last_refreshed_at
+
+    @property
+    def _last_modified_at(self) -> float:
+        """Return the monotonic time of the last update."""
+        return max(self._temporary_modified_at, self._modified_at)
+
+    @property
+    def _last_refreshed_at(self) -> float:
+        """Return the monotonic time of the last refresh."""
+        return max(self._temporary_refreshed_at, self._refreshed_at)
 
     @config_property
     @abstractmethod
@@ -221,19 +272,28 @@ class CallbackDataPoint(ABC):
     @property
     def service_methods(self) -> Mapping[str, Callable]:
         """Return all service methods."""
+        if self._service_methods is None:
+            self._service_methods = get_service_calls(obj=self)
         return self._service_methods
 
     @property
     def service_method_names(self) -> tuple[str, ...]:
         """Return all service methods."""
-        return tuple(self._service_methods.keys())
+        return tuple(self.service_methods.keys())
 
     def register_internal_data_point_updated_callback(self, cb: Callable) -> CALLBACK_TYPE:
         """Register internal data_point updated callback."""
         return self.register_data_point_updated_callback(cb=cb, custom_id=DEFAULT_CUSTOM_ID)
 
-    def register_data_point_updated_callback(self, cb: Callable, custom_id: str) -> CALLBACK_TYPE:
-        """Register data_point updated callback."""
+    def register_data_point_updated_callback(
+        self, cb: Callable, custom_id: str, coalesce: bool = False
+    ) -> CALLBACK_TYPE:
+        """
+        Register data_point updated callback.
+
+        With coalesce, the callback is fired once per loop iteration,
+        and receives the changed fields as changed_fields.
+        """
         if custom_id != DEFAULT_CUSTOM_ID:
             if self._custom_id is not None and self._custom_id != custom_id:
                 raise HaHomematicException(
@@ -241,15 +301,24 @@ class CallbackDataPoint(ABC):
                 )
             self._custom_id = custom_id
 
-        if callable(cb) and cb not in self._data_point_updated_callbacks:
-            self._data_point_updated_callbacks[cb] = custom_id
+        if coalesce:
+            if self._coalesced_data_point_updated_callbacks is None:
+                self._coalesced_data_point_updated_callbacks = {}
+            callbacks = self._coalesced_data_point_updated_callbacks
+        else:
+            if self._data_point_updated_callbacks is None:
+                self._data_point_updated_callbacks = {}
+            callbacks = self._data_point_updated_callbacks
+        if callable(cb) and cb not in callbacks:
+            callbacks[cb] = custom_id
             return partial(self._unregister_data_point_updated_callback, cb=cb, custom_id=custom_id)
         return None
 
-    def _reset_temporary_timestamps(self) -> None:
-        """Reset the temporary timestamps."""
-        self._set_temporary_modified_at(now=INIT_DATETIME)
-        self._set_temporary_refreshed_at(now=INIT_DATETIME)
+    def _reset_temporary_timestamps(self) -> bool:
+        """Reset the temporary timestamps. Return, if temporary timestamps were set."""
+        was_set = self._temporary_refreshed_at != INIT_MONOTONIC
+        self._set_temporary_modified_at(now=INIT_MONOTONIC)
+        return was_set
 
     @abstractmethod
     def _get_path_data(self) -> PathData:
@@ -257,13 +326,17 @@ class CallbackDataPoint(ABC):
 
     def _unregister_data_point_updated_callback(self, cb: Callable, custom_id: str) -> None:
         """Unregister data_point updated callback."""
-        if cb in self._data_point_updated_callbacks:
+        if self._data_point_updated_callbacks and cb in self._data_point_updated_callbacks:
             del self._data_point_updated_callbacks[cb]
+        if self._coalesced_data_point_updated_callbacks and cb in self._coalesced_data_point_updated_callbacks:
+            del self._coalesced_data_point_updated_callbacks[cb]
         if self.custom_id == custom_id:
             self._custom_id = None
 
     def register_device_removed_callback(self, cb: Callable) -> CALLBACK_TYPE:
         """Register the device removed callback."""
+        if self._device_removed_callbacks is None:
+            self._device_removed_callbacks = []
         if callable(cb) and cb not in self._device_removed_callbacks:
             self._device_removed_callbacks.append(cb)
             return partial(self._unregister_device_removed_callback, cb=cb)
@@ -271,12 +344,16 @@ class CallbackDataPoint(ABC):
 
     def _unregister_device_removed_callback(self, cb: Callable) -> None:
         """Unregister the device removed callback."""
-        if cb in self._device_removed_callbacks:
+        if self._device_removed_callbacks and cb in self._device_removed_callbacks:
             self._device_removed_callbacks.remove(cb)
 
     @loop_check
     def fire_data_point_updated_callback(self, *args: Any, **kwargs: Any) -> None:
         """Do what is needed when the value of the data_point has been updated/refreshed."""
+        if self._coalesced_data_point_updated_callbacks:
+            self._schedule_coalesced_data_point_updated_callback(data_point=kwargs.get(KWARGS_ARG_DATA_POINT, self))
+        if not self._data_point_updated_callbacks:
+            return
         for callback_handler in self._data_point_updated_callbacks:
             try:
                 kwargs[KWARGS_ARG_DATA_POINT] = self
@@ -284,41 +361,79 @@ class CallbackDataPoint(ABC):
             except Exception as ex:
                 _LOGGER.warning("FIRE_DATA_POINT_UPDATED_EVENT failed: %s", reduce_args(args=ex.args))
 
+    def _schedule_coalesced_data_point_updated_callback(self, data_point: CallbackDataPoint) -> None:
+        """Collect the changed fields, and schedule the coalesced callbacks for the next loop iteration."""
+        if self._changed_fields is None:
+            self._changed_fields = set()
+            self._central.looper.call_soon(self._fire_coalesced_data_point_updated_callback)
+        self._changed_fields.update(self._get_changed_fields(data_point=data_point))
+
+    def _fire_coalesced_data_point_updated_callback(self) -> None:
+        """Fire the coalesced callbacks with the fields changed since the last call."""
+        changed_fields = frozenset(self._changed_fields or ())
+        self._changed_fields = None
+        if not self._coalesced_data_point_updated_callbacks:
+            return
+        for callback_handler in tuple(self._coalesced_data_point_updated_callbacks):
+            try:
+                callback_handler(**{KWARGS_ARG_DATA_POINT: self, KWARGS_ARG_CHANGED_FIELDS: changed_fields})
+            except Exception as ex:
+                _LOGGER.warning("FIRE_COALESCED_DATA_POINT_UPDATED_EVENT failed: %s", reduce_args(args=ex.args))
+
+    def _get_changed_fields(self, data_point: CallbackDataPoint) -> tuple[str, ...]:
+        """Return the fields, that are changed by an update of the data_point. To be overridden by subclasses."""
+        return ()
+
     @loop_check
     def fire_device_removed_callback(self, *args: Any) -> None:
         """Do what is needed when the data_point has been removed."""
+        if not self._device_removed_callbacks:
+            return
         for callback_handler in self._device_removed_callbacks:
             try:
                 callback_handler(*args)
             except Exception as ex:
                 _LOGGER.warning("FIRE_DEVICE_REMOVED_EVENT failed: %s", reduce_args(args=ex.args))
 
-    def _set_modified_at(self, now: datetime = datetime.now()) -> None:
-        """Set modified_at to current datetime."""
+    def _set_modified_at(self, now: float | None = None) -> None:
+        """Set modified_at to current monotonic time."""
+        if now is None:
+            now = self._central.clock.monotonic()
         self._modified_at = now
-        self._set_refreshed_at(now=now)
-
-    def _set_refreshed_at(self, now: datetime = datetime.now()) -> None:
-        """Set refreshed_at to current datetime."""
         self._refreshed_at = now
 
-    def _set_temporary_modified_at(self, now: datetime = datetime.now()) -> None:
-        """Set temporary_modified_at to current datetime."""
-        self._temporary_modified_at = now
-        self._set_temporary_refreshed_at(now=now)
+    def _set_refreshed_at(self, now: float | None = None) -> None:
+        """Set refreshed_at to current monotonic time."""
+        self._refreshed_at = self._central.clock.monotonic() if now is None else now
 
-    def _set_temporary_refreshed_at(self, now: datetime = datetime.now()) -> None:
-        """Set temporary_refreshed_at to current datetime."""
+    def _set_temporary_modified_at(self, now: float | None = None) -> None:
+        """Set temporary_modified_at to current monotonic time."""
+        if now is None:
+            now = self._central.clock.monotonic()
+        self._temporary_modified_at = now
         self._temporary_refreshed_at = now
 
+    def _set_temporary_refreshed_at(self, now: float | None = None) -> None:
+        """Set temporary_refreshed_at to current monotonic time."""
+        self._temporary_refreshed_at = self._central.clock.monotonic() if now is None else now
+
     def __str__(self) -> str:
         """Provide some useful information."""
         return f"path: {self.state_path}, name: {self.full_name}"
 
 
-class BaseDataPoint(CallbackDataPoint, PayloadMixin):
+class BaseDataPoint(CallbackDataPoint):
     """Base class for regular data point."""
 
+    __slots__ = (
+        "_channel",
+        "_client",
+        "_data_point_name_data",
+        "_device",
+        "_forced_usage",
+        "_is_in_multiple_channels",
+    )
+
     def __init__(
         self,
         channel: hmd.Channel,
@@ -326,7 +441,6 @@ class BaseDataPoint(CallbackDataPoint, PayloadMixin):
         is_in_multiple_channels: bool,
     ) -> None:
         """Initialize the data_point."""
-        PayloadMixin.__init__(self)
         self._channel: Final[hmd.Channel] = channel
         self._device: Final[hmd.Device] = channel.device
         super().__init__(central=channel.central, unique_id=unique_id)
@@ -413,7 +527,17 @@ class BaseParameterDataPoint[
 ](BaseDataPoint):
     """Base class for stateless data point."""
 
-    _unique_id_prefix: str = ""
+    __slots__ = (
+        "_current_value",
+        "_is_forced_sensor",
+        "_is_un_ignored",
+        "_parameter",
+        "_parameter_metadata",
+        "_paramset_key",
+        "_previous_value",
+        "_state_uncertain",
+        "_temporary_value",
+    )
 
     def __init__(
         self,
@@ -433,7 +557,7 @@ class BaseParameterDataPoint[
                 central=channel.central,
                 address=channel.address,
                 parameter=parameter,
-                prefix=self._unique_id_prefix,
+                prefix=self._get_unique_id_prefix(central=channel.central),
             ),
             is_in_multiple_channels=channel.device.central.paramset_descriptions.is_in_multiple_channels(
                 channel_address=channel.address, parameter=parameter
@@ -452,24 +576,73 @@ class BaseParameterDataPoint[
 
         self._state_uncertain: bool = True
         self._is_forced_sensor: bool = False
-        self._assign_parameter_data(parameter_data=parameter_data)
-        self._service_methods = get_service_calls(obj=self)
-
-    def _assign_parameter_data(self, parameter_data: ParameterData) -> None:
-        """Assign parameter data to instance variables."""
-        self._type: ParameterType = ParameterType(parameter_data["TYPE"])
-        self._values = tuple(parameter_data["VALUE_LIST"]) if parameter_data.get("VALUE_LIST") else None
-        self._max: ParameterT = self._convert_value(parameter_data["MAX"])
-        self._min: ParameterT = self._convert_value(parameter_data["MIN"])
-        self._default: ParameterT = self._convert_value(parameter_data.get("DEFAULT")) or self._min
-        flags: int = parameter_data["FLAGS"]
-        self._visible: bool = flags & Flag.VISIBLE == Flag.VISIBLE
-        self._service: bool = flags & Flag.SERVICE == Flag.SERVICE
-        self._operations: int = parameter_data["OPERATIONS"]
-        self._special: Mapping[str, Any] | None = parameter_data.get("SPECIAL")
-        self._raw_unit: str | None = parameter_data.get("UNIT")
-        self._unit: str | None = self._cleanup_unit(raw_unit=self._raw_unit)
-        self._multiplier: float = self._get_multiplier(raw_unit=self._raw_unit)
+        self._parameter_metadata: _ParameterMetadata = _get_parameter_metadata(
+            parameter=parameter, parameter_data=parameter_data
+        )
+
+    def _get_unique_id_prefix(self, central: hmcu.CentralUnit) -> str | None:
+        """Return the prefix of the unique id."""
+        return None
+
+    @property
+    def _type(self) -> ParameterType:
+        """Return the HomeMatic type."""
+        return self._parameter_metadata.type
+
+    @property
+    def _values(self) -> tuple[str, ...] | None:
+        """Return the values."""
+        return self._parameter_metadata.values
+
+    @property
+    def _max(self) -> ParameterT:
+        """Return max value."""
+        return cast(ParameterT, self._parameter_metadata.max)
+
+    @property
+    def _min(self) -> ParameterT:
+        """Return min value."""
+        return cast(ParameterT, self._parameter_metadata.min)
+
+    @property
+    def _default(self) -> ParameterT:
+        """Return default value."""
+        return cast(ParameterT, self._parameter_metadata.default)
+
+    @property
+    def _visible(self) -> bool:
+        """Return the if data_point is visible in ccu."""
+        return self._parameter_metadata.visible
+
+    @property
+    def _service(self) -> bool:
+        """Return the if data_point is a service message."""
+        return self._parameter_metadata.service
+
+    @property
+    def _operations(self) -> int:
+        """Return the operations."""
+        return self._parameter_metadata.operations
+
+    @property
+    def _special(self) -> Mapping[str, Any] | None:
+        """Return the special values."""
+        return self._parameter_metadata.special
+
+    @property
+    def _raw_unit(self) -> str | None:
+        """Return raw unit value."""
+        return self._parameter_metadata.raw_unit
+
+    @property
+    def _unit(self) -> str | None:
+        """Return the fixed unit value."""
+        return self._parameter_metadata.unit
+
+    @property
+    def _multiplier(self) -> float:
+        """Return multiplier value."""
+        return self._parameter_metadata.multiplier
 
     @property
     def default(self) -> ParameterT:
@@ -653,32 +826,13 @@ class BaseParameterDataPoint[
         )
         self._is_forced_sensor = True
 
-    def _cleanup_unit(self, raw_unit: str | None) -> str | None:
-        """Replace given unit."""
-        if new_unit := _FIX_UNIT_BY_PARAM.get(self._parameter):
-            return new_unit
-        if not raw_unit:
-            return None
-        for check, fix in _FIX_UNIT_REPLACE.items():
-            if check in raw_unit:
-                return fix
-        return raw_unit
-
-    def _get_multiplier(self, raw_unit: str | None) -> float:
-        """Replace given unit."""
-        if not raw_unit:
-            return DEFAULT_MULTIPLIER
-        if multiplier := _MULTIPLIER_UNIT.get(raw_unit):
-            return multiplier
-        return DEFAULT_MULTIPLIER
-
     @abstractmethod
     async def event(self, value: Any) -> None:
         """Handle event for which this handler has subscribed."""
 
     async def load_data_point_value(self, call_source: CallSource, direct_call: bool = False) -> None:
         """Init the data_point data."""
-        if direct_call is False and hms.changed_within_seconds(last_change=self._refreshed_at):
+        if direct_call is False and self._central.clock.changed_within_seconds(monotonic_time=self._refreshed_at):
             return
 
         # Check, if data_point is readable
@@ -697,16 +851,20 @@ class BaseParameterDataPoint[
 
     def write_value(self, value: Any) -> tuple[ParameterT, ParameterT]:
         """Update value of the data_point."""
-        self._reset_temporary_value()
+        temporary_value_reset = self._reset_temporary_value()
 
         old_value = self._current_value
         if value == NO_CACHE_ENTRY:
-            if self.refreshed_at != INIT_DATETIME:
+            if self._last_refreshed_at != INIT_MONOTONIC:
                 self._state_uncertain = True
                 self.fire_data_point_updated_callback()
+            elif temporary_value_reset:
+                # The timestamps decreased, so the listeners must be notified.
+                self.fire_data_point_updated_callback()
             return (old_value, None)  # type: ignore[return-value]
 
         new_value = self._convert_value(value)
+        stamp_event_trace(EventTraceStage.CONVERTED)
         if old_value == new_value:
             self._set_refreshed_at()
         else:
@@ -717,6 +875,28 @@ class BaseParameterDataPoint[
         self.fire_data_point_updated_callback()
         return (old_value, new_value)
 
+    def get_value_snapshot(self) -> tuple[Any, float, float] | None:
+        """Return the value with the wall clock times of the last update and refresh, if the value is valid."""
+        if not self.is_valid:
+            return None
+        clock = self._central.clock
+        return (
+            self._current_value,
+            clock.to_wall_time(monotonic_time=self._modified_at),
+            clock.to_wall_time(monotonic_time=self._refreshed_at),
+        )
+
+    def restore_value_snapshot(self, value: Any, modified_at: float, refreshed_at: float) -> None:
+        """Restore a value from a snapshot. The value is uncertain, until it is refreshed."""
+        clock = self._central.clock
+        # Restored values are never considered fresh, so the next load refreshes them.
+        restored_refreshed_at = min(clock.from_wall_time(wall_time=refreshed_at), clock.monotonic() - MAX_CACHE_AGE)
+        self._current_value = value
+        self._modified_at = min(clock.from_wall_time(wall_time=modified_at), restored_refreshed_at)
+        self._refreshed_at = restored_refreshed_at
+        self._state_uncertain = True
+        self.fire_data_point_updated_callback()
+
     def write_temporary_value(self, value: Any) -> None:
         """Update the temporary value of the data_point."""
         self._reset_temporary_value()
@@ -738,28 +918,19 @@ class BaseParameterDataPoint[
             paramset_key=self._paramset_key,
             parameter=self._parameter,
         ):
-            self._assign_parameter_data(parameter_data=parameter_data)
+            self._parameter_metadata = _get_parameter_metadata(parameter=self._parameter, parameter_data=parameter_data)
+            self._invalidate_config_payload()
+
+    def _get_changed_fields(self, data_point: CallbackDataPoint) -> tuple[str, ...]:
+        """Return the fields, that are changed by an update of the data_point."""
+        return (self._parameter,) if data_point is self else ()
 
     def _convert_value(self, value: Any) -> ParameterT:
         """Convert to value to ParameterT."""
-        if value is None:
-            return None  # type: ignore[return-value]
         try:
-            if (
-                self._type == ParameterType.BOOL
-                and self._values is not None
-                and value is not None
-                and isinstance(value, str)
-            ):
-                return cast(
-                    ParameterT,
-                    convert_value(
-                        value=self._values.index(value),
-                        target_type=self._type,
-                        value_list=self.values,
-                    ),
-                )
-            return cast(ParameterT, convert_value(value=value, target_type=self._type, value_list=self.values))
+            return cast(
+                ParameterT, _convert_parameter_value(value=value, parameter_type=self._type, values=self._values)
+            )
         except (ValueError, TypeError):  # pragma: no cover
             _LOGGER.debug(
                 "CONVERT_VALUE: conversion failed for %s, %s, %s, value: [%s]",
@@ -770,10 +941,10 @@ class BaseParameterDataPoint[
             )
             return None  # type: ignore[return-value]
 
-    def _reset_temporary_value(self) -> None:
-        """Reset the temp storage."""
+    def _reset_temporary_value(self) -> bool:
+        """Reset the temp storage. Return, if a temporary value was set."""
         self._temporary_value = None  # type: ignore[assignment]
-        self._reset_temporary_timestamps()
+        return self._reset_temporary_timestamps()
 
     def get_event_data(self, value: Any = None) -> dict[EventKey, Any]:
         """Get the event_data."""
@@ -817,31 +988,37 @@ class CallParameterCollector:
         )
 
     async def send_data(self, wait_for_callback: int | None) -> set[DP_KEY_VALUE]:
-        """Send data to backend."""
+        """
+        Send data to backend.
+
+        The paramsets are sent ordered by collector_order. The channels of a collector_order are sent concurrently,
+        or handed over to the write batcher of the client, if writes should be coalesced.
+        """
         dpk_values: set[DP_KEY_VALUE] = set()
         for paramset_key, paramsets in self._paramsets.items():
             for paramset_no in dict(sorted(paramsets.items())).values():
-                for channel_address, paramset in paramset_no.items():
-                    if len(paramset.values()) == 1:
-                        for parameter, value in paramset.items():
-                            dpk_values.update(
-                                await self._client.set_value(
-                                    channel_address=channel_address,
-                                    paramset_key=paramset_key,
-                                    parameter=parameter,
-                                    value=value,
-                                    wait_for_callback=wait_for_callback,
-                                )
-                            )
-                    else:
-                        dpk_values.update(
-                            await self._client.put_paramset(
-                                channel_address=channel_address,
-                                paramset_key=paramset_key,
-                                values=paramset,
-                                wait_for_callback=wait_for_callback,
-                            )
+                if (write_batcher := self._client.write_batcher) is not None:
+                    dpk_values.update(
+                        await write_batcher.send(
+                            paramset_key=paramset_key,
+                            paramsets=paramset_no,
+                            wait_for_callback=wait_for_callback,
+                        )
+                    )
+                    continue
+                for result in await asyncio.gather(
+                    *(
+                        send_channel_values(
+                            client=self._client,
+                            channel_address=channel_address,
+                            paramset_key=paramset_key,
+                            values=paramset,
+                            wait_for_callback=wait_for_callback,
                         )
+                        for channel_address, paramset in paramset_no.items()
+                    )
+                ):
+                    dpk_values.update(result)
         return dpk_values
 
 
@@ -902,3 +1079,115 @@ def bind_collector(
         return bind_wrapper  # type: ignore[return-value]
 
     return bind_decorator
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class _ParameterMetadata:
+    """Immutable metadata of a parameter, that is shared by all data points with the same parameter description."""
+
+    type: ParameterType
+    values: tuple[str, ...] | None
+    max: Any
+    min: Any
+    default: Any
+    visible: bool
+    service: bool
+    operations: int
+    special: Mapping[str, Any] | None
+    raw_unit: str | None
+    unit: str | None
+    multiplier: float
+
+
+# {(parameter, frozen parameter_data), parameter_metadata}
+_PARAMETER_METADATA_CACHE: Final[dict[tuple[str, tuple[Any, ...]], _ParameterMetadata]] = {}
+_PARAMETER_METADATA_KEYS: Final = (
+    "DEFAULT",
+    "FLAGS",
+    "MAX",
+    "MIN",
+    "OPERATIONS",
+    "SPECIAL",
+    "TYPE",
+    "UNIT",
+    "VALUE_LIST",
+)
+
+
+def _get_parameter_metadata(parameter: str, parameter_data: ParameterData) -> _ParameterMetadata:
+    """Return the shared metadata of a parameter."""
+    key = (parameter, tuple(_freeze(parameter_data.get(name)) for name in _PARAMETER_METADATA_KEYS))
+    if (metadata := _PARAMETER_METADATA_CACHE.get(key)) is None:
+        metadata = _create_parameter_metadata(parameter=parameter, parameter_data=parameter_data)
+        _PARAMETER_METADATA_CACHE[key] = metadata
+    return metadata
+
+
+def _create_parameter_metadata(parameter: str, parameter_data: ParameterData) -> _ParameterMetadata:
+    """Create the metadata of a parameter."""
+    parameter_type = ParameterType(parameter_data["TYPE"])
+    values = tuple(parameter_data["VALUE_LIST"]) if parameter_data.get("VALUE_LIST") else None
+
+    def _convert(value: Any) -> Any:
+        try:
+            return _convert_parameter_value(value=value, parameter_type=parameter_type, values=values)
+        except (ValueError, TypeError):  # pragma: no cover
+            _LOGGER.debug("CREATE_PARAMETER_METADATA: conversion failed for %s, value: [%s]", parameter, value)
+            return None
+
+    min_value = _convert(parameter_data["MIN"])
+    flags: int = parameter_data["FLAGS"]
+    raw_unit: str | None = parameter_data.get("UNIT")
+    return _ParameterMetadata(
+        type=parameter_type,
+        values=values,
+        max=_convert(parameter_data["MAX"]),
+        min=min_value,
+        default=_convert(parameter_data.get("DEFAULT")) or min_value,
+        visible=flags & Flag.VISIBLE == Flag.VISIBLE,
+        service=flags & Flag.SERVICE == Flag.SERVICE,
+        operations=parameter_data["OPERATIONS"],
+        special=parameter_data.get("SPECIAL"),
+        raw_unit=raw_unit,
+        unit=_cleanup_unit(parameter=parameter, raw_unit=raw_unit),
+        multiplier=_get_multiplier(raw_unit=raw_unit),
+    )
+
+
+def _convert_parameter_value(value: Any, parameter_type: ParameterType, values: tuple[str, ...] | None) -> Any:
+    """Convert a value to the type of the parameter."""
+    if value is None:
+        return None
+    if parameter_type == ParameterType.BOOL and values is not None and isinstance(value, str):
+        return convert_value(value=values.index(value), target_type=parameter_type, value_list=values)
+    return convert_value(value=value, target_type=parameter_type, value_list=values)
+
+
+def _cleanup_unit(parameter: str, raw_unit: str | None) -> str | None:
+    """Replace given unit."""
+    if new_unit := _FIX_UNIT_BY_PARAM.get(parameter):
+        return new_unit
+    if not raw_unit:
+        return None
+    for check, fix in _FIX_UNIT_REPLACE.items():
+        if check in raw_unit:
+            return fix
+    return raw_unit
+
+
+def _get_multiplier(raw_unit: str | None) -> float:
+    """Replace given unit."""
+    if not raw_unit:
+        return DEFAULT_MULTIPLIER
+    if multiplier := _MULTIPLIER_UNIT.get(raw_unit):
+        return multiplier
+    return DEFAULT_MULTIPLIER
+
+
+def _freeze(value: Any) -> Any:
+    """Return a hashable representation of a parameter description value."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    return value
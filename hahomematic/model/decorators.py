@@ -5,7 +5,7 @@ from __future__ import annotations
 from collections.abc import Callable, Mapping
 from datetime import datetime
 from enum import Enum
-from typing import Any, ParamSpec, TypeVar
+from typing import Any, Final, ParamSpec, TypeVar
 
 __all__ = [
     "config_property",
@@ -89,14 +89,34 @@ class state_property[_GETTER, _SETTER](generic_property[_GETTER, _SETTER]):
     """Decorate to mark own value properties."""
 
 
-def _get_public_attributes_by_class_decorator(data_object: Any, class_decorator: type) -> Mapping[str, Any]:
+# {(data_class, class_decorator), ((attribute_name, getter), ...)}
+_PUBLIC_ATTRIBUTE_GETTERS: Final[dict[tuple[type, type[property]], tuple[tuple[str, Callable[[Any], Any]], ...]]] = {}
+
+
+def _get_public_attribute_getters(
+    data_class: type, class_decorator: type[property]
+) -> tuple[tuple[str, Callable[[Any], Any]], ...]:
+    """Return the names and getters of the public attributes by decorator. Computed once per class."""
+    if (getters := _PUBLIC_ATTRIBUTE_GETTERS.get((data_class, class_decorator))) is None:
+        getters = tuple(
+            (name, attribute.fget)
+            for name in dir(data_class)
+            if not name.startswith("_")
+            and isinstance(attribute := getattr(data_class, name), class_decorator)
+            and attribute.fget is not None
+        )
+        _PUBLIC_ATTRIBUTE_GETTERS[(data_class, class_decorator)] = getters
+    return getters
+
+
+def _get_public_attributes_by_class_decorator(data_object: Any, class_decorator: type[property]) -> Mapping[str, Any]:
     """Return the object attributes by decorator."""
-    pub_attributes = [
-        y
-        for y in dir(data_object.__class__)
-        if not y.startswith("_") and isinstance(getattr(data_object.__class__, y), class_decorator)
-    ]
-    return {x: _get_text_value(getattr(data_object, x)) for x in pub_attributes}
+    return {
+        name: _get_text_value(getter(data_object))
+        for name, getter in _get_public_attribute_getters(
+            data_class=data_object.__class__, class_decorator=class_decorator
+        )
+    }
 
 
 def _get_text_value(value: Any) -> Any:
@@ -53,6 +53,7 @@ from hahomematic.model.data_point import BaseParameterDataPoint, CallbackDataPoi
 from hahomematic.model.decorators import info_property, state_property
 from hahomematic.model.event import GenericEvent
 from hahomematic.model.generic import GenericDataPoint
+from hahomematic.model.lazy import LazyEvent
 from hahomematic.model.support import (
     ChannelNameData,
     PayloadMixin,
@@ -626,6 +627,7 @@ class Channel(PayloadMixin):
         self._custom_data_point: hmce.CustomDataPoint | None = None
         self._generic_data_points: Final[dict[DataPointKey, GenericDataPoint]] = {}
         self._generic_events: Final[dict[DataPointKey, GenericEvent]] = {}
+        self._lazy_generic_events: Final[dict[DataPointKey, LazyEvent]] = {}
         self._modified_at: datetime = INIT_DATETIME
         self._rooms: Final = self._central.device_details.get_channel_rooms(channel_address=channel_address)
         self._function: Final = self._central.device_details.get_function_text(address=self._address)
@@ -694,6 +696,11 @@ class Channel(PayloadMixin):
         """Return the id of the channel."""
         return self._id
 
+    @property
+    def lazy_events(self) -> tuple[LazyEvent, ...]:
+        """Return the placeholders of events, that are not created yet."""
+        return tuple(self._lazy_generic_events.values())
+
     @property
     def name(self) -> str:
         """Return the name of the channel."""
@@ -800,6 +807,18 @@ class Channel(PayloadMixin):
         if isinstance(data_point, GenericEvent):
             self._generic_events[data_point.dpk] = data_point
 
+    def add_lazy_event(self, lazy_event: LazyEvent) -> None:
+        """Add a lazy event to a channel, that is created on first access."""
+        self._central.add_event_subscription(data_point=lazy_event)
+        self._lazy_generic_events[lazy_event.dpk] = lazy_event
+
+    def _create_lazy_event(self, dpk: DataPointKey) -> None:
+        """Create the event of a lazy event."""
+        if (lazy_event := self._lazy_generic_events.pop(dpk, None)) is None:
+            return
+        self._central.remove_lazy_event_subscription(lazy_event=lazy_event)
+        lazy_event.create()
+
     def _remove_data_point(self, data_point: CallbackDataPoint) -> None:
         """Remove a data_point from a channel."""
         if isinstance(data_point, BaseParameterDataPoint):
@@ -815,6 +834,10 @@ class Channel(PayloadMixin):
 
     def remove(self) -> None:
         """Remove data points from collections and central."""
+        for lazy_event in self._lazy_generic_events.values():
+            self._central.remove_event_subscription(data_point=lazy_event)
+        self._lazy_generic_events.clear()
+
         for event in self.generic_events:
             self._remove_data_point(event)
         self._generic_events.clear()
@@ -851,6 +874,10 @@ class Channel(PayloadMixin):
 
     def get_events(self, event_type: EventType, registered: bool | None = None) -> tuple[GenericEvent, ...]:
         """Return a list of specific events of a channel."""
+        if event_type == EventType.DEVICE_ERROR:
+            # Lazy device error events are created, when they are requested.
+            for dpk in tuple(self._lazy_generic_events):
+                self._create_lazy_event(dpk=dpk)
         return tuple(
             event
             for event in self._generic_events.values()
@@ -891,14 +918,16 @@ class Channel(PayloadMixin):
 
     def get_generic_event(self, parameter: str) -> GenericEvent | None:
         """Return a generic event from device."""
-        return self._generic_events.get(
-            DataPointKey(
-                interface_id=self._device.interface_id,
-                channel_address=self._address,
-                paramset_key=ParamsetKey.VALUES,
-                parameter=parameter,
-            )
+        dpk = DataPointKey(
+            interface_id=self._device.interface_id,
+            channel_address=self._address,
+            paramset_key=ParamsetKey.VALUES,
+            parameter=parameter,
         )
+        if (event := self._generic_events.get(dpk)) is None and dpk in self._lazy_generic_events:
+            self._create_lazy_event(dpk=dpk)
+            event = self._generic_events.get(dpk)
+        return event
 
     def get_readable_data_points(self, paramset_key: ParamsetKey) -> tuple[GenericDataPoint, ...]:
         """Return the list of readable master data points."""
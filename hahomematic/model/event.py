@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Final
+from typing import Any, ClassVar, Final
 
-from hahomematic import support as hms
+from hahomematic import central as hmcu, support as hms
 from hahomematic.async_support import loop_check
 from hahomematic.const import (
     CLICK_EVENTS,
@@ -39,8 +39,10 @@ _LOGGER: Final = logging.getLogger(__name__)
 class GenericEvent(BaseParameterDataPoint[Any, Any]):
     """Base class for events."""
 
+    __slots__ = ()
+
     _category = DataPointCategory.EVENT
-    _event_type: EventType
+    _event_type: ClassVar[EventType]
 
     def __init__(
         self,
@@ -49,7 +51,6 @@ class GenericEvent(BaseParameterDataPoint[Any, Any]):
         parameter_data: ParameterData,
     ) -> None:
         """Initialize the event handler."""
-        self._unique_id_prefix = f"event_{channel.central.name}"
         super().__init__(
             channel=channel,
             paramset_key=ParamsetKey.VALUES,
@@ -57,6 +58,10 @@ class GenericEvent(BaseParameterDataPoint[Any, Any]):
             parameter_data=parameter_data,
         )
 
+    def _get_unique_id_prefix(self, central: hmcu.CentralUnit) -> str:
+        """Return the prefix of the unique id."""
+        return f"event_{central.name}"
+
     @property
     def usage(self) -> DataPointUsage:
         """Return the data_point usage."""
@@ -96,12 +101,16 @@ class GenericEvent(BaseParameterDataPoint[Any, Any]):
 class ClickEvent(GenericEvent):
     """class for handling click events."""
 
+    __slots__ = ()
+
     _event_type = EventType.KEYPRESS
 
 
 class DeviceErrorEvent(GenericEvent):
     """class for handling device error events."""
 
+    __slots__ = ()
+
     _event_type = EventType.DEVICE_ERROR
 
     async def event(self, value: Any) -> None:
@@ -122,6 +131,8 @@ class DeviceErrorEvent(GenericEvent):
 class ImpulseEvent(GenericEvent):
     """class for handling impulse events."""
 
+    __slots__ = ()
+
     _event_type = EventType.IMPULSE
 
 
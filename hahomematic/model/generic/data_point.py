@@ -18,6 +18,8 @@ class GenericDataPoint[ParameterT: GenericParameterType, InputParameterT: Generi
 ):
     """Base class for generic data point."""
 
+    __slots__ = ()
+
     _validate_state_change: bool = True
     is_hmtype: Final = True
 
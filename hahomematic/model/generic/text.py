@@ -13,4 +13,6 @@ class DpText(GenericDataPoint[str, str]):
     This is a default data point that gets automatically generated.
     """
 
+    __slots__ = ()
+
     _category = DataPointCategory.TEXT
@@ -67,6 +67,8 @@ class Hub:
         self._sema_fetch_programs: Final = asyncio.Semaphore()
         self._central: Final = central
         self._config: Final = central.config
+        # backend timestamp of the last refresh of the system variables
+        self._sysvar_timestamp: int = 0
 
     @inspector(re_raise=False)
     async def fetch_sysvar_data(self, scheduled: bool) -> None:
@@ -132,7 +134,18 @@ class Hub:
         """Retrieve all variable data and update hmvariable values."""
         if not (client := self._central.primary_client):
             return
-        if (variables := await client.get_all_system_variables(markers=self._config.sysvar_markers)) is None:
+        variables: tuple[SystemVariableData, ...] | None
+        complete = True
+        if (
+            changes := await client.get_changed_system_variables(
+                markers=self._config.sysvar_markers, since=self._sysvar_timestamp
+            )
+        ) is not None:
+            # After the first complete refresh, only changed system variables are transferred.
+            self._sysvar_timestamp = changes.timestamp
+            variables = changes.variables
+            complete = changes.complete
+        elif (variables := await client.get_all_system_variables(markers=self._config.sysvar_markers)) is None:
             _LOGGER.debug("UPDATE_SYSVAR_DATA_POINTS: Unable to retrieve sysvars for %s", self._central.name)
             return
 
@@ -147,7 +160,7 @@ class Hub:
         if self._central.model is Backend.CCU:
             variables = _clean_variables(variables)
 
-        if missing_variable_ids := self._identify_missing_variable_ids(variables=variables):
+        if complete and (missing_variable_ids := self._identify_missing_variable_ids(variables=variables)):
             self._remove_sysvar_data_point(del_data_point_ids=missing_variable_ids)
 
         new_sysvars: list[GenericSysvarDataPoint] = []
@@ -210,24 +223,21 @@ class Hub:
 
     def _identify_missing_program_ids(self, programs: tuple[ProgramData, ...]) -> set[str]:
         """Identify missing programs."""
-        return {
-            program_dp.pid
-            for program_dp in self._central.program_data_points
-            if program_dp.pid not in [x.pid for x in programs]
-        }
+        program_ids = {x.pid for x in programs}
+        return {program_dp.pid for program_dp in self._central.program_data_points if program_dp.pid not in program_ids}
 
     def _identify_missing_variable_ids(self, variables: tuple[SystemVariableData, ...]) -> set[str]:
         """Identify missing variables."""
         variable_ids: dict[str, bool] = {x.vid: x.extended_sysvar for x in variables}
-        missing_variable_ids: list[str] = []
+        missing_variable_ids: set[str] = set()
         for sysvar_data_point in self._central.sysvar_data_points:
             if sysvar_data_point.data_type == SysvarType.STRING:
                 continue
             if (vid := sysvar_data_point.vid) is not None and (
                 vid not in variable_ids or (sysvar_data_point.is_extended is not variable_ids.get(vid))
             ):
-                missing_variable_ids.append(vid)
-        return set(missing_variable_ids)
+                missing_variable_ids.add(vid)
+        return missing_variable_ids
 
 
 def _is_excluded(variable: str, excludes: list[str]) -> bool:
@@ -16,13 +16,12 @@ from hahomematic.const import (
     SystemVariableData,
     SysvarType,
 )
-from hahomematic.decorators import get_service_calls, inspector
+from hahomematic.decorators import inspector
 from hahomematic.model.data_point import CallbackDataPoint
 from hahomematic.model.decorators import config_property, state_property
 from hahomematic.model.device import Channel
 from hahomematic.model.support import (
     PathData,
-    PayloadMixin,
     ProgramPathData,
     SysvarPathData,
     generate_unique_id,
@@ -31,7 +30,7 @@ from hahomematic.model.support import (
 from hahomematic.support import parse_sys_var
 
 
-class GenericHubDataPoint(CallbackDataPoint, PayloadMixin):
+class GenericHubDataPoint(CallbackDataPoint):
     """Class for a HomeMatic system variable."""
 
     def __init__(
@@ -41,7 +40,6 @@ class GenericHubDataPoint(CallbackDataPoint, PayloadMixin):
         data: HubData,
     ) -> None:
         """Initialize the data_point."""
-        PayloadMixin.__init__(self)
         unique_id: Final = generate_unique_id(
             central=central,
             address=address,
@@ -119,7 +117,6 @@ class GenericSysvarDataPoint(GenericHubDataPoint):
         self._current_value: SYSVAR_TYPE = data.value
         self._previous_value: SYSVAR_TYPE = None
         self._temporary_value: SYSVAR_TYPE = None
-        self._service_methods = get_service_calls(obj=self)
 
     @property
     def data_type(self) -> SysvarType | None:
@@ -263,7 +260,6 @@ class GenericProgramDataPoint(GenericHubDataPoint):
         self._is_internal: bool = data.is_internal
         self._last_execute_time: str = data.last_execute_time
         self._state_uncertain: bool = True
-        self._service_methods = get_service_calls(obj=self)
 
     @state_property
     def is_active(self) -> bool:
@@ -293,6 +289,7 @@ class GenericProgramDataPoint(GenericHubDataPoint):
             do_update = True
         if self._is_internal != data.is_internal:
             self._is_internal = data.is_internal
+            self._invalidate_config_payload()
             do_update = True
         if self._last_execute_time != data.last_execute_time:
             self._last_execute_time = data.last_execute_time
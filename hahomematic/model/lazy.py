@@ -0,0 +1,97 @@
+"""Placeholders for device error events, that are created on first access."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Final
+
+from hahomematic.const import DataPointKey, Operations, ParamsetKey
+from hahomematic.model import device as hmd
+from hahomematic.model.event import create_event_and_append_to_channel
+from hahomematic.model.support import DataPointPathData
+
+__all__ = ["LazyEvent"]
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+class LazyEvent:
+    """
+    Lightweight placeholder for a generic event.
+
+    The placeholder only holds the key data of the parameter. The event
+    is created by the channel on first access, or when the first event is received.
+    """
+
+    __slots__ = ("_channel", "_operations", "_parameter")
+
+    def __init__(self, channel: hmd.Channel, parameter: str, operations: int) -> None:
+        """Init the lazy event."""
+        self._channel: Final = channel
+        self._parameter: Final = parameter
+        self._operations: Final = operations
+
+    @property
+    def channel(self) -> hmd.Channel:
+        """Return the channel of the lazy event."""
+        return self._channel
+
+    @property
+    def dpk(self) -> DataPointKey:
+        """Return data_point key value."""
+        return DataPointKey(
+            interface_id=self._channel.device.interface_id,
+            channel_address=self._channel.address,
+            paramset_key=ParamsetKey.VALUES,
+            parameter=self._parameter,
+        )
+
+    @property
+    def is_readable(self) -> bool:
+        """Return, if event is readable."""
+        return bool(self._operations & Operations.READ)
+
+    @property
+    def parameter(self) -> str:
+        """Return parameter name."""
+        return self._parameter
+
+    @property
+    def state_path(self) -> str:
+        """Return the base state path of the event."""
+        return DataPointPathData(
+            interface=self._channel.device.client.interface,
+            address=self._channel.device.address,
+            channel_no=self._channel.no,
+            kind=self._parameter,
+        ).state_path
+
+    @property
+    def supports_events(self) -> bool:
+        """Return, if event is supports events."""
+        return bool(self._operations & Operations.EVENT)
+
+    def create(self) -> None:
+        """Create the event and append it to the channel."""
+        if not (
+            parameter_data := self._channel.device.central.paramset_descriptions.get_parameter_data(
+                interface_id=self._channel.device.interface_id,
+                channel_address=self._channel.address,
+                paramset_key=ParamsetKey.VALUES,
+                parameter=self._parameter,
+            )
+        ):
+            _LOGGER.debug("CREATE: Missing parameter data for %s, %s", self._channel.address, self._parameter)
+            return
+        create_event_and_append_to_channel(
+            channel=self._channel, parameter=self._parameter, parameter_data=parameter_data
+        )
+
+    async def event(self, value: Any) -> None:
+        """Create the event on the first received event, and forward the event."""
+        if event := self._channel.get_generic_event(parameter=self._parameter):
+            await event.event(value=value)
+
+    def __str__(self) -> str:
+        """Provide some useful information."""
+        return f"lazy event: {self._channel.address}, {self._parameter}"
@@ -73,14 +73,23 @@ _BINARY_SENSOR_TRUE_VALUE_DICT_FOR_VALUE_LIST: Final[Mapping[tuple[str, ...], st
 class PayloadMixin:
     """Mixin to add payload methods to class."""
 
+    __slots__ = ("_cached_config_payload",)
+
+    def __init__(self) -> None:
+        """Init the payload mixin."""
+        self._cached_config_payload: Mapping[str, Any] | None = None
+
     @property
     def config_payload(self) -> Mapping[str, Any]:
-        """Return the config payload."""
-        return {
-            key: value
-            for key, value in get_public_attributes_for_config_property(data_object=self).items()
-            if value is not None
-        }
+        """Return the config payload. The payload is cached until it is invalidated."""
+        if (config_payload := self._cached_config_payload) is None:
+            config_payload = {
+                key: value
+                for key, value in get_public_attributes_for_config_property(data_object=self).items()
+                if value is not None
+            }
+            self._cached_config_payload = config_payload
+        return config_payload
 
     @property
     def info_payload(self) -> Mapping[str, Any]:
@@ -100,6 +109,10 @@ class PayloadMixin:
             if value is not None
         }
 
+    def _invalidate_config_payload(self) -> None:
+        """Invalidate the cached config payload after a change of config properties."""
+        self._cached_config_payload = None
+
 
 class TimerMixin:
     """Mixin to add on_time support."""
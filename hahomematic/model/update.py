@@ -14,17 +14,17 @@ from hahomematic.const import (
     DataPointCategory,
     Interface,
 )
-from hahomematic.decorators import get_service_calls, inspector
+from hahomematic.decorators import inspector
 from hahomematic.exceptions import HaHomematicException
 from hahomematic.model import device as hmd
 from hahomematic.model.data_point import CallbackDataPoint
 from hahomematic.model.decorators import config_property, state_property
-from hahomematic.model.support import DataPointPathData, PayloadMixin, generate_unique_id
+from hahomematic.model.support import DataPointPathData, generate_unique_id
 
 __all__ = ["DpUpdate"]
 
 
-class DpUpdate(CallbackDataPoint, PayloadMixin):
+class DpUpdate(CallbackDataPoint):
     """
     Implementation of a update.
 
@@ -35,14 +35,12 @@ class DpUpdate(CallbackDataPoint, PayloadMixin):
 
     def __init__(self, device: hmd.Device) -> None:
         """Init the callback data_point."""
-        PayloadMixin.__init__(self)
         self._device: Final = device
         super().__init__(
             central=device.central,
             unique_id=generate_unique_id(central=device.central, address=device.address, parameter="Update"),
         )
         self._set_modified_at()
-        self._service_methods = get_service_calls(obj=self)
 
     @state_property
     def available(self) -> bool:
@@ -103,8 +101,10 @@ class DpUpdate(CallbackDataPoint, PayloadMixin):
             kind=DataPointCategory.UPDATE,
         )
 
-    def register_data_point_updated_callback(self, cb: Callable, custom_id: str) -> CALLBACK_TYPE:
-        """Register update callback."""
+    def register_data_point_updated_callback(
+        self, cb: Callable, custom_id: str, coalesce: bool = False
+    ) -> CALLBACK_TYPE:
+        """Register update callback. Firmware updates are rare, so callbacks are never coalesced."""
         if custom_id != DEFAULT_CUSTOM_ID:
             if self._custom_id is not None:
                 raise HaHomematicException(
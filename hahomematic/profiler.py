@@ -0,0 +1,142 @@
+"""Sampling profiler, that writes collapsed stacks for a bounded window."""
+
+from __future__ import annotations
+
+from collections import Counter
+from datetime import datetime
+import logging
+import os
+import sys
+import threading
+from time import monotonic
+from types import FrameType
+from typing import Final
+
+from hahomematic.const import PROFILE_PATH, PROFILER_HOTSPOT_COUNT, PROFILER_SAMPLE_INTERVAL
+
+__all__ = ["SamplingProfiler"]
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+_PACKAGE: Final = "hahomematic"
+_PROFILE_FILE_EXTENSION: Final = "collapsed"
+# Innermost frames of waiting threads. Their samples are written, but are no hotspots.
+_IDLE_FRAMES: Final = frozenset(
+    {
+        "concurrent.futures.thread:_worker",
+        "queue:get",
+        "selectors:select",
+        "threading:wait",
+    }
+)
+
+
+class SamplingProfiler:
+    """
+    Sample the stacks of all threads in a background thread.
+
+    The samples are written as collapsed stacks (one `frame;frame;... count` line per stack),
+    that can be rendered by flame graph tools. Hotspots are attributed to the innermost
+    hahomematic module of each sample, e.g. `caches.visibility`.
+    """
+
+    def __init__(self, storage_folder: str, name: str, interval: float = PROFILER_SAMPLE_INTERVAL) -> None:
+        """Init the sampling profiler."""
+        self._storage_folder: Final = storage_folder
+        self._name: Final = name
+        self._interval: Final = interval
+        self._stop_event: Final = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._stacks: Final[Counter[str]] = Counter()
+        self._hotspots: Final[Counter[str]] = Counter()
+        self._sample_count = 0
+        self._file_path: str | None = None
+
+    @property
+    def file_path(self) -> str | None:
+        """Return the path of the last written profile."""
+        return self._file_path
+
+    @property
+    def hotspots(self) -> list[tuple[str, int]]:
+        """Return the hahomematic modules with the most samples."""
+        return self._hotspots.most_common(PROFILER_HOTSPOT_COUNT)
+
+    @property
+    def is_running(self) -> bool:
+        """Return if the profiler is sampling."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, duration: float) -> bool:
+        """Start sampling for the duration in seconds. Return False, if the profiler is already running."""
+        if self.is_running:
+            return False
+        self._stop_event.clear()
+        self._stacks.clear()
+        self._hotspots.clear()
+        self._sample_count = 0
+        self._thread = threading.Thread(
+            target=self._run, args=(duration,), name=f"SamplingProfiler {self._name}", daemon=True
+        )
+        self._thread.start()
+        _LOGGER.info("SAMPLING_PROFILER: Sampling %s for %.0fs", self._name, duration)
+        return True
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the profile to be written."""
+        if (thread := self._thread) is None:
+            return
+        self._stop_event.set()
+        if thread is not threading.current_thread():
+            thread.join()
+
+    def _run(self, duration: float) -> None:
+        """Sample until the duration is over or the profiler is stopped, and write the profile."""
+        own_ident = threading.get_ident()
+        deadline = monotonic() + duration
+        while monotonic() < deadline and not self._stop_event.wait(self._interval):
+            thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():  # noqa: SLF001 # pylint: disable=protected-access
+                if ident != own_ident:
+                    self._add_sample(thread_name=thread_names.get(ident, str(ident)), frame=frame)
+            self._sample_count += 1
+        self._write_profile()
+
+    def _add_sample(self, thread_name: str, frame: FrameType) -> None:
+        """Add the stack of a frame to the samples."""
+        frames: list[str] = []
+        hotspot: str | None = None
+        current: FrameType | None = frame
+        while current is not None:
+            module = current.f_globals.get("__name__", "?")
+            frames.append(f"{module}:{current.f_code.co_name}")
+            if hotspot is None and module.startswith(f"{_PACKAGE}."):
+                hotspot = module[len(_PACKAGE) + 1 :]
+            current = current.f_back
+        frames.append(thread_name)
+        self._stacks[";".join(reversed(frames))] += 1
+        if hotspot is not None and frames[0] not in _IDLE_FRAMES:
+            self._hotspots[hotspot] += 1
+
+    def _write_profile(self) -> None:
+        """Write the collapsed stacks to the storage folder, and log the hotspots."""
+        file_path = os.path.join(
+            self._storage_folder,
+            PROFILE_PATH,
+            f"{self._name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{_PROFILE_FILE_EXTENSION}",
+        )
+        try:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(file_path, mode="w", encoding="utf-8") as file_pointer:
+                file_pointer.writelines(f"{stack} {count}\n" for stack, count in self._stacks.items())
+        except OSError as err:
+            _LOGGER.warning("SAMPLING_PROFILER: Unable to write profile %s: %s", file_path, err)
+            return
+        self._file_path = file_path
+        _LOGGER.info(
+            "SAMPLING_PROFILER: Wrote %i samples of %s to %s. Hotspots: %s",
+            self._sample_count,
+            self._name,
+            file_path,
+            ", ".join(f"{module} ({count})" for module, count in self.hotspots) or "none",
+        )
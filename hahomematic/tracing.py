@@ -0,0 +1,99 @@
+"""Tracing of backend events from the XML-RPC callback to the data point callbacks."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+import logging
+import random
+from time import monotonic
+from typing import Final
+
+from hahomematic.const import EventTraceStage
+from hahomematic.context import EVENT_TRACE_VAR
+from hahomematic.metrics import MetricsRegistry
+
+__all__ = ["EventTrace", "EventTracer", "stamp_event_trace"]
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+class EventTrace:
+    """Monotonic time stamps of the stages of a backend event."""
+
+    __slots__ = ("channel_address", "interface_id", "parameter", "stamps")
+
+    def __init__(self, interface_id: str, channel_address: str, parameter: str) -> None:
+        """Init the event trace."""
+        self.interface_id: Final = interface_id
+        self.channel_address: Final = channel_address
+        self.parameter: Final = parameter
+        self.stamps: Final[dict[EventTraceStage, float]] = {EventTraceStage.RECEIVED: monotonic()}
+
+    def stamp(self, stage: EventTraceStage) -> None:
+        """Stamp a stage. Only the first stamp of a stage is kept."""
+        if stage not in self.stamps:
+            self.stamps[stage] = monotonic()
+
+    def get_latencies(self) -> dict[EventTraceStage, float]:
+        """Return the latencies of the stages since the event was received."""
+        received_at = self.stamps[EventTraceStage.RECEIVED]
+        return {stage: stamp - received_at for stage, stamp in self.stamps.items() if stage != EventTraceStage.RECEIVED}
+
+    def __str__(self) -> str:
+        """Provide some useful information."""
+        latencies = ", ".join(f"{stage}: {latency * 1000:.3f}ms" for stage, latency in self.get_latencies().items())
+        return f"{self.interface_id}, {self.channel_address}, {self.parameter}: {latencies}"
+
+
+class EventTracer:
+    """Create traces of backend events, and aggregate them into latency histograms by interface."""
+
+    def __init__(self, metrics: MetricsRegistry, enabled: bool, log_sample_rate: float) -> None:
+        """Init the event tracer."""
+        self._metrics: Final = metrics
+        self._enabled: Final = enabled
+        self._log_sample_rate: Final = log_sample_rate
+
+    @property
+    def enabled(self) -> bool:
+        """Return if tracing of events is enabled."""
+        return self._enabled
+
+    @contextmanager
+    def trace(self, interface_id: str, channel_address: str, parameter: str) -> Iterator[EventTrace | None]:
+        """
+        Trace a received event.
+
+        Tasks, that are scheduled within this context, inherit the trace.
+        """
+        if not self._enabled:
+            yield None
+            return
+        event_trace = EventTrace(interface_id=interface_id, channel_address=channel_address, parameter=parameter)
+        token = EVENT_TRACE_VAR.set(event_trace)
+        try:
+            yield event_trace
+        finally:
+            EVENT_TRACE_VAR.reset(token)
+
+    def finish(self) -> None:
+        """Record the trace of the event, that is currently processed."""
+        if (event_trace := EVENT_TRACE_VAR.get()) is None:
+            return
+        EVENT_TRACE_VAR.set(None)
+        event_trace.stamp(EventTraceStage.CALLBACKS_DONE)
+        for stage, latency in event_trace.get_latencies().items():
+            self._metrics.histogram(
+                name="event_latency_seconds",
+                description="Latency of backend events since they were received by the callback server",
+                labels={"interface_id": event_trace.interface_id, "stage": stage},
+            ).observe(latency)
+        if self._log_sample_rate > 0 and random.random() < self._log_sample_rate:
+            _LOGGER.info("EVENT_TRACE: %s", event_trace)
+
+
+def stamp_event_trace(stage: EventTraceStage) -> None:
+    """Stamp a stage of the event, that is currently processed."""
+    if (event_trace := EVENT_TRACE_VAR.get()) is not None:
+        event_trace.stamp(stage)
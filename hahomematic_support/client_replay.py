@@ -0,0 +1,83 @@
+"""The replay client-object, that serves the captured traffic of a backend."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Final
+
+from hahomematic.capture import TrafficReplay
+from hahomematic.client import _ClientConfig
+from hahomematic.const import CallSource, DeviceDescription, ParameterData, ParamsetKey
+from hahomematic.decorators import inspector
+from hahomematic_support.client_local import ClientLocal, LocalRessources
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+class ClientReplay(ClientLocal):
+    """
+    Replay client object, that serves the captured responses of a backend.
+
+    Set values are confirmed by a faked event, like with the local client.
+    """
+
+    def __init__(self, client_config: _ClientConfig, replay: TrafficReplay) -> None:
+        """Initialize the Client."""
+        super().__init__(
+            client_config=client_config,
+            local_resources=LocalRessources(address_device_translation={}, ignore_devices_on_create=[]),
+        )
+        self._replay: Final = replay
+
+    @inspector(re_raise=False, measure_performance=True)
+    async def list_devices(self) -> tuple[DeviceDescription, ...] | None:
+        """Get the captured device descriptions."""
+        if (device_descriptions := await self._replay.call("listDevices")) is None:
+            return None
+        return tuple(device_descriptions)
+
+    @inspector(log_level=logging.NOTSET)
+    async def get_value(
+        self,
+        channel_address: str,
+        paramset_key: ParamsetKey,
+        parameter: str,
+        call_source: CallSource = CallSource.MANUAL_OR_SCHEDULED,
+    ) -> Any:
+        """Return a captured value."""
+        if paramset_key == ParamsetKey.VALUES:
+            return await self._replay.call("getValue", channel_address, parameter)
+        paramset = await self._replay.call("getParamset", channel_address, ParamsetKey.MASTER) or {}
+        return paramset.get(parameter)
+
+    @inspector()
+    async def get_paramset(
+        self,
+        address: str,
+        paramset_key: ParamsetKey | str,
+        call_source: CallSource = CallSource.MANUAL_OR_SCHEDULED,
+    ) -> Any:
+        """Return a captured paramset."""
+        return await self._replay.call("getParamset", address, paramset_key) or {}
+
+    async def _get_paramset_description(
+        self, address: str, paramset_key: ParamsetKey
+    ) -> dict[str, ParameterData] | None:
+        """Get a captured paramset description."""
+        return await self._replay.call("getParamsetDescription", address, paramset_key)  # type: ignore[no-any-return]
+
+    async def replay_events(self) -> int:
+        """Replay the captured callbacks of the backend. Return the number of replayed callbacks."""
+        return await self._replay.replay_events(interface_id=self.interface_id, handler=self._handle_callback)
+
+    async def _handle_callback(self, method: str, interface_id: str, *args: Any) -> None:
+        """Forward a captured callback to the central."""
+        match method:
+            case "event":
+                await self.central.data_point_event(interface_id, *args)
+            case "newDevices":
+                await self.central.add_new_devices(interface_id=interface_id, device_descriptions=tuple(args[0]))
+            case "deleteDevices":
+                await self.central.delete_devices(interface_id=interface_id, addresses=tuple(args[0]))
+            case _:
+                _LOGGER.debug("REPLAY_EVENTS: Skipping callback %s", method)
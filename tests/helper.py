@@ -24,7 +24,7 @@ from tests import const
 
 _LOGGER = logging.getLogger(__name__)
 
-EXCLUDE_METHODS_FROM_MOCKS: Final = []
+EXCLUDE_METHODS_FROM_MOCKS: Final = ["set_modified_at"]
 INCLUDE_PROPERTIES_IN_MOCKS: Final = []
 GOT_DEVICES = False
 
@@ -44,6 +44,10 @@ class Factory:
         interface_config: InterfaceConfig | None,
         un_ignore_list: list[str] | None = None,
         ignore_custom_device_definition_models: list[str] | None = None,
+        lazy_device_error_events: bool = False,
+        enable_sysvar_push: bool = False,
+        sysvar_push_scan_interval: int | None = None,
+        start_direct: bool = True,
     ) -> CentralUnit:
         """Return a central based on give address_device_translation."""
         interface_configs = {interface_config} if interface_config else set()
@@ -59,7 +63,10 @@ class Factory:
             client_session=self._client_session,
             un_ignore_list=un_ignore_list,
             ignore_custom_device_definition_models=ignore_custom_device_definition_models,
-            start_direct=True,
+            start_direct=start_direct,
+            lazy_device_error_events=lazy_device_error_events,
+            enable_sysvar_push=enable_sysvar_push,
+            sysvar_push_scan_interval=sysvar_push_scan_interval,
         ).create_central()
 
         central.register_backend_system_callback(self.system_event_mock)
@@ -74,6 +81,10 @@ class Factory:
         ignore_devices_on_create: list[str] | None = None,
         un_ignore_list: list[str] | None = None,
         ignore_custom_device_definition_models: list[str] | None = None,
+        lazy_device_error_events: bool = False,
+        enable_sysvar_push: bool = False,
+        sysvar_push_scan_interval: int | None = None,
+        start_direct: bool = True,
     ) -> tuple[CentralUnit, Client | Mock]:
         """Return a central based on give address_device_translation."""
         interface_config = InterfaceConfig(
@@ -86,6 +97,10 @@ class Factory:
             interface_config=interface_config,
             un_ignore_list=un_ignore_list,
             ignore_custom_device_definition_models=ignore_custom_device_definition_models,
+            lazy_device_error_events=lazy_device_error_events,
+            enable_sysvar_push=enable_sysvar_push,
+            sysvar_push_scan_interval=sysvar_push_scan_interval,
+            start_direct=start_direct,
         )
 
         _client = ClientLocal(
@@ -114,6 +129,10 @@ class Factory:
         ignore_devices_on_create: list[str] | None = None,
         un_ignore_list: list[str] | None = None,
         ignore_custom_device_definition_models: list[str] | None = None,
+        lazy_device_error_events: bool = False,
+        enable_sysvar_push: bool = False,
+        sysvar_push_scan_interval: int | None = None,
+        start_direct: bool = True,
     ) -> tuple[CentralUnit, Client | Mock]:
         """Return a central based on give address_device_translation."""
         central, client = await self.get_unpatched_default_central(
@@ -122,6 +141,10 @@ class Factory:
             ignore_devices_on_create=ignore_devices_on_create,
             un_ignore_list=un_ignore_list,
             ignore_custom_device_definition_models=ignore_custom_device_definition_models,
+            lazy_device_error_events=lazy_device_error_events,
+            enable_sysvar_push=enable_sysvar_push,
+            sysvar_push_scan_interval=sysvar_push_scan_interval,
+            start_direct=start_direct,
         )
 
         patch("hahomematic.central.CentralUnit._get_primary_client", return_value=client).start()
@@ -153,6 +176,7 @@ def get_prepared_custom_data_point(
     if cdp := central.get_custom_data_point(address=address, channel_no=channel_no):
         for dp in cdp._data_points.values():
             dp._state_uncertain = False
+        cdp._uncertain_data_points.clear()
         return cdp
     return None
 
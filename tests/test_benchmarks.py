@@ -0,0 +1,86 @@
+"""Tests for the benchmarks of hahomematic."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from benchmarks.installation import SyntheticInstallation, started_central
+from benchmarks.load import LoadProfile, _partition_events, run_load
+from benchmarks.run import compare_results, run_benchmarks
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_run_benchmarks(tmp_path: Path) -> None:
+    """Test the benchmarks on a small installation."""
+    results = await run_benchmarks(size=2, workdir=str(tmp_path), event_count=10, round_trip_count=2)
+    by_benchmark = {result.benchmark: result for result in results}
+    assert set(by_benchmark) == {
+        "startup_cold",
+        "startup_warm",
+        "cache_save",
+        "cache_load",
+        "events",
+        "set_value_round_trip",
+        "memory_per_device",
+    }
+    assert by_benchmark["startup_cold"].details["devices"] == 2
+    assert by_benchmark["events"].value > 0
+    assert by_benchmark["memory_per_device"].value > 0
+
+
+@pytest.mark.asyncio
+async def test_started_central_is_stopped(tmp_path: Path) -> None:
+    """Test, that the central and its clients are stopped on exit."""
+    async with started_central(installation=SyntheticInstallation(size=2), storage_folder=str(tmp_path)) as central:
+        assert central.started is True
+        assert central.has_clients is True
+    assert central.started is False
+    assert central.has_clients is False
+
+
+def test_compare_results() -> None:
+    """Test the detection of regressions."""
+    baseline = [
+        {"benchmark": "startup_cold", "size": 50, "value": 1.0, "unit": "s", "lower_is_better": True},
+        {"benchmark": "events", "size": 50, "value": 1000.0, "unit": "events/s", "lower_is_better": False},
+    ]
+    results = [
+        {"benchmark": "startup_cold", "size": 50, "value": 1.1, "unit": "s", "lower_is_better": True},
+        {"benchmark": "events", "size": 50, "value": 500.0, "unit": "events/s", "lower_is_better": False},
+    ]
+    regressions = compare_results(results=results, baseline=baseline)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("events[50]")
+
+
+@pytest.mark.asyncio
+async def test_run_load(tmp_path: Path) -> None:
+    """Test the load generator on a small installation."""
+    result = await run_load(
+        installation=SyntheticInstallation(size=2),
+        storage_folder=str(tmp_path),
+        profile=LoadProfile(rate=200.0, duration=0.5, batch_size=5, jitter=0.5, senders=2, seed=1),
+    )
+    assert result.devices == 2
+    assert result.sent > 0
+    assert result.failed_requests == 0
+    assert result.processed == result.sent
+    assert result.dropped == 0
+    assert set(result.latency) == {"p50", "p95", "p99", "max"}
+
+
+def test_partition_events() -> None:
+    """Test, that all events of a parameter are sent by a single sender."""
+    events = [
+        ("test-BidCos-RF", "VCU0000001:1", "STATE", True),
+        ("test-BidCos-RF", "VCU0000001:1", "LEVEL", 0.5),
+        ("test-BidCos-RF", "VCU0000001:1", "STATE", False),
+        ("test-BidCos-RF", "VCU0000002:1", "STATE", True),
+    ]
+    partitions = _partition_events(events=events, senders=2)
+    assert partitions == [[events[0], events[2], events[3]], [events[1]]]
+    # senders without events are omitted, and no event is duplicated
+    partitions = _partition_events(events=events, senders=5)
+    assert len(partitions) == 3
+    assert sorted(event for partition in partitions for event in partition) == sorted(events)
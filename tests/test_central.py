@@ -2,29 +2,47 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
+import logging
+from pathlib import Path
 from typing import Any
-from unittest.mock import Mock, call, patch
+from unittest.mock import AsyncMock, Mock, call, patch
 
 import pytest
 
+from hahomematic.capture import TrafficRecorder, TrafficReplay, read_capture
 from hahomematic.central import CentralUnit
+from hahomematic.central.memory import DeepSizeEstimator
+from hahomematic.central.xml_rpc_server import RPCFunctions, create_xml_rpc_server
 from hahomematic.client import Client
+from hahomematic.client.batcher import WriteBatcher
+from hahomematic.client.xml_rpc import XmlRpcProxy
+from hahomematic.clock import ManualClock
 from hahomematic.const import (
     DATETIME_FORMAT_MILLIS,
     LOCAL_HOST,
     PING_PONG_MISMATCH_COUNT,
+    PORT_ANY,
+    DataOperationResult,
     DataPointCategory,
+    DataPointKey,
     DataPointUsage,
     EventKey,
+    EventTraceStage,
     EventType,
     Interface,
     InterfaceEventType,
     Operations,
     Parameter,
     ParamsetKey,
+    SystemVariableChanges,
+    SystemVariableData,
 )
 from hahomematic.exceptions import HaHomematicException, NoClientsException
+from hahomematic.model.device import Device
+from hahomematic.model.event import GenericEvent
+from hahomematic.tracing import EventTracer
 
 from tests import const, helper
 
@@ -67,6 +85,259 @@ async def test_central_basics(
     assert dps
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_pending_confirmations(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the pending confirmations of send values."""
+    central, _, _ = central_client_factory
+    registry = central.pending_confirmations
+    dpk = DataPointKey(
+        interface_id=const.INTERFACE_ID,
+        channel_address="VCU2128127:4",
+        paramset_key=ParamsetKey.VALUES,
+        parameter="STATE",
+    )
+    wait_task = asyncio.create_task(registry.wait_for_confirmation(dpk_values=[(dpk, True)], max_wait=1))
+    await asyncio.sleep(0)
+    assert registry.is_pending(dpk=dpk) is True
+    await central.data_point_event(const.INTERFACE_ID, "VCU2128127:4", "STATE", False)
+    assert registry.is_pending(dpk=dpk) is True
+    await central.data_point_event(const.INTERFACE_ID, "VCU2128127:4", "STATE", True)
+    assert await wait_task is True
+    assert registry.is_pending(dpk=dpk) is False
+    assert registry.pending_count == 0
+    assert registry.latency.count == 1
+
+    assert await registry.wait_for_confirmation(dpk_values=[(dpk, False)], max_wait=0.01) is False
+    assert registry.timeout_count == 1
+    assert registry.pending_count == 0
+
+    # string payloads of path events are confirmed by the converted value
+    wait_task = asyncio.create_task(registry.wait_for_confirmation(dpk_values=[(dpk, False)], max_wait=1))
+    await asyncio.sleep(0)
+    await central.data_point_event(const.INTERFACE_ID, "VCU2128127:4", "STATE", "false")
+    assert await wait_task is True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        ({}, True, True, False, None, None),
+    ],
+)
+async def test_sysvar_push(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test pushed system variable changes."""
+    central, _, factory = central_client_factory
+    sysvar = central.get_sysvar_data_point(vid="9")
+    assert sysvar.value == 23.2
+    await central.data_point_event(const.INTERFACE_ID, "sysvar", "9", "21.5")
+    await central.looper.block_till_done()
+    assert sysvar.value == 23.2
+    assert central.is_sysvar_push_active is False
+
+    central, _ = await factory.get_default_central({}, add_sysvars=True, enable_sysvar_push=True)
+    try:
+        sysvar = central.get_sysvar_data_point(vid="9")
+        with patch.object(central, "fetch_sysvar_data") as fetch_sysvar_data:
+            await central.data_point_event(const.INTERFACE_ID, "sysvar", "9", "21.5")
+            await central.looper.block_till_done()
+            assert sysvar.value == 21.5
+            assert central.is_sysvar_push_active is True
+            # without a push scan interval, polling is not relaxed by pushes
+            await central._scheduler._refresh_sysvar_data()
+            await central._scheduler._refresh_sysvar_data()
+            assert fetch_sysvar_data.call_count == 2
+    finally:
+        await central.stop()
+
+    central, _ = await factory.get_default_central(
+        {}, add_sysvars=True, enable_sysvar_push=True, sysvar_push_scan_interval=600
+    )
+    try:
+        sysvar = central.get_sysvar_data_point(vid="9")
+        # system variables are polled, until a change is pushed
+        with patch.object(central, "fetch_sysvar_data") as fetch_sysvar_data:
+            await central._scheduler._refresh_sysvar_data()
+            await central._scheduler._refresh_sysvar_data()
+            assert fetch_sysvar_data.call_count == 2
+            assert central.is_sysvar_push_active is False
+
+            await central.data_point_event(const.INTERFACE_ID, "sysvar", "9", "21.5")
+            await central.looper.block_till_done()
+            assert sysvar.value == 21.5
+            assert central.is_sysvar_push_active is True
+            # while changes are pushed, system variables are only polled with the push scan interval
+            await central._scheduler._refresh_sysvar_data()
+            assert fetch_sysvar_data.call_count == 2
+    finally:
+        await central.stop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        ({}, True, True, False, None, None),
+    ],
+)
+async def test_changed_system_variables(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test that only changed system variables are applied after a complete refresh."""
+    central, client, _ = central_client_factory
+    sysvar = central.get_sysvar_data_point(vid="9")
+    changed = SystemVariableData(vid="9", legacy_name=sysvar.legacy_name, value=21.5)
+    with patch.object(
+        client,
+        "get_changed_system_variables",
+        AsyncMock(
+            side_effect=(
+                SystemVariableChanges(timestamp=1000, variables=(changed,)),
+                SystemVariableChanges(timestamp=2000, variables=()),
+            )
+        ),
+    ) as get_changed_system_variables:
+        await central.fetch_sysvar_data(scheduled=True)
+        assert sysvar.value == 21.5
+        # the other system variables are kept, because the changes are not complete
+        assert central.get_sysvar_data_point(vid="1") is not None
+        await central.fetch_sysvar_data(scheduled=True)
+        assert get_changed_system_variables.call_args.kwargs["since"] == 1000
+        assert sysvar.value == 21.5
+
+    with patch.object(
+        client,
+        "get_changed_system_variables",
+        AsyncMock(return_value=SystemVariableChanges(timestamp=3000, variables=(changed,), complete=True)),
+    ):
+        await central.fetch_sysvar_data(scheduled=True)
+        assert central.get_sysvar_data_point(vid="1") is None
+        assert central.get_sysvar_data_point(vid="9") is sysvar
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_write_batcher(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the write batcher."""
+    _, client, _ = central_client_factory
+    write_batcher = WriteBatcher(client=client, window=0.01)
+    results = await asyncio.gather(
+        write_batcher.send(
+            paramset_key=ParamsetKey.VALUES,
+            paramsets={"VCU2128127:4": {"STATE": True}},
+            wait_for_callback=None,
+        ),
+        write_batcher.send(
+            paramset_key=ParamsetKey.VALUES,
+            paramsets={"VCU2128127:4": {"ON_TIME": 10.0}, "VCU6354483:1": {"SET_POINT_TEMPERATURE": 21.0}},
+            wait_for_callback=None,
+        ),
+        write_batcher.send(
+            paramset_key=ParamsetKey.VALUES,
+            paramsets={"VCU2128127:4": {"ON_TIME": 5.0, "STATE": False}},
+            wait_for_callback=None,
+        ),
+    )
+    assert write_batcher.write_count == 3
+    assert write_batcher.batch_count == 1
+    assert write_batcher.request_count == 3
+    # each caller gets the send values of its own parameters
+    assert {dpk.parameter for dpk, _ in results[0]} == {"STATE"}
+    assert {dpk.parameter for dpk, _ in results[1]} == {"ON_TIME", "SET_POINT_TEMPERATURE"}
+    assert {(dpk.parameter, value) for dpk, value in results[2]} == {("ON_TIME", 5.0), ("STATE", False)}
+    # single parameter writes are merged, writes of multiple parameters are sent after them in order
+    channel_calls = [
+        method_call
+        for method_call in client.method_calls
+        if method_call.kwargs.get("channel_address") == "VCU2128127:4"
+    ]
+    assert channel_calls == [
+        call.put_paramset(
+            channel_address="VCU2128127:4",
+            paramset_key=ParamsetKey.VALUES,
+            values={"STATE": True, "ON_TIME": 10.0},
+            wait_for_callback=None,
+        ),
+        call.put_paramset(
+            channel_address="VCU2128127:4",
+            paramset_key=ParamsetKey.VALUES,
+            values={"ON_TIME": 5.0, "STATE": False},
+            wait_for_callback=None,
+        ),
+    ]
+    assert (
+        call.set_value(
+            channel_address="VCU6354483:1",
+            paramset_key=ParamsetKey.VALUES,
+            parameter="SET_POINT_TEMPERATURE",
+            value=21.0,
+            wait_for_callback=None,
+        )
+        in client.method_calls
+    )
+
+    # callers do not wait forever, if the batch is cancelled while it is sent
+    async def send_slowly(**kwargs: Any) -> set[Any]:
+        await asyncio.sleep(10)
+        return set()
+
+    with patch.object(client, "set_value", side_effect=send_slowly):
+        send_task = asyncio.create_task(
+            write_batcher.send(
+                paramset_key=ParamsetKey.VALUES, paramsets={"VCU2128127:4": {"STATE": True}}, wait_for_callback=None
+            )
+        )
+        await asyncio.sleep(0.05)
+        client.central.looper.cancel_tasks()
+        with pytest.raises(asyncio.CancelledError):
+            await send_task
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     (
@@ -93,6 +364,51 @@ async def test_device_get_data_points(
     assert dps_reg == ()
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_data_point_index(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the data point index of the central."""
+    central, _, _ = central_client_factory
+    all_dps = [
+        dp
+        for device in central.devices
+        for dp in device.get_data_points(category=DataPointCategory.SENSOR, exclude_no_create=False)
+    ]
+    assert all_dps
+    assert set(central.get_data_points(category=DataPointCategory.SENSOR, exclude_no_create=False)) == set(all_dps)
+    assert set(central.get_data_points(category=DataPointCategory.SENSOR, interface=Interface.BIDCOS_RF)) == {
+        dp for dp in all_dps if dp.usage != DataPointUsage.NO_CREATE
+    }
+    assert central.get_data_points(interface=Interface.HMIP_RF) == ()
+
+    readable_master_dps = central.get_readable_generic_data_points(paramset_key=ParamsetKey.MASTER)
+    assert all(dp.paramset_key == ParamsetKey.MASTER and dp.is_readable for dp in readable_master_dps)
+    readable_values_dps = central.get_readable_generic_data_points(paramset_key=ParamsetKey.VALUES)
+    assert readable_values_dps
+    assert len(central.get_readable_generic_data_points()) == len(readable_master_dps) + len(readable_values_dps)
+
+    device = central.get_device("VCU2128127")
+    assert device
+    device_dps = set(device.get_data_points(exclude_no_create=False))
+    central.remove_device(device=device)
+    assert not device_dps & set(central.get_data_points(exclude_no_create=False))
+    assert not device_dps & set(central.get_readable_generic_data_points())
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     (
@@ -116,6 +432,387 @@ async def test_device_export(
     await device.export_device_definition()
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_value_snapshot(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the snapshot and restore of data point values."""
+    central, _, _ = central_client_factory
+    clock = ManualClock(start=datetime(2025, 1, 1, 12, 0, 0))
+    with patch.object(central, "_clock", clock):
+        switch = helper.get_prepared_custom_data_point(central, "VCU2128127", 4)
+        assert switch
+        state = central.get_generic_data_point("VCU2128127:4", "STATE")
+        await central.data_point_event(const.INTERFACE_ID, "VCU2128127:4", "STATE", 1)
+        clock.advance(100)
+        await central.data_point_event(const.INTERFACE_ID, "VCU2128127:4", "STATE", 1)
+        modified_at = state.modified_at
+        refreshed_at = state.refreshed_at
+
+        snapshot = central._value_snapshot
+        assert await snapshot.save() == DataOperationResult.NO_SAVE
+        snapshot.create_snapshot()
+
+        clock.advance(100)
+        await central.data_point_event(const.INTERFACE_ID, "VCU2128127:4", "STATE", 0)
+        assert state.value is False
+        assert switch.state_uncertain is False
+
+        assert snapshot.restore_device(device=state.device) is True
+        assert state.value is True
+        assert state.state_uncertain is True
+        assert switch.state_uncertain is True
+        assert state.modified_at == modified_at
+        assert state.refreshed_at == refreshed_at
+        assert central.clock.changed_within_seconds(monotonic_time=state._refreshed_at) is False
+        # the snapshot is only restored once
+        assert snapshot.restore_device(device=state.device) is False
+
+        await central.data_point_event(const.INTERFACE_ID, "VCU2128127:4", "STATE", 0)
+        assert state.value is False
+        assert state.state_uncertain is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_metrics(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the metrics of measured functions."""
+    central, _, _ = central_client_factory
+    await central.load_and_refresh_data_point_data(interface=Interface.BIDCOS_RF)
+
+    snapshot = central.metrics.snapshot()
+    add_devices_series = f'function="_add_new_devices",interface_id="{const.INTERFACE_ID}"'
+    assert snapshot["histograms"][f"execution_duration_seconds{{{add_devices_series}}}"]["count"] == 1
+    assert snapshot["counters"][f"executions_total{{{add_devices_series}}}"] == 1
+    refresh_series = 'execution_duration_seconds{function="load_and_refresh_data_point_data",interface="BidCos-RF"}'
+    assert snapshot["histograms"][refresh_series]["count"] == 1
+    assert snapshot["gauges"]["devices"] == len(central.devices)
+
+    prometheus = central.metrics.to_prometheus()
+    assert "# TYPE hahomematic_execution_duration_seconds histogram" in prometheus
+    assert f"hahomematic_execution_duration_seconds_count{{{add_devices_series}}} 1" in prometheus
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_event_tracing(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the tracing of backend events."""
+    central, _, _ = central_client_factory
+    assert central.event_tracer.enabled is False
+    rpc_functions = RPCFunctions(xml_rpc_server=Mock(get_central=Mock(return_value=central)))
+    with patch.object(
+        central, "_event_tracer", EventTracer(metrics=central.metrics, enabled=True, log_sample_rate=1.0)
+    ):
+        with caplog.at_level(logging.INFO, logger="hahomematic.tracing"):
+            await asyncio.to_thread(rpc_functions.event, const.INTERFACE_ID, "VCU2128127:4", "STATE", 1)
+            await central.looper.block_till_done()
+        assert central.get_generic_data_point("VCU2128127:4", "STATE").value is True
+        # events, that are not received by the callback server, are not traced
+        await central.data_point_event(const.INTERFACE_ID, "VCU2128127:4", "STATE", 0)
+
+    histograms = central.metrics.snapshot()["histograms"]
+    for stage in (
+        EventTraceStage.SCHEDULED,
+        EventTraceStage.DISPATCHED,
+        EventTraceStage.CONVERTED,
+        EventTraceStage.CALLBACKS_DONE,
+    ):
+        assert histograms[f'event_latency_seconds{{interface_id="{const.INTERFACE_ID}",stage="{stage}"}}']["count"] == 1
+    assert "EVENT_TRACE: CentralTest-BidCos-RF, VCU2128127:4, STATE" in caplog.text
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_traffic_capture(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+    tmp_path: Path,
+) -> None:
+    """Test the capture of backend traffic, and the replay of captured events."""
+    central, _, _ = central_client_factory
+    assert central.traffic_recorder.enabled is False
+    recorder = TrafficRecorder(storage_folder=str(tmp_path), central_name=central.name, enabled=True)
+    with patch.object(central, "_traffic_recorder", recorder):
+        xml_rpc_server = create_xml_rpc_server(ip_addr=LOCAL_HOST, port=PORT_ANY)
+        xml_rpc_server.add_central(central)
+        proxy = XmlRpcProxy(
+            max_workers=1,
+            interface_id=const.INTERFACE_ID,
+            connection_state=central.connection_state,
+            recorder=recorder,
+            uri=f"http://{LOCAL_HOST}:{xml_rpc_server.listen_port}",
+        )
+        try:
+            assert "event" in await proxy.system.listMethods()
+            await proxy.event(const.INTERFACE_ID, "VCU2128127:4", "STATE", True)
+            await central.looper.block_till_done()
+        finally:
+            await proxy.stop()
+            xml_rpc_server.remove_central(central)
+            xml_rpc_server.stop()
+        recorder.close()
+
+    assert central.get_generic_data_point("VCU2128127:4", "STATE").value is True
+    records = read_capture(file_path=recorder.file_path)
+    assert [(record["kind"], record["method"]) for record in records if record["method"] != "system.listMethods"] == [
+        ("event", "event"),
+        ("call", "event"),
+    ]
+    assert "event" in next(record["result"] for record in records if record["method"] == "system.listMethods")
+
+    replay = TrafficReplay(records=records, interface_id=const.INTERFACE_ID, speed=0)
+
+    async def _handler(method: str, interface_id: str, *args: Any) -> None:
+        await central.data_point_event(interface_id, *args)
+
+    await central.data_point_event(const.INTERFACE_ID, "VCU2128127:4", "STATE", False)
+    assert await replay.replay_events(interface_id=const.INTERFACE_ID, handler=_handler) == 1
+    assert central.get_generic_data_point("VCU2128127:4", "STATE").value is True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_profiler(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the sampling profiler of the central."""
+    central, _, _ = central_client_factory
+    assert central.config.profiler_duration is None
+    assert central.profiler.is_running is False
+    assert central.start_profiler(duration=0.05) is True
+    await asyncio.to_thread(central.profiler.stop)
+    assert central.profiler.file_path is not None
+    assert central.profiler.file_path.startswith(f"{central.config.storage_folder}/profile/{central.name}_")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_startup_timeline(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the timeline of the startup."""
+    central, _, _ = central_client_factory
+    timeline = central.startup_timeline
+    assert timeline.is_recording is False
+    assert timeline.duration is not None
+    phases = {(phase.name, phase.interface_id): phase for phase in timeline.phases}
+    assert ("identify_ip_addr", None) in phases
+    assert phases[("create_clients", None)].count == 1
+    assert ("create_client", const.INTERFACE_ID) in phases
+    assert phases[("list_devices", const.INTERFACE_ID)].count == 20
+    assert phases[("fetch_paramset_descriptions", const.INTERFACE_ID)].count == 20
+    assert phases[("create_devices", const.INTERFACE_ID)].count == 2
+    assert all(phase.duration <= timeline.duration for phase in timeline.phases)
+    assert timeline.as_dict()["phases"][0]["name"] == "identify_ip_addr"
+    assert str(timeline).startswith(f"{central.name} started in ")
+
+    # phases after the startup are not recorded
+    await central.add_new_devices(interface_id=const.INTERFACE_ID, device_descriptions=())
+    with timeline.phase(name="late") as phase:
+        phase.count = 1
+    assert len(timeline.phases) == len(phases)
+
+
+@pytest.mark.asyncio
+async def test_startup_timeline_new_devices(factory: helper.Factory) -> None:
+    """Test the timeline of a startup, where the backend sends the devices by newDevices."""
+    central, client = await factory.get_default_central(TEST_DEVICES, start_direct=False)
+    try:
+        timeline = central.startup_timeline
+        assert timeline.is_recording is True
+        assert timeline.duration is None
+        assert timeline.pending_interface_ids == (const.INTERFACE_ID,)
+
+        await central.add_new_devices(
+            interface_id=const.INTERFACE_ID, device_descriptions=tuple(await client.list_devices())
+        )
+        assert timeline.is_recording is False
+        assert timeline.duration is not None
+        assert timeline.pending_interface_ids == ()
+        phases = {(phase.name, phase.interface_id): phase for phase in timeline.phases}
+        assert ("init_client", const.INTERFACE_ID) in phases
+        assert phases[("fetch_paramset_descriptions", const.INTERFACE_ID)].count == 20
+        assert ("save_caches", const.INTERFACE_ID) in phases
+        assert phases[("create_devices", const.INTERFACE_ID)].count == 2
+        assert all(phase.duration <= timeline.duration for phase in timeline.phases)
+    finally:
+        await central.stop()
+        await central.clear_caches()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_memory_report(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the memory report of the central."""
+    central, _, _ = central_client_factory
+    # the memory report is not sampled by the scheduler by default
+    assert central.config.enable_memory_report is False
+    assert not any(job._task == central._scheduler._update_memory_report for job in central._scheduler._scheduler_jobs)
+    # the collector only publishes the gauges, that are updated by the scheduler
+    with patch("hahomematic.central.create_memory_report") as mock_create_memory_report:
+        assert 'memory_bytes{subsystem="devices"}' not in central.metrics.snapshot()["gauges"]
+        mock_create_memory_report.assert_not_called()
+    await central._scheduler._update_memory_report()
+    assert central.metrics.snapshot()["gauges"]['memory_bytes{subsystem="devices"}'] > 0
+
+    report = central.memory_report()
+    assert set(report.subsystems) == {
+        "callbacks",
+        "data_cache",
+        "data_points",
+        "device_descriptions",
+        "device_details",
+        "device_value_caches",
+        "devices",
+        "paramset_descriptions",
+        "parameter_visibility",
+    }
+    assert report.subsystems["device_descriptions"] > 0
+    assert report.subsystems["paramset_descriptions"] > 0
+    assert report.subsystems["devices"] > 0
+    assert report.total == sum(report.subsystems.values())
+    count, size = report.data_points["DpSwitch"]
+    assert count > 0
+    assert size > 0
+    assert report.subsystems["data_points"] == sum(size for _, size in report.data_points.values())
+    assert report.as_dict()["data_points"]["DpSwitch"] == {"count": count, "bytes": size}
+
+    gauges = central.metrics.snapshot()["gauges"]
+    assert gauges['memory_bytes{subsystem="device_descriptions"}'] == report.subsystems["device_descriptions"]
+    assert gauges['data_points{class="DpSwitch"}'] == count
+
+    # the model is not counted twice
+    estimator = DeepSizeEstimator(boundary_types=(Device,))
+    device = next(iter(central.devices))
+    assert estimator.get_size([device]) < estimator.get_size(device)
+
+
+@pytest.mark.asyncio
+async def test_lazy_device_error_events(factory: helper.Factory) -> None:
+    """Test the lazy creation of device error events."""
+    central, _ = await factory.get_default_central(
+        {"VCU0000098": "HM-DW-WM.json"},
+        lazy_device_error_events=True,
+    )
+    try:
+        assert central.config.lazy_device_error_events is True
+        device = central.get_device("VCU0000098")
+        assert device
+        channel = device.get_channel("VCU0000098:1")
+        assert not channel.generic_events
+        await central.data_point_event(const.INTERFACE_ID, "VCU0000098:1", "ERROR_OVERHEAT", True)
+        event = central.get_event(channel_address="VCU0000098:1", parameter="ERROR_OVERHEAT")
+        assert event
+        assert event in channel.generic_events
+        assert central.get_event(channel_address="VCU0000098:1", parameter="ERROR_OVERHEAT") is event
+
+        # the requested device error events are created
+        assert channel.lazy_events
+        error_events = [event for events in central.get_events(event_type=EventType.DEVICE_ERROR) for event in events]
+        assert event in error_events
+        assert len(error_events) > 1
+        assert not channel.lazy_events
+        # events are not data points, like in eager mode
+        assert not any(isinstance(dp, GenericEvent) for dp in central.get_data_points(exclude_no_create=False))
+        assert not central.get_data_points(category=DataPointCategory.EVENT, exclude_no_create=False)
+
+        central.remove_device(device)
+        assert not central.get_data_points(exclude_no_create=False)
+    finally:
+        await central.stop()
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     (
@@ -542,6 +1239,46 @@ async def test_hub_data_points_by_category(
     assert len(ebp_sensor4) == 1
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        ({}, True, True, True, None, None),
+    ],
+)
+async def test_hub_data_point_indexes(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the legacy_name and category indexes of the hub data points."""
+    central, _, _ = central_client_factory
+    sysvar = central.get_sysvar_data_point(vid="1")
+    assert sysvar
+    assert central.get_sysvar_data_point(legacy_name="alarm") is sysvar
+    program = central.get_program_data_point(pid="pid1")
+    assert program
+    assert central.get_program_data_point(legacy_name="p1") is program
+    assert sysvar in central.get_hub_data_points(category=sysvar.category)
+    assert program.button in central.get_hub_data_points(category=DataPointCategory.HUB_BUTTON)
+    assert program.switch in central.get_hub_data_points(category=DataPointCategory.HUB_SWITCH)
+    assert central.get_hub_data_points(category=DataPointCategory.SENSOR) == ()
+
+    central.remove_sysvar_data_point(vid="1")
+    assert central.get_sysvar_data_point(legacy_name="alarm") is None
+    assert sysvar not in central.get_hub_data_points(category=sysvar.category)
+
+    central.remove_program_button(pid="pid1")
+    assert central.get_program_data_point(legacy_name="p1") is None
+    assert program.button not in central.get_hub_data_points(category=DataPointCategory.HUB_BUTTON)
+    assert len(central.get_hub_data_points(category=DataPointCategory.HUB_BUTTON)) == 1
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     (
@@ -735,21 +1472,21 @@ async def test_central_services(
     await central.fetch_sysvar_data(scheduled=True)
     assert mock_client.method_calls[-1] == call.get_all_system_variables(markers=())
 
-    assert len(mock_client.method_calls) == 42
+    assert len(mock_client.method_calls) == 44
     await central.load_and_refresh_data_point_data(interface=Interface.BIDCOS_RF, paramset_key=ParamsetKey.MASTER)
-    assert len(mock_client.method_calls) == 42
+    assert len(mock_client.method_calls) == 44
     await central.load_and_refresh_data_point_data(interface=Interface.BIDCOS_RF, paramset_key=ParamsetKey.VALUES)
-    assert len(mock_client.method_calls) == 60
+    assert len(mock_client.method_calls) == 62
 
     await central.get_system_variable(legacy_name="SysVar_Name")
     assert mock_client.method_calls[-1] == call.get_system_variable("SysVar_Name")
 
-    assert len(mock_client.method_calls) == 61
+    assert len(mock_client.method_calls) == 63
     await central.set_system_variable(legacy_name="alarm", value=True)
     assert mock_client.method_calls[-1] == call.set_system_variable(legacy_name="alarm", value=True)
-    assert len(mock_client.method_calls) == 62
+    assert len(mock_client.method_calls) == 64
     await central.set_system_variable(legacy_name="SysVar_Name", value=True)
-    assert len(mock_client.method_calls) == 62
+    assert len(mock_client.method_calls) == 64
 
     await central.get_client(interface_id=const.INTERFACE_ID).set_value(
         channel_address="123",
@@ -763,7 +1500,7 @@ async def test_central_services(
         parameter="LEVEL",
         value=1.0,
     )
-    assert len(mock_client.method_calls) == 63
+    assert len(mock_client.method_calls) == 65
 
     with pytest.raises(HaHomematicException):
         await central.get_client(interface_id="NOT_A_VALID_INTERFACE_ID").set_value(
@@ -772,7 +1509,7 @@ async def test_central_services(
             parameter="LEVEL",
             value=1.0,
         )
-    assert len(mock_client.method_calls) == 63
+    assert len(mock_client.method_calls) == 65
 
     await central.get_client(interface_id=const.INTERFACE_ID).put_paramset(
         channel_address="123",
@@ -782,14 +1519,14 @@ async def test_central_services(
     assert mock_client.method_calls[-1] == call.put_paramset(
         channel_address="123", paramset_key="VALUES", values={"LEVEL": 1.0}
     )
-    assert len(mock_client.method_calls) == 64
+    assert len(mock_client.method_calls) == 66
     with pytest.raises(HaHomematicException):
         await central.get_client(interface_id="NOT_A_VALID_INTERFACE_ID").put_paramset(
             channel_address="123",
             paramset_key=ParamsetKey.VALUES,
             values={"LEVEL": 1.0},
         )
-    assert len(mock_client.method_calls) == 64
+    assert len(mock_client.method_calls) == 66
 
     assert (
         central.get_generic_data_point(channel_address="VCU6354483:0", parameter="DUTY_CYCLE").parameter == "DUTY_CYCLE"
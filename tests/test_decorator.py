@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 from hahomematic.model.decorators import (
+    _PUBLIC_ATTRIBUTE_GETTERS,
     config_property,
     get_public_attributes_for_config_property,
     get_public_attributes_for_state_property,
     state_property,
 )
+from hahomematic.model.support import PayloadMixin
 
 # pylint: disable=protected-access
 
@@ -34,6 +36,21 @@ def test_generic_property_read() -> None:
     assert config_attributes == {"config": "test_config"}
     value_attributes = get_public_attributes_for_state_property(data_object=test_class)
     assert value_attributes == {"value": "test_value"}
+    assert (PropertyTestClazz, config_property) in _PUBLIC_ATTRIBUTE_GETTERS
+    assert (PropertyTestClazz, state_property) in _PUBLIC_ATTRIBUTE_GETTERS
+
+
+def test_payload_cache() -> None:
+    """Test the cached config payload."""
+    test_class = PayloadTestClazz()
+    assert test_class.config_payload == {"config": "test_config"}
+    assert test_class.state_payload == {"value": "test_value"}
+    test_class.value = "new_value"
+    test_class.config = "new_config"
+    assert test_class.state_payload == {"value": "new_value"}
+    assert test_class.config_payload == {"config": "test_config"}
+    test_class._invalidate_config_payload()
+    assert test_class.config_payload == {"config": "new_config"}
 
 
 class PropertyTestClazz:
@@ -73,3 +90,12 @@ class PropertyTestClazz:
     def config(self) -> None:
         """Delete config."""
         self._config = ""
+
+
+class PayloadTestClazz(PropertyTestClazz, PayloadMixin):
+    """test class for payloads."""
+
+    def __init__(self):
+        """Init PayloadTestClazz."""
+        PropertyTestClazz.__init__(self)
+        PayloadMixin.__init__(self)
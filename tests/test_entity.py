@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+from datetime import datetime, timedelta
 from typing import cast
-from unittest.mock import MagicMock, Mock, call
+from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
 
 from hahomematic.caches.visibility import check_ignore_parameters_is_clean
 from hahomematic.central import CentralUnit
+from hahomematic.central.memory import DeepSizeEstimator
 from hahomematic.client import Client
-from hahomematic.const import CallSource, DataPointUsage
+from hahomematic.clock import ManualClock
+from hahomematic.const import INIT_MONOTONIC, NO_CACHE_ENTRY, CallSource, DataPointUsage
 from hahomematic.model.custom import CustomDpSwitch, get_required_parameters, validate_custom_data_point_definition
-from hahomematic.model.generic import DpSensor, DpSwitch
+from hahomematic.model.data_point import CallbackDataPoint
+from hahomematic.model.device import Channel, Device
+from hahomematic.model.event import GenericEvent
+from hahomematic.model.generic import DpSensor, DpSwitch, GenericDataPoint
 
 from tests import const, helper
 
@@ -75,6 +82,61 @@ async def test_custom_data_point_callback(
     device_removed_mock.assert_called_with()
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_coalesced_data_point_callback(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test coalesced data point updated callbacks."""
+    central, _, _ = central_client_factory
+    climate = helper.get_prepared_custom_data_point(central, "VCU3609622", 1)
+    assert climate
+
+    coalesced_mock = MagicMock()
+    direct_mock = MagicMock()
+    unregister_coalesced_callback = climate.register_data_point_updated_callback(
+        cb=coalesced_mock, custom_id="some_id", coalesce=True
+    )
+    climate.register_internal_data_point_updated_callback(cb=direct_mock)
+
+    parameters = ("SET_POINT_TEMPERATURE", "ACTUAL_TEMPERATURE", "HUMIDITY", "LEVEL")
+    for parameter in parameters:
+        await central.data_point_event(const.INTERFACE_ID, "VCU3609622:1", parameter, 21.0)
+    assert coalesced_mock.call_count == 0
+    await asyncio.sleep(0)
+    changed_fields = {field.value for field, dp in climate._data_points.items() if dp.parameter in parameters}
+    assert changed_fields
+    coalesced_mock.assert_called_once_with(data_point=climate, changed_fields=frozenset(changed_fields))
+    assert direct_mock.call_count == len([dp for dp in climate._data_points.values() if dp.parameter in parameters])
+
+    # generic data points report their parameter
+    level = central.get_generic_data_point("VCU3609622:1", "LEVEL")
+    level_mock = MagicMock()
+    level.register_data_point_updated_callback(cb=level_mock, custom_id="other_id", coalesce=True)
+    await central.data_point_event(const.INTERFACE_ID, "VCU3609622:1", "LEVEL", 0.5)
+    await central.data_point_event(const.INTERFACE_ID, "VCU3609622:1", "LEVEL", 0.6)
+    await asyncio.sleep(0)
+    level_mock.assert_called_once_with(data_point=level, changed_fields=frozenset({"LEVEL"}))
+
+    unregister_coalesced_callback()
+    coalesced_mock.reset_mock()
+    await central.data_point_event(const.INTERFACE_ID, "VCU3609622:1", "LEVEL", 0.7)
+    await asyncio.sleep(0)
+    coalesced_mock.assert_not_called()
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     (
@@ -209,6 +271,162 @@ async def test_generic_wrapped_data_point(
     assert wrapped_data_point.usage == DataPointUsage.DATA_POINT
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_data_point_memory_layout(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the compact memory layout of generic data points and events."""
+    central, _, _ = central_client_factory
+    event1 = central.get_event("VCU2128127:1", "PRESS_SHORT")
+    event2 = central.get_event("VCU2128127:2", "PRESS_SHORT")
+    assert event1 and event2
+    assert event1._parameter_metadata is event2._parameter_metadata
+    assert event1._data_point_updated_callbacks is None
+    assert event1._device_removed_callbacks is None
+
+    data_points: list[GenericDataPoint | GenericEvent] = [
+        dp for dp in central.get_data_points(exclude_no_create=False) if isinstance(dp, GenericDataPoint)
+    ]
+    for device in central.devices:
+        data_points.extend(device.generic_events)
+    assert data_points
+    assert not any(hasattr(dp, "__dict__") for dp in data_points)
+
+    # The deep size excludes the objects of the model, that are referenced by the data points.
+    # Shared objects like the parameter metadata are counted once.
+    estimator = DeepSizeEstimator(
+        sample_size=len(data_points), boundary_types=(CentralUnit, Client, Device, Channel, CallbackDataPoint)
+    )
+    instance_size = sum(estimator.get_size(dp) for dp in data_points) / len(data_points)
+    print(f"Per instance memory of {len(data_points)} generic data points and events: {instance_size:.0f} bytes")  # noqa: T201
+    assert instance_size < 1500, f"Per instance memory of generic data points and events: {instance_size} bytes"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_data_point_timestamps(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the timestamps of data points based on the central clock."""
+    central, _, _ = central_client_factory
+    start = datetime(2025, 1, 1, 12, 0, 0)
+    clock = ManualClock(start=start)
+    with patch.object(central, "_clock", clock):
+        data_point = central.get_generic_data_point("VCU2128127:7", "POWER")
+        assert data_point
+
+        await central.data_point_event(const.INTERFACE_ID, "VCU2128127:7", "POWER", 123.4)
+        assert data_point.value == 123.4
+        assert data_point.modified_at == start
+        assert data_point.refreshed_at == start
+        assert data_point.is_valid is True
+
+        clock.advance(5)
+        await central.data_point_event(const.INTERFACE_ID, "VCU2128127:7", "POWER", 123.4)
+        assert data_point.modified_at == start
+        assert data_point.refreshed_at == start + timedelta(seconds=5)
+        assert central.get_last_event_dt(interface_id=const.INTERFACE_ID) == start + timedelta(seconds=5)
+        assert central.get_seconds_since_last_event(interface_id=const.INTERFACE_ID) == 0
+
+        clock.advance(5)
+        assert central.get_seconds_since_last_event(interface_id=const.INTERFACE_ID) == 5
+        with clock.event_time() as event_time:
+            clock.advance(5)
+            assert clock.monotonic() == event_time
+            data_point.write_value(value=234.5)
+        assert data_point.modified_at == start + timedelta(seconds=10)
+        assert clock.now() == start + timedelta(seconds=15)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_custom_data_point_aggregates(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the aggregated state of custom data points."""
+    central, _, _ = central_client_factory
+    start = datetime(2025, 1, 1, 12, 0, 0)
+    clock = ManualClock(start=start)
+    with patch.object(central, "_clock", clock):
+        switch = helper.get_prepared_custom_data_point(central, "VCU2128127", 4)
+        assert switch
+        readable_dps = [dp for dp in switch._data_points.values() if dp.is_readable]
+        assert switch._readable_data_points == tuple(readable_dps)
+        assert switch.is_valid is all(dp.is_valid for dp in readable_dps)
+        assert switch.state_uncertain is False
+
+        # the reset of the temporary value of a data point, that is not refreshed, updates the aggregates
+        state = central.get_generic_data_point("VCU2128127:4", "STATE")
+        modified_at = switch.modified_at
+        clock.advance(1)
+        state.write_temporary_value(value=True)
+        assert switch.modified_at > modified_at
+        state._refreshed_at = INIT_MONOTONIC
+        state.write_value(value=NO_CACHE_ENTRY)
+        assert switch.modified_at == modified_at
+        assert switch.state_uncertain is state.state_uncertain
+
+        for dp in readable_dps:
+            clock.advance(1)
+            dp.write_value(value=dp.value)
+        assert switch.is_valid is True
+        assert switch.modified_at == max(dp.modified_at for dp in readable_dps)
+        assert switch.refreshed_at == start + timedelta(seconds=1 + len(readable_dps))
+
+        clock.advance(10)
+        state.write_temporary_value(value=not state.value)
+        assert switch.state_uncertain is True
+        assert switch.modified_at == start + timedelta(seconds=1 + len(readable_dps) + 10)
+
+        # resetting the temporary value decreases the timestamps again
+        state.write_value(value=NO_CACHE_ENTRY)
+        assert switch.state_uncertain is True
+        assert switch.refreshed_at == max(dp.refreshed_at for dp in readable_dps)
+        assert switch.refreshed_at == start + timedelta(seconds=1 + len(readable_dps))
+
+        clock.advance(1)
+        await central.data_point_event(const.INTERFACE_ID, "VCU2128127:4", "STATE", 1)
+        assert switch.state_uncertain is False
+        assert switch.refreshed_at == start + timedelta(seconds=1 + len(readable_dps) + 11)
+
+
 def test_custom_required_data_points() -> None:
     """Test required parameters from data_point definitions."""
     required_parameters = get_required_parameters()
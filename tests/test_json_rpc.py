@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
 
 import orjson
 import pytest
 
+from hahomematic.capture import TrafficRecorder, read_capture
+from hahomematic.central import CentralConnectionState
+from hahomematic.client.json_rpc import JsonRpcAioHttpClient, _JsonKey, _JsonRpcMethod, _ScriptTemplate
+from hahomematic.const import MAX_CONCURRENT_HTTP_SESSIONS
 from hahomematic.support import cleanup_text_from_html_tags
 
 SUCCESS = '{"HmIP-RF.0001D3C99C3C93%3A0.CONFIG_PENDING":false,\r\n"VirtualDevices.INT0000001%3A1.SET_POINT_TEMPERATURE":4.500000,\r\n"VirtualDevices.INT0000001%3A1.SWITCH_POINT_OCCURED":false,\r\n"VirtualDevices.INT0000001%3A1.VALVE_STATE":4,\r\n"VirtualDevices.INT0000001%3A1.WINDOW_STATE":0,\r\n"HmIP-RF.001F9A49942EC2%3A0.CARRIER_SENSE_LEVEL":10.000000,\r\n"HmIP-RF.0003D7098F5176%3A0.UNREACH":false,\r\n"BidCos-RF.OEQ1860891%3A0.UNREACH":true,\r\n"BidCos-RF.OEQ1860891%3A0.STICKY_UNREACH":true,\r\n"BidCos-RF.OEQ1860891%3A1.INHIBIT":false,\r\n"HmIP-RF.000A570998B3FB%3A0.CONFIG_PENDING":false,\r\n"HmIP-RF.000A570998B3FB%3A0.UPDATE_PENDING":false,\r\n"HmIP-RF.000A5A4991BDDC%3A0.CONFIG_PENDING":false,\r\n"HmIP-RF.000A5A4991BDDC%3A0.UPDATE_PENDING":false,\r\n"BidCos-RF.NEQ1636407%3A1.STATE":0,\r\n"BidCos-RF.NEQ1636407%3A2.STATE":false,\r\n"BidCos-RF.NEQ1636407%3A2.INHIBIT":false,\r\n"CUxD.CUX2800001%3A12.TS":"0"}'
@@ -51,3 +58,232 @@ def test_defect_json() -> None:
 def test_cleanup_html_tags(test_tag: str, expected_result: str) -> None:
     """Test cleanup html tags."""
     assert cleanup_text_from_html_tags(text=test_tag) == expected_result
+
+
+def test_script_template() -> None:
+    """Test the rendering of script templates."""
+    template = _ScriptTemplate(script='string p_id = "##id##";\ninteger p_state = ##state##;\n')
+    assert template.render() == 'string p_id = "##id##";\ninteger p_state = ##state##;\n'
+    assert template.render(variables={"id": "1234", "state": "1"}) == 'string p_id = "1234";\ninteger p_state = 1;\n'
+    assert template.render(variables={"id": "1234"}) == 'string p_id = "1234";\ninteger p_state = ##state##;\n'
+    assert _ScriptTemplate(script="no variables").render(variables={"id": "1234"}) == "no variables"
+
+
+@pytest.mark.asyncio
+async def test_json_rpc_concurrency_limits() -> None:
+    """Test the per method concurrency limits of the json rpc client."""
+    json_rpc_client = JsonRpcAioHttpClient(
+        username="user",
+        password="pass",
+        device_url="http://127.0.0.1",
+        connection_state=CentralConnectionState(),
+        client_session=None,
+        concurrency_limits={_JsonRpcMethod.REGA_RUN_SCRIPT: 1},
+    )
+    running = 0
+    max_running = 0
+
+    async def post(**kwargs: Any) -> Mock:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return Mock(status=200, json=AsyncMock(return_value={"error": None, "result": True}))
+
+    async def get_max_running(method: _JsonRpcMethod) -> int:
+        nonlocal max_running
+        max_running = 0
+        await asyncio.gather(*(json_rpc_client._do_post(session_id=False, method=method) for _ in range(5)))
+        return max_running
+
+    with patch.object(json_rpc_client._client_session, "post", side_effect=post):
+        assert await get_max_running(method=_JsonRpcMethod.REGA_RUN_SCRIPT) == 1
+        assert await get_max_running(method=_JsonRpcMethod.INTERFACE_GET_VALUE) == MAX_CONCURRENT_HTTP_SESSIONS
+        assert await get_max_running(method=_JsonRpcMethod.SYSVAR_GET_ALL) == 5
+    assert json_rpc_client.method_latencies[_JsonRpcMethod.SYSVAR_GET_ALL].count == 5
+    await json_rpc_client.stop()
+
+
+@pytest.mark.asyncio
+async def test_json_rpc_capture_without_credentials(tmp_path: Any) -> None:
+    """Test that credentials and session ids are not written to a traffic capture."""
+    recorder = TrafficRecorder(storage_folder=str(tmp_path), central_name="capture", enabled=True)
+    json_rpc_client = JsonRpcAioHttpClient(
+        username="secret-user",
+        password="secret-password",
+        device_url="http://127.0.0.1",
+        connection_state=CentralConnectionState(),
+        client_session=None,
+        recorder=recorder,
+    )
+    responses = [
+        Mock(status=200, json=AsyncMock(return_value={"error": None, "result": result}))
+        for result in ("secret-session", "secret-session", True)
+    ]
+    with patch.object(json_rpc_client._client_session, "post", AsyncMock(side_effect=responses)):
+        await json_rpc_client._do_post(
+            session_id=False,
+            method=_JsonRpcMethod.SESSION_LOGIN,
+            extra_params={_JsonKey.USERNAME: "secret-user", _JsonKey.PASSWORD: "secret-password"},
+            use_default_params=False,
+        )
+        for method in (_JsonRpcMethod.SESSION_RENEW, _JsonRpcMethod.SESSION_LOGOUT):
+            await json_rpc_client._do_post(
+                session_id="secret-session",
+                method=method,
+                extra_params={_JsonKey.SESSION_ID: "secret-session"},
+                use_default_params=False,
+            )
+    await json_rpc_client.stop()
+    recorder.close()
+
+    records = read_capture(file_path=recorder.file_path)
+    assert [record["method"] for record in records] == [
+        _JsonRpcMethod.SESSION_LOGIN,
+        _JsonRpcMethod.SESSION_RENEW,
+        _JsonRpcMethod.SESSION_LOGOUT,
+    ]
+    assert all(record["args"] == [{}] for record in records)
+    with open(recorder.file_path, encoding="utf-8") as file_pointer:
+        assert "secret" not in file_pointer.read()
+
+
+@pytest.mark.asyncio
+async def test_json_rpc_session_renewal_cancelled_on_stop() -> None:
+    """Test that a scheduled session renewal is cancelled, when the client is stopped without logout."""
+    json_rpc_client = JsonRpcAioHttpClient(
+        username="user",
+        password="pass",
+        device_url="http://127.0.0.1",
+        connection_state=CentralConnectionState(),
+        client_session=None,
+    )
+    loop = asyncio.get_running_loop()
+    loop_call_later = loop.call_later
+    handles: list[asyncio.TimerHandle] = []
+
+    def call_later(*args: Any) -> asyncio.TimerHandle:
+        handles.append(handle := loop_call_later(*args))
+        return handle
+
+    with (
+        patch.object(json_rpc_client, "_do_login", AsyncMock(return_value="session_id")),
+        patch.object(loop, "call_later", side_effect=call_later),
+    ):
+        assert await json_rpc_client._login_or_renew() is True
+    assert len(handles) == 1
+    assert handles[0].cancelled() is False
+    await json_rpc_client.stop()
+    assert handles[0].cancelled() is True
+
+
+@pytest.mark.asyncio
+async def test_json_rpc_failed_login_not_refreshed() -> None:
+    """Test that a failed login neither marks the session as refreshed nor schedules a renewal."""
+    json_rpc_client = JsonRpcAioHttpClient(
+        username="user",
+        password="pass",
+        device_url="http://127.0.0.1",
+        connection_state=CentralConnectionState(),
+        client_session=None,
+    )
+    with patch.object(json_rpc_client, "_do_login", AsyncMock(return_value=None)):
+        assert await json_rpc_client._login_or_renew() is False
+    assert json_rpc_client._has_session_recently_refreshed is False
+    assert json_rpc_client._session_renew_handle is None
+    await json_rpc_client.stop()
+
+
+@pytest.mark.asyncio
+async def test_json_rpc_sysvar_descriptions_cached() -> None:
+    """Test that system variable descriptions are only fetched for changed definitions."""
+    json_rpc_client = JsonRpcAioHttpClient(
+        username="user",
+        password="pass",
+        device_url="http://127.0.0.1",
+        connection_state=CentralConnectionState(),
+        client_session=None,
+    )
+    sysvar = {
+        "id": "1234",
+        "name": "sv_float",
+        "isInternal": False,
+        "type": "NUMBER",
+        "value": "1.5",
+        "unit": "",
+    }
+    response = {"error": None, "result": [sysvar]}
+    with (
+        patch.object(json_rpc_client, "_post", AsyncMock(return_value=response)),
+        patch.object(
+            json_rpc_client, "_get_system_variable_descriptions", AsyncMock(return_value={"1234": "HAHM"})
+        ) as get_descriptions,
+    ):
+        variables = await json_rpc_client.get_all_system_variables(markers=())
+        assert variables[0].extended_sysvar is True
+        sysvar["value"] = "2.5"
+        variables = await json_rpc_client.get_all_system_variables(markers=())
+        assert variables[0].value == 2.5
+        assert get_descriptions.call_count == 1
+        sysvar["name"] = "sv_float_renamed"
+        await json_rpc_client.get_all_system_variables(markers=())
+        assert get_descriptions.call_count == 2
+    await json_rpc_client.stop()
+
+
+@pytest.mark.asyncio
+async def test_json_rpc_changed_system_variables() -> None:
+    """Test that only changed system variables are returned, until the descriptions change."""
+    json_rpc_client = JsonRpcAioHttpClient(
+        username="user",
+        password="pass",
+        device_url="http://127.0.0.1",
+        connection_state=CentralConnectionState(),
+        client_session=None,
+    )
+    sysvar = {
+        "id": "1234",
+        "name": "sv%20float",
+        "isInternal": False,
+        "type": "NUMBER",
+        "unit": "%B0C",
+        "minValue": "0.000000",
+        "maxValue": "30.000000",
+        "valueList": "",
+        "value": "1.500000",
+    }
+    descriptions = {"1234": "HAHM", "5678": ""}
+
+    def get_response(script_name: str, extra_params: dict[_JsonKey, Any]) -> dict[str, Any]:
+        return {
+            "error": None,
+            "result": {
+                "timestamp": 2000,
+                "descriptions": dict(descriptions),
+                "changed": [dict(sysvar)] if extra_params[_JsonKey.SINCE] < 2000 else [],
+            },
+        }
+
+    with patch.object(json_rpc_client, "_post_script", AsyncMock(side_effect=get_response)) as post_script:
+        changes = await json_rpc_client.get_changed_system_variables(markers=(), since=0)
+        assert changes.complete is True
+        assert changes.timestamp == 2000
+        assert changes.variables[0].legacy_name == "sv float"
+        assert changes.variables[0].unit == "°C"
+        assert changes.variables[0].value == 1.5
+        assert changes.variables[0].max_value == 30.0
+        assert changes.variables[0].extended_sysvar is True
+
+        changes = await json_rpc_client.get_changed_system_variables(markers=(), since=2000)
+        assert changes.complete is False
+        assert changes.variables == ()
+
+        # an edited description is picked up with the next refresh
+        descriptions["1234"] = "edited"
+        changes = await json_rpc_client.get_changed_system_variables(markers=(), since=2000)
+        assert changes.complete is True
+        assert changes.variables[0].description == "edited"
+        assert changes.variables[0].extended_sysvar is False
+        assert post_script.call_count == 4
+    await json_rpc_client.stop()
@@ -2,29 +2,44 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections import defaultdict
 from collections.abc import Callable
 from datetime import datetime, timedelta
+import logging
+import threading
+from time import monotonic, sleep
 from typing import Any, Final
 from unittest.mock import Mock, patch
 
+from aiohttp import ClientSession
 import pytest
 
-from hahomematic.central import CentralUnit
-from hahomematic.client import Client
+from hahomematic.async_support import Looper
+from hahomematic.caches.dynamic import CommandCache
+from hahomematic.capture import TrafficRecorder, TrafficReplay, read_capture
+from hahomematic.central import CentralConfig, CentralUnit
+from hahomematic.client import Client, InterfaceConfig, _ClientConfig
+from hahomematic.clock import Clock, ManualClock
 from hahomematic.const import (
     INIT_DATETIME,
+    INIT_MONOTONIC,
+    LOCAL_HOST,
     SCHEDULER_PROFILE_PATTERN,
     SCHEDULER_TIME_PATTERN,
     VIRTUAL_REMOTE_ADDRESSES,
+    CallSource,
     DataPointUsage,
+    Interface,
     ParameterData,
     ParameterType,
     ParamsetKey,
     SysvarType,
 )
 from hahomematic.converter import _COMBINED_PARAMETER_TO_HM_CONVERTER, convert_hm_level_to_cpv
-from hahomematic.exceptions import HaHomematicException
+from hahomematic.decorators import inspector, measure_execution_time
+from hahomematic.exceptions import ClientException, HaHomematicException
+from hahomematic.metrics import LatencyHistogram, MetricsExporter, MetricsRegistry
 from hahomematic.model.support import (
     _check_channel_name_with_channel_no,
     convert_value,
@@ -34,6 +49,7 @@ from hahomematic.model.support import (
     get_device_name,
     get_event_name,
 )
+from hahomematic.profiler import SamplingProfiler
 from hahomematic.support import (
     build_xml_rpc_headers,
     build_xml_rpc_uri,
@@ -51,6 +67,8 @@ from hahomematic.support import (
     parse_sys_var,
     to_bool,
 )
+from hahomematic_support.client_local import ClientLocal, LocalRessources
+from hahomematic_support.client_replay import ClientReplay
 
 from tests import helper
 
@@ -614,3 +632,407 @@ def test_default_dict() -> None:
     assert def_dict["k1"]["k2"][ParamsetKey.VALUES] == {"k4": ParameterData(ID="13")}
     def_dict["k1"]["k2"][ParamsetKey.VALUES] = {"k4.1": ParameterData(ID="14")}
     assert def_dict["k1"]["k2"][ParamsetKey.VALUES]["k4.1"] == ParameterData(ID="14")
+
+
+def test_command_cache() -> None:
+    """Test the command cache."""
+    command_cache = CommandCache(interface_id="test", max_size=2)
+    dpk_values = command_cache.add_set_value(channel_address="VCU0000001:1", parameter="STATE", value=True)
+    dpk, value = next(iter(dpk_values))
+    assert value is True
+    assert command_cache.size == 1
+    assert command_cache.get_last_value_send(dpk=dpk) is True
+    command_cache.remove_last_value_send(dpk=dpk, value=False)
+    assert command_cache.size == 1
+    command_cache.remove_last_value_send(dpk=dpk, value=True)
+    assert command_cache.size == 0
+    assert command_cache.get_last_value_send(dpk=dpk) is None
+
+    command_cache.add_put_paramset(
+        channel_address="VCU0000001:1", paramset_key=ParamsetKey.VALUES, values={"LEVEL": 0.5, "LEVEL_2": 0.2}
+    )
+    command_cache.add_set_value(channel_address="VCU0000001:2", parameter="STATE", value=True)
+    assert command_cache.size == 2
+    assert command_cache.evicted_count == 1
+
+    with patch("hahomematic.caches.dynamic.monotonic", return_value=monotonic() + 61):
+        assert command_cache.cleanup() == 2
+    assert command_cache.size == 0
+    assert command_cache.expired_count == 2
+
+    command_cache.add_set_value(channel_address="VCU0000001:2", parameter="STATE", value=True)
+    command_cache.clear()
+    assert command_cache.size == 0
+
+
+def test_latency_histogram() -> None:
+    """Test the latency histogram."""
+    histogram = LatencyHistogram()
+    assert histogram.count == 0
+    assert histogram.mean is None
+    assert histogram.quantile(0.5) is None
+    for value in (0.005, 0.02, 0.3, 0.4, 120.0):
+        histogram.observe(value)
+    assert histogram.count == 5
+    assert histogram.min == 0.005
+    assert histogram.max == 120.0
+    assert histogram.buckets[0.01] == 1
+    assert histogram.buckets[0.5] == 4
+    assert histogram.buckets[float("inf")] == 5
+    assert histogram.quantile(0.5) == 0.5
+    assert histogram.quantile(1.0) == 120.0
+    assert histogram.as_dict()["count"] == 5
+    histogram.reset()
+    assert histogram.count == 0
+
+
+@pytest.mark.asyncio
+async def test_metrics_registry() -> None:
+    """Test the metrics registry and the prometheus exporter."""
+    registry = MetricsRegistry()
+    registry.counter(name="calls_total", description="Calls", labels={"function": "a"}).inc()
+    registry.counter(name="calls_total", labels={"function": "a"}).inc(2)
+    registry.gauge(name="devices").set(5)
+    registry.histogram(name="duration_seconds", labels={"function": 'b"c'}).observe(0.2)
+    registry.register_collector(lambda metrics: metrics.gauge(name="collected").set(1))
+
+    snapshot = registry.snapshot()
+    assert snapshot["counters"] == {'calls_total{function="a"}': 3}
+    assert snapshot["gauges"] == {"devices": 5, "collected": 1}
+    assert snapshot["histograms"]['duration_seconds{function="b\\"c"}']["count"] == 1
+
+    prometheus = registry.to_prometheus()
+    assert "# HELP hahomematic_calls_total Calls\n# TYPE hahomematic_calls_total counter" in prometheus
+    assert 'hahomematic_calls_total{function="a"} 3\n' in prometheus
+    assert 'hahomematic_duration_seconds_bucket{function="b\\"c",le="0.25"} 1\n' in prometheus
+    assert 'hahomematic_duration_seconds_bucket{function="b\\"c",le="+Inf"} 1\n' in prometheus
+    assert 'hahomematic_duration_seconds_count{function="b\\"c"} 1\n' in prometheus
+
+    registry.reset()
+    assert registry.snapshot()["counters"] == {'calls_total{function="a"}': 0}
+
+    exporter = MetricsExporter(registry=registry, ip_addr="127.0.0.1", port=0)
+    await exporter.start()
+    try:
+        assert exporter.listen_port
+        async with (
+            ClientSession() as session,
+            session.get(f"http://127.0.0.1:{exporter.listen_port}/metrics") as response,
+        ):
+            assert response.status == 200
+            assert "hahomematic_devices 0" in await response.text()
+    finally:
+        await exporter.stop()
+    assert exporter.listen_port is None
+
+
+class _MeasuredObject:
+    """Object with measured methods."""
+
+    def __init__(self) -> None:
+        """Init the object."""
+        self.metrics = MetricsRegistry()
+
+    @inspector(measure_performance=True, re_raise=False)
+    async def measured(self, fail: bool = False) -> None:
+        """Measure a call."""
+        if fail:
+            raise HaHomematicException("failed")
+
+    @measure_execution_time
+    def measured_sync(self) -> None:
+        """Measure a sync call."""
+
+
+@pytest.mark.asyncio
+async def test_measure_performance() -> None:
+    """Test, that the execution time is measured per call."""
+    obj = _MeasuredObject()
+    with patch("hahomematic.decorators.monotonic", side_effect=[100.0, 100.5, 200.0, 202.0, 300.0, 300.1]):
+        await obj.measured()
+        await obj.measured(fail=True)
+        obj.measured_sync()
+    histogram = obj.metrics.histogram(name="execution_duration_seconds", labels={"function": "measured"})
+    assert histogram.count == 2
+    assert histogram.sum == 2.5
+    snapshot = obj.metrics.snapshot()
+    assert snapshot["counters"]['execution_errors_total{function="measured"}'] == 1
+    assert snapshot["counters"]['executions_total{function="measured_sync"}'] == 1
+
+
+@pytest.mark.asyncio
+async def test_looper_metrics() -> None:
+    """Test the instrumentation of the looper."""
+    metrics = MetricsRegistry()
+    looper = Looper(metrics=metrics)
+    looper.create_task(asyncio.sleep(0), name="event", name_args=("VCU0000001:1", "STATE"))
+    assert await looper.async_add_executor_job(lambda: 1, name="xmp_rpc_proxy") == 1
+    await looper.block_till_done()
+
+    looper.start_lag_sampling(interval=0.01)
+    await asyncio.sleep(0.05)
+    looper.stop_lag_sampling()
+
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"]['tasks_created_total{prefix="event"}'] == 1
+    assert snapshot["counters"]['tasks_created_total{prefix="xmp_rpc_proxy"}'] == 1
+    assert snapshot["gauges"]['tasks_in_flight{prefix="event"}'] == 0
+    assert snapshot["gauges"]['executor_queue_depth{prefix="xmp_rpc_proxy"}'] == 0
+    assert snapshot["histograms"]['task_start_delay_seconds{prefix="event"}']["count"] == 1
+    assert snapshot["histograms"]['task_start_delay_seconds{prefix="xmp_rpc_proxy"}']["count"] == 1
+    assert snapshot["histograms"]["event_loop_lag_seconds"]["count"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_looper_task_limits() -> None:
+    """Test the limits and the merging of looper tasks."""
+    metrics = MetricsRegistry()
+    looper = Looper(metrics=metrics, task_limits={"event": 2})
+    results: list[int] = []
+    release = asyncio.Event()
+
+    async def handle(value: int) -> None:
+        await release.wait()
+        results.append(value)
+
+    for value in range(5):
+        looper.create_task(handle(value), name="event", name_args=("VCU0000001:1", "STATE"))
+    # tasks created in the loop are tracked at once
+    assert len(looper._tasks) == 2
+    release.set()
+    await looper.block_till_done()
+    assert results == [0, 1]
+    looper.create_task(handle(5), name="event", name_args=("VCU0000001:1", "STATE"))
+    await looper.block_till_done()
+    assert results == [0, 1, 5]
+
+    results.clear()
+    for value in range(5):
+        looper.create_task(handle(value), name="sysvar-data-point-event", name_args=("sv",), merge=True)
+    looper.create_task(handle(10), name="sysvar-data-point-event", name_args=("other",), merge=True)
+    await looper.block_till_done()
+    assert results == [4, 10]
+    looper.create_task(handle(6), name="sysvar-data-point-event", name_args=("sv",), merge=True)
+    await looper.block_till_done()
+    assert results == [4, 10, 6]
+
+    # merged tasks, that are cancelled before they are started, are not merged into
+    looper.create_task(handle(7), name="sysvar-data-point-event", name_args=("sv",), merge=True)
+    looper.cancel_tasks()
+    await looper.block_till_done()
+    looper.create_task(handle(8), name="sysvar-data-point-event", name_args=("sv",), merge=True)
+    await looper.block_till_done()
+    assert results == [4, 10, 6, 8]
+
+    counters = metrics.snapshot()["counters"]
+    assert counters['tasks_dropped_total{prefix="event"}'] == 3
+    assert counters['tasks_merged_total{prefix="sysvar-data-point-event"}'] == 4
+
+
+@pytest.mark.asyncio
+async def test_looper_task_names(caplog: pytest.LogCaptureFixture) -> None:
+    """Test, that the variable parts of task names are only used with debug logging."""
+    looper = Looper()
+
+    async def get_name() -> str:
+        return asyncio.current_task().get_name()  # type: ignore[union-attr]
+
+    with caplog.at_level(logging.INFO, logger="hahomematic.async_support"):
+        looper.create_task(get_name(), name="event", name_args=("VCU0000001:1", "STATE"))
+        task = next(iter(looper._tasks))
+        assert task.get_name() == "event"
+    with caplog.at_level(logging.DEBUG, logger="hahomematic.async_support"):
+        looper.create_task(get_name(), name="event", name_args=("VCU0000001:1", "STATE"))
+        assert "event-VCU0000001:1-STATE" in {task.get_name() for task in looper._tasks}
+    await looper.block_till_done()
+
+    # tasks are created from other threads
+    await asyncio.to_thread(looper.create_task, get_name(), name="event")
+    await looper.block_till_done()
+    assert not looper._tasks
+
+
+@pytest.mark.asyncio
+async def test_clock() -> None:
+    """Test the clock."""
+    clock = Clock()
+    assert clock.to_datetime(monotonic_time=INIT_MONOTONIC) == INIT_DATETIME
+    assert abs((clock.now() - datetime.now()).total_seconds()) < 1
+    assert clock.changed_within_seconds(monotonic_time=clock.monotonic() - 10, max_age=60) is True
+    assert clock.changed_within_seconds(monotonic_time=clock.monotonic() - 70, max_age=60) is False
+    assert clock.changed_within_seconds(monotonic_time=INIT_MONOTONIC, max_age=60) is False
+
+    # conversions are stable, also when the wall clock changes
+    monotonic_time = clock.monotonic()
+    wall_time = clock.to_wall_time(monotonic_time=monotonic_time)
+    with patch("hahomematic.clock.time.time", return_value=datetime.now().timestamp() + 3600):
+        assert clock.to_wall_time(monotonic_time=monotonic_time) == wall_time
+        assert clock.from_wall_time(wall_time=wall_time) == pytest.approx(monotonic_time)
+
+    clock = ManualClock(start=datetime(2025, 1, 1))
+    with clock.event_time() as event_time:
+        clock.advance(10)
+        assert clock.monotonic() == event_time
+        # tasks, that are created while processing an event, use the current time
+        assert await asyncio.create_task(_get_monotonic(clock=clock)) == event_time + 10
+    assert clock.monotonic() == event_time + 10
+    assert clock.now() == datetime(2025, 1, 1, 0, 0, 10)
+
+
+@pytest.mark.asyncio
+async def test_traffic_capture(tmp_path: Any) -> None:
+    """Test the capture and replay of backend traffic."""
+    recorder = TrafficRecorder(storage_folder=str(tmp_path), central_name="capture", enabled=False)
+    recorder.record_event(interface_id="capture-BidCos-RF", method="event", args=("capture-BidCos-RF",))
+    recorder.close()
+    assert not (tmp_path / "capture").exists()
+
+    recorder = TrafficRecorder(storage_folder=str(tmp_path), central_name="capture", enabled=True)
+    interface_id = "capture-BidCos-RF"
+    recorder.record_call(interface_id=interface_id, method="getValue", args=("VCU1:1", "STATE"), duration=0.1, result=1)
+    recorder.record_call(interface_id=interface_id, method="getValue", args=("VCU1:1", "STATE"), duration=0.1, result=0)
+    recorder.record_call(
+        interface_id=interface_id, method="ping", args=("x",), duration=0.1, error=OSError("Connection refused")
+    )
+    recorder.record_call(interface_id="other-HmIP-RF", method="listDevices", args=(), duration=0.1, result=[])
+    recorder.record_event(interface_id=interface_id, method="event", args=(interface_id, "VCU1:1", "STATE", True))
+    recorder.record_event(interface_id=interface_id, method="event", args=(interface_id, "VCU1:1", "STATE", False))
+    recorder.close()
+    # an interrupted capture leaves an incomplete line
+    with open(recorder.file_path, mode="ab") as file_pointer:
+        file_pointer.write(b'{"kind":"ev')
+
+    records = read_capture(file_path=recorder.file_path)
+    assert len(records) == 6
+    assert records[0]["kind"] == "call"
+    assert records[2]["error"] == "Connection refused"
+
+    replay = TrafficReplay(records=records, interface_id=interface_id, speed=0)
+    assert replay.event_count == 2
+    assert await replay.call("getValue", "VCU1:1", "STATE") == 1
+    assert await replay.call("getValue", "VCU1:1", "STATE") == 0
+    # the last response is repeated
+    assert await replay.call("getValue", "VCU1:1", "STATE") == 0
+    assert await replay.call("listDevices") is None
+    with pytest.raises(ClientException):
+        await replay.call("ping", "x")
+
+    callbacks: list[tuple[Any, ...]] = []
+
+    async def _handler(*args: Any) -> None:
+        callbacks.append(args)
+
+    assert await replay.replay_events(interface_id="replay-BidCos-RF", handler=_handler) == 2
+    assert callbacks == [
+        ("event", "replay-BidCos-RF", "VCU1:1", "STATE", True),
+        ("event", "replay-BidCos-RF", "VCU1:1", "STATE", False),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_client_replay(tmp_path: Any) -> None:
+    """Test the replay of a captured startup by the replay client."""
+    interface_config = InterfaceConfig(central_name="replay", interface=Interface.BIDCOS_RF, port=2002)
+    central = CentralConfig(
+        name="replay",
+        host=LOCAL_HOST,
+        username="replay",
+        password="replay",
+        central_id="replay",
+        storage_folder=str(tmp_path),
+        interface_configs={interface_config},
+        default_callback_port=54321,
+        start_direct=True,
+    ).create_central()
+    interface_id = interface_config.interface_id
+
+    # capture the responses of a backend
+    local_client = ClientLocal(
+        client_config=_ClientConfig(central=central, interface_config=interface_config),
+        local_resources=LocalRessources(
+            address_device_translation={"VCU2128127": "HmIP-BSM.json"}, ignore_devices_on_create=[]
+        ),
+    )
+    recorder = TrafficRecorder(storage_folder=str(tmp_path), central_name="replay", enabled=True)
+    device_descriptions = await local_client.list_devices()
+    assert device_descriptions
+    recorder.record_call(
+        interface_id=interface_id, method="listDevices", args=(), duration=0.0, result=device_descriptions
+    )
+    for device_description in device_descriptions:
+        for paramset_key in device_description["PARAMSETS"]:
+            recorder.record_call(
+                interface_id=interface_id,
+                method="getParamsetDescription",
+                args=(device_description["ADDRESS"], paramset_key),
+                duration=0.0,
+                result=await local_client._get_paramset_description(
+                    address=device_description["ADDRESS"], paramset_key=ParamsetKey(paramset_key)
+                ),
+            )
+    recorder.record_call(
+        interface_id=interface_id, method="getValue", args=("VCU2128127:4", "STATE"), duration=0.0, result=True
+    )
+    recorder.record_event(
+        interface_id=interface_id, method="event", args=(interface_id, "VCU2128127:4", "STATE", False)
+    )
+    recorder.close()
+
+    replay = TrafficReplay(records=read_capture(file_path=recorder.file_path), interface_id=interface_id, speed=0)
+    client = ClientReplay(
+        client_config=_ClientConfig(central=central, interface_config=interface_config), replay=replay
+    )
+    await client.init_client()
+    with (
+        patch("hahomematic.central.CentralUnit._get_primary_client", return_value=client),
+        patch("hahomematic.client._ClientConfig.create_client", return_value=client),
+        patch("hahomematic.central.CentralUnit._identify_ip_addr", return_value=LOCAL_HOST),
+    ):
+        await central.start()
+    try:
+        assert central.get_device("VCU2128127")
+        state = central.get_generic_data_point("VCU2128127:4", "STATE")
+        assert state
+        await state.load_data_point_value(call_source=CallSource.MANUAL_OR_SCHEDULED, direct_call=True)
+        assert state.value is True
+        assert await client.replay_events() == 1
+        assert state.value is False
+    finally:
+        await central.stop()
+
+
+def test_sampling_profiler(tmp_path: Any) -> None:
+    """Test the sampling profiler."""
+    profiler = SamplingProfiler(storage_folder=str(tmp_path), name="profiled", interval=0.001)
+    stop_event = threading.Event()
+
+    def _busy() -> None:
+        while not stop_event.is_set():
+            is_channel_address(address="VCU0000001:1")
+
+    worker = threading.Thread(target=_busy, name="busy")
+    worker.start()
+    try:
+        assert profiler.start(duration=10) is True
+        assert profiler.start(duration=10) is False
+        sleep(0.2)
+        profiler.stop()
+    finally:
+        stop_event.set()
+        worker.join()
+
+    assert profiler.is_running is False
+    assert profiler.file_path is not None
+    assert profiler.file_path.startswith(str(tmp_path / "profile" / "profiled_"))
+    with open(profiler.file_path, encoding="utf-8") as file_pointer:
+        lines = file_pointer.read().splitlines()
+    assert any(
+        line.startswith("busy;") and "hahomematic.support:is_channel_address" in line and int(line.split()[-1]) > 0
+        for line in lines
+    )
+    assert profiler.hotspots[0][0] == "support"
+
+
+async def _get_monotonic(clock: Clock) -> float:
+    """Return the monotonic time of the clock."""
+    return clock.monotonic()